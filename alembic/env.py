@@ -5,7 +5,7 @@ from sqlalchemy import engine_from_config, pool
 from dotenv import load_dotenv
 
 from app.database import Base
-from app.models import user, blog, store, product, article, prompt, stock_check_log, settings, setup_status
+from app.models import user, blog, store, product, article, prompt, stock_check_log, settings, setup_status, blog_counters
 
 load_dotenv()
 
@@ -0,0 +1,64 @@
+"""Added pg_trgm and full-text search indexes
+
+Revision ID: 202e2f37f2f3
+Revises: 3143d88e2d7e
+Create Date: 2026-10-16 10:12:31.418204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '202e2f37f2f3'
+down_revision: Union[str, None] = '3143d88e2d7e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRIGRAM_INDEXES = {
+    "products": ["name", "seo_keyword"],
+    "articles": ["title", "slug", "status"],
+    "stores": ["name", "base_url"],
+    "prompts": ["name", "type", "subtype"],
+}
+
+
+def upgrade() -> None:
+    # Search indexes are PostgreSQL specific; other databases keep using plain ILIKE filtering.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, columns in TRIGRAM_INDEXES.items():
+        for column in columns:
+            op.create_index(
+                f"ix_{table}_{column}_trgm",
+                table,
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+
+    op.execute("""
+        ALTER TABLE prompts
+        ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('simple', coalesce(text, ''))) STORED
+    """)
+    op.create_index("ix_prompts_search_vector", "prompts", ["search_vector"], unique=False, postgresql_using="gin")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_prompts_search_vector", table_name="prompts")
+    op.drop_column("prompts", "search_vector")
+
+    for table, columns in TRIGRAM_INDEXES.items():
+        for column in columns:
+            op.drop_index(f"ix_{table}_{column}_trgm", table_name=table)
@@ -0,0 +1,52 @@
+"""Added composite and foreign key indexes for hot queries
+
+Revision ID: a205cbf802e8
+Revises: 202e2f37f2f3
+Create Date: 2026-10-16 11:02:47.903516
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a205cbf802e8'
+down_revision: Union[str, None] = '202e2f37f2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    # Per-blog predicates
+    ("ix_products_blog_id_in_stock", "products", ["blog_id", "in_stock"]),
+    ("ix_products_blog_id_last_checked", "products", ["blog_id", "last_checked"]),
+    ("ix_articles_blog_id_status", "articles", ["blog_id", "status"]),
+    ("ix_articles_blog_id_id", "articles", ["blog_id", "id"]),
+    ("ix_stock_check_logs_blog_id_check_time", "stock_check_logs", ["blog_id", "check_time"]),
+    ("ix_stores_blog_id", "stores", ["blog_id"]),
+    ("ix_prompts_blog_id", "prompts", ["blog_id"]),
+    # Child tables
+    ("ix_product_affiliate_urls_product_id", "product_affiliate_urls", ["product_id"]),
+    ("ix_product_specifications_product_id", "product_specifications", ["product_id"]),
+    ("ix_product_images_product_id", "product_images", ["product_id"]),
+    ("ix_product_pros_product_id", "product_pros", ["product_id"]),
+    ("ix_product_cons_product_id", "product_cons", ["product_id"]),
+    ("ix_categories_article_id", "categories", ["article_id"]),
+    ("ix_article_faqs_article_id", "article_faqs", ["article_id"]),
+    ("ix_article_seo_keywords_article_id", "article_seo_keywords", ["article_id"]),
+    # Reverse side of the association tables (the primary keys already lead with the other column)
+    ("ix_article_product_association_product_id", "article_product_association", ["product_id"]),
+    ("ix_product_store_association_store_id", "product_store_association", ["store_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,51 @@
+"""Added prompt text trigram index and dropped article status trigram index
+
+Revision ID: c4e8d2a6f1b3
+Revises: 9b3f6a2d7e15
+Create Date: 2026-10-17 09:24:11.602931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8d2a6f1b3'
+down_revision: Union[str, None] = '9b3f6a2d7e15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # Prompt text keeps its substring (ILIKE) match next to the full-text search_vector one.
+    op.create_index(
+        "ix_prompts_text_trgm",
+        "prompts",
+        ["text"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"text": "gin_trgm_ops"},
+    )
+
+    # Article status is low-cardinality; its matches are found through ix_articles_blog_id_status.
+    op.drop_index("ix_articles_status_trgm", table_name="articles")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.create_index(
+        "ix_articles_status_trgm",
+        "articles",
+        ["status"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"status": "gin_trgm_ops"},
+    )
+    op.drop_index("ix_prompts_text_trgm", table_name="prompts")
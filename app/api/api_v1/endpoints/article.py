@@ -1,18 +1,22 @@
 import io
 from fastapi import APIRouter, Depends, HTTPException, Path
 from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Any, Dict, List, Optional
-from app.schemas.article import ArticleCreate, ArticleUpdate, ArticleResponse
+from typing import Any, Dict, List, Literal, Optional, Union
+from app.schemas.article import ArticleCreate, ArticlePatch, ArticleUpdate, ArticleResponse
+from app.schemas.patch import PatchResponse
 from app.crud.crud_article import (
     create_article, 
     get_article_by_id, 
     get_articles,
     get_latest_articles, 
     update_article, 
+    patch_article,
     delete_article,
 )
-from app.database import get_db
+from app.database import get_async_read_db, get_db
+from app.crud import async_crud
 from app.models.user import User  
 from app.dependencies.auth import get_current_user  
 from app.services.wordpress_service import WordPressService
@@ -42,13 +46,13 @@ async def create_new_article(
 async def read_latest_articles(
     blog_id: int = Path(..., description="The ID of the blog"),
     limit: int = 5,
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Retrieve the latest articles, based on the highest ID (as a proxy for the most recent articles).
     """
-    latest_articles = get_latest_articles(db=db, blog_id=blog_id, limit=limit)
+    latest_articles = await async_crud.get_latest_articles(db=db, blog_id=blog_id, limit=limit)
     return latest_articles
 
 
@@ -60,26 +64,32 @@ async def read_articles(
     sort_field: Optional[str] = None,
     sort_order: Optional[int] = None,
     filter: Optional[str] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    count: Literal["exact", "estimated", "none"] = "exact",
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Retrieve a list of articles with pagination, sorting, filtering, and total records.
+    Pass `cursor` (empty for the first page) to use keyset pagination; the response then includes `next_cursor`.
     """
-    result = get_articles(db=db, blog_id=blog_id, skip=skip, limit=limit, sort_field=sort_field, sort_order=sort_order, filter=filter)
+    try:
+        result = await async_crud.get_articles(db=db, blog_id=blog_id, skip=skip, limit=limit, sort_field=sort_field, sort_order=sort_order, filter=filter, cursor=cursor, count=count)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return result
 
 @router.get("/{article_id}", response_model=ArticleResponse)
 async def read_article(
     blog_id: int = Path(..., description="The ID of the blog"),
     article_id: int = Path(..., description="The ID of the article"), 
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user) 
 ):
     """
     Retrieve an article by ID.
     """
-    article = get_article_by_id(db=db, blog_id=blog_id, article_id=article_id)
+    article = await async_crud.get_article_by_id(db=db, blog_id=blog_id, article_id=article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     return article
@@ -109,6 +119,32 @@ async def update_existing_article(
     
     return updated_article
 
+@router.patch("/{article_id}", response_model=Union[ArticleResponse, PatchResponse])
+async def patch_existing_article(
+    article: ArticlePatch,
+    blog_id: int = Path(..., description="The ID of the blog"),
+    article_id: int = Path(..., description="The ID of the article"),
+    minimal: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    upload_to_wordpress: Optional[bool] = None,
+):
+    """
+    Partially update an existing article. Only the fields sent in the body are changed.
+    Pass `minimal=true` to get back only the ID and the updated field names.
+    """
+    image_service: Optional[ImageService] = None
+    if upload_to_wordpress:
+        wordpress_service = WordPressService(blog_id=blog_id, db=db)
+        image_service = ImageService(wordpress_service)
+
+    patched_article = await patch_article(db=db, blog_id=blog_id, article_id=article_id, article_patch=article, image_service=image_service, minimal=minimal)
+
+    if not patched_article:
+        raise HTTPException(status_code=404, detail="Article not found")
+
+    return patched_article
+
 @router.delete("/{article_id}", response_model=ArticleResponse)
 async def delete_existing_article(
     blog_id: int = Path(..., description="The ID of the blog"),
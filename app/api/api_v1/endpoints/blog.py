@@ -1,7 +1,7 @@
-from typing import Any, Optional, Dict
+from typing import Any, Literal, Optional, Dict
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.dependencies.auth import get_current_user
 from app.models.user import User
 
@@ -40,7 +40,9 @@ def read_blogs(
     skip: int = 0,
     limit: int = 10,
     filter: Optional[str] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    count: Literal["exact", "estimated", "none"] = "exact",
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -49,15 +51,20 @@ def read_blogs(
     :param skip: Number of records to skip.
     :param limit: Maximum number of records to return.
     :param filter: Optional string to filter by blog name, base_url, or username.
+    :param cursor: Opaque keyset cursor (empty for the first page); enables cursor pagination.
+    :param count: How to compute 'total_records': 'exact', 'estimated' or 'none'.
     :param db: The database session.
-    :return: A dictionary containing the 'blogs' list and 'total_records'.
+    :return: A dictionary containing the 'blogs' list, 'total_records' and, in cursor mode, 'next_cursor'.
     """
-    return get_blogs(db=db, skip=skip, limit=limit, filter_str=filter)
+    try:
+        return get_blogs(db=db, skip=skip, limit=limit, filter_str=filter, cursor=cursor, count=count)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{blog_id}", response_model=BlogResponse)
 def read_blog(
     blog_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, Path
+from typing import Union
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.crud.crud_dashboard import get_dashboard_stats
-from app.database import get_db
+from app.crud.async_crud import get_dashboard_stats
+from app.database import get_async_read_db
 from app.dependencies.auth import get_current_user
 from app.models.user import User
 from app.schemas.dashboard import DashboardStatsResponse
@@ -11,7 +13,7 @@ router = APIRouter()
 @router.get("/stats", response_model=DashboardStatsResponse)
 async def read_dashboard_stats(
     blog_id: int = Path(..., title="The ID of the blog to retrieve the dashboard stats for"),
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -21,5 +23,5 @@ async def read_dashboard_stats(
     - total number of products
     - number of out of stock products
     """
-    stats = get_dashboard_stats(db=db, blog_id=blog_id)
+    stats = await get_dashboard_stats(db=db, blog_id=blog_id)
     return stats
@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends
+from app import database
+from app.core.db_pool import get_pool_stats
+from app.models.user import User
+from app.dependencies.auth import get_current_user
+from app.schemas.diagnostics import DatabasePoolsResponse, ScrapingProvidersResponse
+from app.scrapers.provider_health import SCRAPER_HEDGE_AFTER, provider_selector
+
+router = APIRouter()
+
+@router.get("/db-pool", response_model=DatabasePoolsResponse)
+async def read_db_pool_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Returns connection pool usage for the sync engine and, when enabled, the async and read replica engines:
+    checked out / overflow connections, average and p99 checkout wait and pool timeouts.
+    A pool is null when it is not instrumented (e.g. in-memory SQLite).
+    """
+    return DatabasePoolsResponse(
+        sync_pool=get_pool_stats(database.engine),
+        async_pool=get_pool_stats(database.async_engine),
+        read_pool=get_pool_stats(database.read_engine),
+        async_read_pool=get_pool_stats(database.async_read_engine),
+    )
+
+@router.get("/scraping-providers", response_model=ScrapingProvidersResponse)
+async def read_scraping_provider_health(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Returns the health of the scraping providers in the order they are tried: circuit state,
+    error rate and p50 / p95 latency over the recent calls of this worker, and the hedging delay (0 = off).
+    """
+    return ScrapingProvidersResponse(
+        providers=provider_selector.snapshot(),
+        hedge_after=SCRAPER_HEDGE_AFTER,
+    )
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi.responses import StreamingResponse
-from typing import Optional
-from app.database import get_db
+from typing import Optional, Union
+from app.database import get_async_read_db, run_sync
 from app.models.user import User
 from app.dependencies.auth import get_current_user
 from app.services.exporter.exporter_service import EXPORTERS
@@ -19,7 +20,7 @@ async def export_entities(
     sort_field: Optional[str] = None,
     sort_order: Optional[int] = None,
     filter: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -29,7 +30,7 @@ async def export_entities(
     if not exporter:
         raise HTTPException(status_code=400, detail=f"Unknown entity type: {entity_type}")
 
-    csv_data = exporter(db=db, blog_id=blog_id, skip=skip, limit=limit, sort_field=sort_field, sort_order=sort_order, filter=filter)
+    csv_data = await run_sync(db, exporter, blog_id=blog_id, skip=skip, limit=limit, sort_field=sort_field, sort_order=sort_order, filter=filter)
     
     filename = f"{entity_type}_export.csv"
 
@@ -1,18 +1,23 @@
 import io
 from fastapi import APIRouter, Depends, HTTPException, Path
 from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Any, Dict, List, Optional
-from app.schemas.product import ProductCreate, ProductUpdate, ProductResponse
+from typing import Any, Dict, List, Literal, Optional, Union
+from app.schemas.product import ProductBulkCreate, ProductBulkCreateResponse, ProductCreate, ProductPatch, ProductUpdate, ProductResponse
+from app.schemas.patch import PatchResponse
 from app.crud.crud_product import (
     create_product,
+    create_products_bulk,
     get_out_of_stock_products_with_articles, 
     get_product_by_id, 
     get_products, 
     update_product, 
+    patch_product,
     delete_product,
 )
-from app.database import get_db
+from app.database import get_async_read_db, get_db
+from app.crud import async_crud
 from app.models.user import User  
 from app.dependencies.auth import get_current_user  
 from app.services.wordpress_service import WordPressService
@@ -36,6 +41,23 @@ async def create_new_product(
     
     return await create_product(db=db, blog_id=blog_id, product=product, image_service=image_service)
 
+@router.post("/bulk", response_model=ProductBulkCreateResponse)
+async def create_new_products_bulk(
+    bulk: ProductBulkCreate,
+    blog_id: int = Path(..., description="The ID of the blog"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    upload_to_wordpress: Optional[bool] = None,
+):
+    """
+    Create many products in one request. Products are scraped concurrently and inserted in
+    a single transaction; the response reports the outcome of every item by its index.
+    """
+    wordpress_service = WordPressService(blog_id=blog_id, db=db)
+    image_service = ImageService(wordpress_service) if upload_to_wordpress else None
+
+    return await create_products_bulk(db=db, blog_id=blog_id, products=bulk.products, image_service=image_service)
+
 @router.get("/", response_model=Dict[str, Any])
 async def read_products(
     blog_id: int = Path(..., description="The ID of the blog"),
@@ -44,39 +66,45 @@ async def read_products(
     sort_field: Optional[str] = None,
     sort_order: Optional[int] = None,
     filter: Optional[str] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    count: Literal["exact", "estimated", "none"] = "exact",
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Retrieve a list of products with pagination, sorting, filtering, and total records.
+    Pass `cursor` (empty for the first page) to use keyset pagination; the response then includes `next_cursor`.
     """
-    result = get_products(db=db, blog_id=blog_id, skip=skip, limit=limit, sort_field=sort_field, sort_order=sort_order, filter=filter)
+    try:
+        result = await async_crud.get_products(db=db, blog_id=blog_id, skip=skip, limit=limit, sort_field=sort_field, sort_order=sort_order, filter=filter, cursor=cursor, count=count)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return result
 
 
 @router.get("/out-of-stock", response_model=List[Dict[str, Any]])
 async def read_out_of_stock_products_with_articles(
     blog_id: int = Path(..., description="The ID of the blog"),
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Retrieve products that are out of stock and the articles they are part of.
     """
-    result = get_out_of_stock_products_with_articles(db=db, blog_id=blog_id)
+    result = await async_crud.get_out_of_stock_products_with_articles(db=db, blog_id=blog_id)
     return result
 
 @router.get("/{product_id}", response_model=ProductResponse)
 async def read_product(
     blog_id: int = Path(..., description="The ID of the blog"),
     product_id: int = Path(..., description="The ID of the product"),
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user) 
 ):
     """
     Retrieve a product by ID.
     """
-    product = get_product_by_id(db=db, blog_id=blog_id, product_id=product_id)
+    product = await async_crud.get_product_by_id(db=db, blog_id=blog_id, product_id=product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     return product
@@ -105,6 +133,32 @@ async def update_existing_product(
     
     return updated_product
 
+@router.patch("/{product_id}", response_model=Union[ProductResponse, PatchResponse])
+async def patch_existing_product(
+    product: ProductPatch,
+    blog_id: int = Path(..., description="The ID of the blog"),
+    product_id: int = Path(..., description="The ID of the product"),
+    minimal: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    upload_to_wordpress: Optional[bool] = None,
+):
+    """
+    Partially update an existing product. Only the fields sent in the body are changed.
+    Pass `minimal=true` to get back only the ID and the updated field names.
+    """
+    image_service: Optional[ImageService] = None
+    if upload_to_wordpress:
+        wordpress_service = WordPressService(blog_id=blog_id, db=db)
+        image_service = ImageService(wordpress_service)
+
+    patched_product = await patch_product(db=db, blog_id=blog_id, product_id=product_id, product_patch=product, image_service=image_service, minimal=minimal)
+
+    if not patched_product:
+        raise HTTPException(status_code=404, detail="Product not found")
+
+    return patched_product
+
 @router.delete("/{product_id}", response_model=ProductResponse)
 async def delete_existing_product(
     blog_id: int = Path(..., description="The ID of the blog"),
@@ -1,8 +1,9 @@
 import io
 from fastapi import APIRouter, Depends, HTTPException, Path
 from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Union
 from app.schemas.prompt import PromptCreate, PromptUpdate, PromptResponse
 from app.schemas.prompt_type_subtype_response import PromptTypeSubtypeResponse
 from app.crud.crud_prompt import (
@@ -14,7 +15,8 @@ from app.crud.crud_prompt import (
     get_prompt_types_subtypes,
     get_prompts_by_type_and_optional_subtype,
 )
-from app.database import get_db
+from app.database import get_async_read_db, get_db
+from app.crud import async_crud
 from app.models.user import User  
 from app.dependencies.auth import get_current_user
 
@@ -40,13 +42,19 @@ async def read_prompts(
     sort_field: Optional[str] = None,
     sort_order: Optional[int] = None,
     filter: Optional[str] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    count: Literal["exact", "estimated", "none"] = "exact",
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Retrieve a list of prompts with pagination, sorting, filtering, and total records.
+    Pass `cursor` (empty for the first page) to use keyset pagination; the response then includes `next_cursor`.
     """
-    result = get_prompts(db=db, blog_id=blog_id, skip=skip, limit=limit, sort_field=sort_field, sort_order=sort_order, filter=filter)
+    try:
+        result = await async_crud.get_prompts(db=db, blog_id=blog_id, skip=skip, limit=limit, sort_field=sort_field, sort_order=sort_order, filter=filter, cursor=cursor, count=count)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return result
 
 @router.get("/{prompt_type}", response_model=List[PromptResponse])
@@ -54,7 +62,7 @@ async def read_prompts_by_type_and_optional_subtype(
     blog_id: int = Path(..., description="The ID of the blog"),
     prompt_type: str = Path(..., description="The type of prompts to retrieve"),
     prompt_subtype: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -66,7 +74,7 @@ async def read_prompts_by_type_and_optional_subtype(
     :param current_user: The current authenticated user.
     :return: List of prompts.
     """
-    prompts = get_prompts_by_type_and_optional_subtype(
+    prompts = await async_crud.get_prompts_by_type_and_optional_subtype(
         db=db,
         blog_id=blog_id, 
         prompt_type=prompt_type, 
@@ -80,13 +88,13 @@ async def read_prompts_by_type_and_optional_subtype(
 async def read_prompt(
     blog_id: int = Path(..., description="The ID of the blog"),
     prompt_id: int = Path(..., description="The ID of the prompt"),
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Retrieve a prompt by ID.
     """
-    prompt = get_prompt_by_id(db=db, blog_id=blog_id, prompt_id=prompt_id)
+    prompt = await async_crud.get_prompt_by_id(db=db, blog_id=blog_id, prompt_id=prompt_id)
     if not prompt:
         raise HTTPException(status_code=404, detail="Prompt not found")
     return prompt
@@ -10,6 +10,7 @@ from app.crud.crud_settings import (
     delete_setting,
 )
 from app.models.user import User  
+from app.services.settings_service import SettingsService
 from app.dependencies.auth import get_current_user  
 
 router = APIRouter()
@@ -47,7 +48,9 @@ def create_new_setting(
     existing_setting = get_setting_by_key(db, setting.key)
     if existing_setting:
         raise HTTPException(status_code=400, detail="Setting with this key already exists")
-    return create_setting(db, setting)
+    new_setting = create_setting(db, setting)
+    SettingsService.invalidate_cache()
+    return new_setting
 
 @router.put("/{key}", response_model=SettingResponse)
 def update_existing_setting(
@@ -61,6 +64,7 @@ def update_existing_setting(
     updated_setting = update_setting(db, key, setting_update)
     if not updated_setting:
         raise HTTPException(status_code=404, detail="Setting not found")
+    SettingsService.invalidate_cache()
     return updated_setting
 
 @router.delete("/{key}", response_model=SettingResponse)
@@ -74,4 +78,5 @@ def delete_existing_setting(
     deleted_setting = delete_setting(db, key)
     if not deleted_setting:
         raise HTTPException(status_code=404, detail="Setting not found")
+    SettingsService.invalidate_cache()
     return deleted_setting
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.core.setup_middleware import invalidate_setup_cache
 
 from app.crud.crud_setup import (
     get_setup_status,
@@ -11,6 +12,7 @@ from app.crud.crud_setup import (
 from app.schemas.settings import SettingUpdate
 from app.schemas.setup_status import SetupStatusResponse
 from app.crud import crud_user, crud_blog, crud_settings
+from app.services.settings_service import SettingsService
 from app.schemas.user import UserCreate
 from app.schemas.blog import BlogCreate
 
@@ -66,6 +68,8 @@ def setup_step2_api_keys(
         setting_update=SettingUpdate(value=edenai_api_key)
     )
 
+    SettingsService.invalidate_cache()
+
     update_step(db, 3)
 
     return {"detail": "API keys set. Step2 done."}
@@ -89,4 +93,6 @@ def finalize_setup(db: Session = Depends(get_db)):
     if is_setup_completed(db):
         raise HTTPException(status_code=400, detail="Setup already completed.")
 
-    return complete_setup(db)
+    setup_status = complete_setup(db)
+    invalidate_setup_cache()
+    return setup_status
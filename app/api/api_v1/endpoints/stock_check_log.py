@@ -1,12 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, Path
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Union
 from datetime import datetime
 from app.dependencies.auth import get_current_user
 from app.models.user import User
 from app.schemas.stock_check_log import StockCheckLogResponse
-from app.crud.crud_stock_check_log import get_stock_check_logs
-from app.database import get_db
+from app.crud.async_crud import get_stock_check_logs
+from app.database import get_async_read_db
 
 router = APIRouter()
 
@@ -15,13 +16,13 @@ async def read_stock_check_logs(
     blog_id: int = Path(..., title="The ID of the blog to retrieve stock check logs for."),
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Retrieve all stock check logs with optional date filtering.
     """
-    logs = get_stock_check_logs(db=db, blog_id=blog_id, start_date=start_date, end_date=end_date)
+    logs = await get_stock_check_logs(db=db, blog_id=blog_id, start_date=start_date, end_date=end_date)
     if not logs:
         raise HTTPException(status_code=404, detail="No stock check logs found")
     return logs
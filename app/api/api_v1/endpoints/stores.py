@@ -1,8 +1,10 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_async_read_db, get_db
+from app.crud import async_crud
 from app.models.user import User
 from app.dependencies.auth import get_current_user
 
@@ -61,7 +63,9 @@ async def read_stores(
     sort_field: Optional[str] = None,
     sort_order: Optional[int] = None,
     filter: Optional[str] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    count: Literal["exact", "estimated", "none"] = "exact",
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """
@@ -73,19 +77,26 @@ async def read_stores(
     :param sort_field: The field by which results should be sorted.
     :param sort_order: The sort order (use -1 for DESC, otherwise ASC).
     :param filter: An optional filter string that matches store fields like name/base_url.
+    :param cursor: Opaque keyset cursor (empty for the first page); enables cursor pagination.
+    :param count: How to compute the total record count: 'exact', 'estimated' or 'none'.
     :param db: The database session.
     :param current_user: The currently authenticated user.
-    :return: A dictionary containing a list of stores and the total record count.
+    :return: A dictionary containing a list of stores, the total record count and, in cursor mode, the next cursor.
     """
-    result = get_stores(
-        db=db,
-        blog_id=blog_id,
-        skip=skip,
-        limit=limit,
-        sort_field=sort_field,
-        sort_order=sort_order,
-        filter=filter
-    )
+    try:
+        result = await async_crud.get_stores(
+            db=db,
+            blog_id=blog_id,
+            skip=skip,
+            limit=limit,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            filter=filter,
+            cursor=cursor,
+            count=count
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return result
 
 
@@ -93,7 +104,7 @@ async def read_stores(
 async def read_store(
     blog_id: int = Path(..., description="The ID of the blog"),
     store_id: int = Path(..., description="The ID of the store"),
-    db: Session = Depends(get_db),
+    db: Union[AsyncSession, Session] = Depends(get_async_read_db),
     current_user: User = Depends(get_current_user)
 ) -> StoreResponse:
     """
@@ -105,7 +116,7 @@ async def read_store(
     :param current_user: The currently authenticated user.
     :return: A StoreResponse if found; otherwise raises 404.
     """
-    store = get_store_by_id(db=db, store_id=store_id, blog_id=blog_id)
+    store = await async_crud.get_store_by_id(db=db, store_id=store_id, blog_id=blog_id)
     if not store:
         raise HTTPException(status_code=404, detail="Store not found")
     return store
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.api_v1.endpoints import setup, blog, stores, login, product, article, token, wordpress, prompt, ai, widgets, dashboard, stock_check_log, websocket, importer, exporter, settings, placeholder
+from app.api.api_v1.endpoints import setup, blog, stores, login, product, article, token, wordpress, prompt, ai, widgets, dashboard, stock_check_log, websocket, importer, exporter, settings, placeholder, diagnostics
 
 api_router = APIRouter()
 
@@ -21,3 +21,4 @@ api_router.include_router(importer.router, prefix="/{blog_id}/import", tags=["im
 api_router.include_router(exporter.router, prefix="/{blog_id}/export", tags=["exporter"])
 api_router.include_router(settings.router, prefix="/settings", tags=["settings"])
 api_router.include_router(placeholder.router, prefix="/placeholders", tags=["placeholders"])
+api_router.include_router(diagnostics.router, prefix="/diagnostics", tags=["diagnostics"])
@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+WAIT_SAMPLE_SIZE = 1000
+
+
+class PoolStats:
+    """
+    Thread-safe counters for connection checkouts of a single pool.
+    Keeps the last WAIT_SAMPLE_SIZE checkout waits to compute the average and p99.
+    """
+
+    def __init__(self, sample_size: int = WAIT_SAMPLE_SIZE):
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=sample_size)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.max_wait = 0.0
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self._waits.append(wait)
+            self.checkouts += 1
+            self.max_wait = max(self.max_wait, wait)
+
+    def record_timeout(self, wait: float) -> None:
+        with self._lock:
+            self._waits.append(wait)
+            self.timeouts += 1
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the counters and the average / p99 wait (in milliseconds) over the sample window.
+        """
+        with self._lock:
+            waits = sorted(self._waits)
+            checkouts = self.checkouts
+            timeouts = self.timeouts
+            max_wait = self.max_wait
+
+        avg_wait = sum(waits) / len(waits) if waits else 0.0
+        p99_wait = waits[min(len(waits) - 1, int(len(waits) * 0.99))] if waits else 0.0
+        return {
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "avg_wait_ms": round(avg_wait * 1000, 3),
+            "p99_wait_ms": round(p99_wait * 1000, 3),
+            "max_wait_ms": round(max_wait * 1000, 3),
+            "sample_size": len(waits),
+        }
+
+
+class InstrumentedPoolMixin:
+    """
+    Times every checkout from the pool queue (including opening a new connection
+    when the pool grows) and counts checkouts that give up after pool_timeout.
+    """
+
+    stats: PoolStats
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record_timeout(time.perf_counter() - start)
+            raise
+        self.stats.record_checkout(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep counting into the same stats.
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def get_pool_stats(engine: Any) -> Optional[Dict[str, Any]]:
+    """
+    Returns the current state of the engine's pool together with its checkout statistics,
+    or None if the engine is not configured or does not use an instrumented pool.
+
+    :param engine: A sync Engine or an AsyncEngine.
+    """
+    if engine is None:
+        return None
+
+    pool = getattr(engine, "sync_engine", engine).pool
+    if not isinstance(pool, InstrumentedPoolMixin):
+        return None
+
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "pool_timeout": pool.timeout(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        **pool.stats.snapshot(),
+    }
@@ -1,23 +1,60 @@
-from fastapi import Request, HTTPException, status
+from fastapi import status
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import JSONResponse
-from sqlalchemy.orm import Session
+from starlette.types import ASGIApp, Receive, Scope, Send
 from app.database import SessionLocal
 from app.crud.crud_setup import is_setup_completed
 
-async def setup_middleware(request: Request, call_next):
-    path = request.url.path
-    if path.startswith("/setup") or path.startswith("/api/v1/setup"):
-        return await call_next(request)
+# Setup can only go from incomplete to complete, so once seen as completed it is cached for the
+# lifetime of the process. An incomplete state is never cached.
+_setup_completed = False
 
-    db: Session = SessionLocal()
-    completed = is_setup_completed(db)
-    db.close()
 
-    if not completed:
-        return JSONResponse(
+def invalidate_setup_cache() -> None:
+    """
+    Forgets the cached setup state so the next request reads it from the database again.
+    Called by the setup endpoints whenever they change the setup status.
+    """
+    global _setup_completed
+    _setup_completed = False
+
+
+def _read_setup_completed() -> bool:
+    db = SessionLocal()
+    try:
+        return is_setup_completed(db)
+    finally:
+        db.close()
+
+
+class SetupMiddleware:
+    """
+    Pure ASGI middleware that rejects HTTP requests with 403 until the setup is completed.
+    Requests to the setup endpoints always pass. Responses are never buffered or wrapped.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        global _setup_completed
+
+        if scope["type"] != "http" or _setup_completed:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path.startswith("/setup") or path.startswith("/api/v1/setup"):
+            await self.app(scope, receive, send)
+            return
+
+        if await run_in_threadpool(_read_setup_completed):
+            _setup_completed = True
+            await self.app(scope, receive, send)
+            return
+
+        response = JSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"detail": "Setup not completed. Please finish /setup first."}
         )
-
-    response = await call_next(request)
-    return response
+        await response(scope, receive, send)
@@ -0,0 +1,144 @@
+import logging
+import os
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Generator, List, Tuple
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+SQL_INSTRUMENTATION_ENABLED = os.getenv("SQL_INSTRUMENTATION_ENABLED", "false").lower() in ["true", "1", "yes"]
+N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "10"))
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|:\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryStats:
+    """
+    Statements issued while a `track_queries` block is active: how many, how long they
+    spent in the driver, and how often each statement shape (fingerprint) was repeated.
+    """
+
+    def __init__(self):
+        self.statement_count = 0
+        self.db_time = 0.0
+        self.fingerprints: Counter = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.statement_count += 1
+        self.db_time += duration
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def repeated_statements(self, threshold: int = 2) -> List[Tuple[str, int]]:
+        """
+        Returns the fingerprints issued at least `threshold` times, most repeated first.
+        """
+        return [(shape, count) for shape, count in self.fingerprints.most_common() if count >= threshold]
+
+
+_active_stats: ContextVar[Tuple[QueryStats, ...]] = ContextVar("sql_query_stats", default=())
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalizes a statement so that executions differing only in literals or bound
+    parameters (including the length of IN lists) share the same fingerprint.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _WHITESPACE.sub(" ", shape).strip()
+    return _PLACEHOLDER_LIST.sub("(?)", shape)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _active_stats.get():
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    active_stats = _active_stats.get()
+    if not active_stats:
+        return
+    start_times = conn.info.get("query_start_time")
+    duration = time.perf_counter() - start_times.pop() if start_times else 0.0
+    for stats in active_stats:
+        stats.record(statement, duration)
+
+
+def install_sql_instrumentation(engine: Any) -> None:
+    """
+    Registers the cursor execution hooks on an engine (or an AsyncEngine's sync engine).
+    Statements are only recorded inside `track_queries`, so the hooks are cheap otherwise.
+    """
+    engine = getattr(engine, "sync_engine", engine)
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_queries() -> Generator[QueryStats, None, None]:
+    """
+    Records every statement executed by an instrumented engine in the current context
+    (including threadpool endpoints and async sessions started from it).
+    Nested blocks each get their own stats; statements count towards every enclosing block.
+    """
+    stats = QueryStats()
+    token = _active_stats.set(_active_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+class SQLInstrumentationMiddleware:
+    """
+    Pure ASGI middleware that adds X-DB-Query-Count and X-DB-Time-Ms headers to every HTTP
+    response and logs a warning when a statement shape repeats N_PLUS_ONE_THRESHOLD times or
+    more within one request. Responses are never buffered or wrapped.
+
+    The headers count the statements issued before the response starts; for streaming
+    responses, statements issued while streaming are only included in the log line.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(stats.statement_count)
+                    headers["X-DB-Time-Ms"] = f"{stats.db_time * 1000:.2f}"
+                await send(message)
+
+            await self.app(scope, receive, send_with_headers)
+
+        method, path = scope["method"], scope["path"]
+        repeated = stats.repeated_statements(N_PLUS_ONE_THRESHOLD)
+        if repeated:
+            shape, count = repeated[0]
+            logger.warning(
+                "Possible N+1 on %s %s: %d statements, %.2f ms in the database; repeated %d times: %s",
+                method, path, stats.statement_count, stats.db_time * 1000, count, shape
+            )
+        else:
+            logger.debug(
+                "%s %s: %d statements, %.2f ms in the database",
+                method, path, stats.statement_count, stats.db_time * 1000
+            )
@@ -0,0 +1,50 @@
+import functools
+from typing import Any, Awaitable, Callable, TypeVar, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.database import run_sync
+from app.crud import (
+    crud_article,
+    crud_dashboard,
+    crud_product,
+    crud_prompt,
+    crud_stock_check_log,
+    crud_store,
+)
+
+T = TypeVar("T")
+
+
+def async_variant(fn: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    Wraps a synchronous crud function into a coroutine that accepts the session yielded by
+    `get_async_db` followed by the same arguments as the original, and runs it through `run_sync`.
+    """
+    @functools.wraps(fn)
+    async def wrapper(db: Union[AsyncSession, Session], *args: Any, **kwargs: Any) -> T:
+        return await run_sync(db, fn, *args, **kwargs)
+    return wrapper
+
+
+# Products
+get_product_by_id = async_variant(crud_product.get_product_by_id)
+get_products = async_variant(crud_product.get_products)
+get_out_of_stock_products_with_articles = async_variant(crud_product.get_out_of_stock_products_with_articles)
+
+# Articles
+get_article_by_id = async_variant(crud_article.get_article_by_id)
+get_articles = async_variant(crud_article.get_articles)
+get_latest_articles = async_variant(crud_article.get_latest_articles)
+
+# Stores
+get_store_by_id = async_variant(crud_store.get_store_by_id)
+get_stores = async_variant(crud_store.get_stores)
+
+# Prompts
+get_prompt_by_id = async_variant(crud_prompt.get_prompt_by_id)
+get_prompts = async_variant(crud_prompt.get_prompts)
+get_prompts_by_type_and_optional_subtype = async_variant(crud_prompt.get_prompts_by_type_and_optional_subtype)
+
+# Dashboard and stock check logs
+get_dashboard_stats = async_variant(crud_dashboard.get_dashboard_stats)
+get_stock_check_logs = async_variant(crud_stock_check_log.get_stock_check_logs)
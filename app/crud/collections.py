@@ -0,0 +1,90 @@
+from typing import Any, Dict, List, Optional, Sequence
+from sqlalchemy import delete, insert, inspect, update
+from sqlalchemy.orm import Session
+
+
+def sync_collection(
+    db: Session,
+    owner: Any,
+    relationship_name: str,
+    values: Sequence[Dict[str, Any]],
+    key: Optional[str] = None,
+) -> None:
+    """
+    Brings a one-to-many child collection in line with `values` using the fewest row changes,
+    instead of deleting and re-inserting every child.
+
+    Existing rows are paired with the new values by `key` when given (e.g. spec_key), otherwise
+    by position in primary key order. Paired rows are only updated when a value differs,
+    unpaired values are inserted and leftover rows are deleted, each with a single bulk statement.
+    The relationship is expired afterwards so the next access reloads it.
+
+    Children are read back in primary key order, so pairing by key falls back to pairing by
+    position when it would not keep the order of `values` (e.g. reordered specifications).
+
+    :param db: The database session.
+    :param owner: The persistent parent object (e.g. a Product).
+    :param relationship_name: Name of the collection relationship on the owner (e.g. "pros").
+    :param values: Column values for each desired child, in order.
+    :param key: Optional column that identifies a child across updates.
+    """
+    relationship = inspect(type(owner)).relationships[relationship_name]
+    mapper = relationship.mapper
+    model = mapper.class_
+    primary_key = mapper.primary_key[0].key
+    parent_column, foreign_column = relationship.local_remote_pairs[0]
+    parent_id = getattr(owner, parent_column.key)
+
+    existing = sorted(getattr(owner, relationship_name), key=lambda row: getattr(row, primary_key))
+    pairs = []
+    inserts: List[Dict[str, Any]] = []
+    leftovers = []
+
+    if key is not None:
+        existing_by_key = {}
+        for row in existing:
+            if getattr(row, key) in existing_by_key:
+                leftovers.append(row)
+            else:
+                existing_by_key[getattr(row, key)] = row
+        for value in values:
+            row = existing_by_key.pop(value[key], None)
+            if row is None:
+                inserts.append(value)
+            elif inserts or (pairs and getattr(pairs[-1][0], primary_key) > getattr(row, primary_key)):
+                # A kept row would be read back before a value that comes earlier in `values`.
+                key = None
+                break
+            else:
+                pairs.append((row, value))
+        else:
+            leftovers.extend(existing_by_key.values())
+
+    if key is None:
+        pairs = list(zip(existing, values))
+        inserts = list(values[len(existing):])
+        leftovers = existing[len(values):]
+
+    updates = [
+        (row, value) for row, value in pairs
+        if any(getattr(row, column) != new_value for column, new_value in value.items())
+    ]
+
+    if not (updates or inserts or leftovers):
+        return
+
+    if leftovers:
+        db.execute(
+            delete(model).where(getattr(model, primary_key).in_([getattr(row, primary_key) for row in leftovers])),
+            execution_options={"synchronize_session": False},
+        )
+    if updates:
+        db.execute(update(model), [{primary_key: getattr(row, primary_key), **value} for row, value in updates])
+    if inserts:
+        db.execute(insert(model), [{foreign_column.key: parent_id, **value} for value in inserts])
+
+    db.expire(owner, [relationship_name])
+    for row, _ in updates:
+        db.expire(row)
+    for row in leftovers:
+        db.expunge(row)
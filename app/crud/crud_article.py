@@ -1,13 +1,30 @@
 import csv
 import io
 import json
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from app.models.article import Article, ArticleSEOKeyword, ArticleFAQ, Category
 from app.models.product import Product
-from app.schemas.article import ArticleCreate, ArticleUpdate, ArticleResponse
-from typing import List, Optional
+from app.schemas.article import ArticleCreate, ArticlePatch, ArticleUpdate, ArticleResponse
+from app.schemas.patch import PatchResponse
+from app.crud.pagination import paginate
+from app.crud.collections import sync_collection
+from app.crud.patch_fields import applied_patch_fields, nullable_columns
+from app.crud.search import apply_search
+from app.crud.query_options import article_response_options
+from typing import Any, Dict, List, Optional, Union
 from app.services.image_service import ImageService
 
+# Relationship loaded for each PATCH field that changes a collection.
+ARTICLE_PATCH_RELATIONSHIPS = {
+    "seo_keywords": "seo_keywords",
+    "products_id_list": "products",
+    "categories_id_list": "categories",
+    "faqs": "faqs",
+}
+
+# Columns an explicit null clears in a PATCH.
+NULLABLE_ARTICLE_FIELDS = nullable_columns(Article)
+
 async def create_article(
     db: Session, 
     blog_id: int,
@@ -66,7 +83,12 @@ def get_article_by_id(
     """
     Retrieve an article by its ID.
     """
-    article = db.query(Article).filter(Article.id == article_id, Article.blog_id == blog_id).first()
+    article = (
+        db.query(Article)
+        .options(*article_response_options())
+        .filter(Article.id == article_id, Article.blog_id == blog_id)
+        .first()
+    )
     if article:
         return ArticleResponse.from_orm(article)
     return None
@@ -78,41 +100,43 @@ def get_articles(
     limit: int = 10, 
     sort_field: Optional[str] = None,
     sort_order: Optional[int] = None,
-    filter: Optional[str] = None
+    filter: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: str = "exact"
 ) -> dict:
     """
     Retrieve a list of articles, with pagination support, sorting, filtering, and total records.
+    Passing `cursor` switches to keyset pagination and adds `next_cursor` to the result.
     """
     query = db.query(Article).filter(Article.blog_id == blog_id)
 
     if filter:
-        filter_pattern = f"%{filter}%"
-        query = query.filter(
-            Article.title.ilike(filter_pattern) |
-            Article.slug.ilike(filter_pattern) |
-            Article.status.ilike(filter_pattern)
-        )
-
-    if sort_field:
-        if sort_order == -1:
-            query = query.order_by(getattr(Article, sort_field).desc())
-        else:
-            query = query.order_by(getattr(Article, sort_field).asc())
-
-    total_records = query.count()
-    articles = query.offset(skip).limit(limit).all()
-
-    return {
-        "articles": [ArticleResponse.from_orm(article) for article in articles],
-        "total_records": total_records
+        query = apply_search(query, Article, filter, rank=not sort_field and cursor is None)
+
+    query = query.options(*article_response_options())
+    page = paginate(query, Article, skip, limit, sort_field, sort_order, cursor, count)
+
+    result = {
+        "articles": [ArticleResponse.from_orm(article) for article in page.items],
+        "total_records": page.total_records
     }
+    if cursor is not None:
+        result["next_cursor"] = page.next_cursor
+    return result
 
 
 def get_latest_articles(db: Session, blog_id: int, limit: int) -> List[ArticleResponse]:
     """
     Retrieve the latest articles based on the highest IDs (as IDs are assigned incrementally).
     """
-    articles = db.query(Article).filter(Article.blog_id == blog_id).order_by(Article.id.desc()).limit(limit).all()
+    articles = (
+        db.query(Article)
+        .options(*article_response_options())
+        .filter(Article.blog_id == blog_id)
+        .order_by(Article.id.desc())
+        .limit(limit)
+        .all()
+    )
     return [ArticleResponse.from_orm(article) for article in articles]
 
 
@@ -131,32 +155,7 @@ async def update_article(
         return None
 
     update_data = article_update.model_dump()
-
-    if 'seo_keywords' in update_data and update_data['seo_keywords'] is not None:
-        article.seo_keywords.clear()
-        article.seo_keywords = [ArticleSEOKeyword(keyword=k) for k in update_data['seo_keywords']]
-
-    if 'products_id_list' in update_data and update_data['products_id_list'] is not None:
-        products = db.query(Product).filter(Product.id.in_(update_data['products_id_list'])).all()
-        article.products.clear()
-        article.products = products
-        
-    if 'categories_id_list' in update_data and update_data['categories_id_list'] is not None:
-        article.categories.clear()
-        article.categories = [Category(wp_id=category_id) for category_id in update_data['categories_id_list']]
-
-    if 'faqs' in update_data and update_data['faqs'] is not None:
-        article.faqs.clear()
-        article.faqs = [ArticleFAQ(question=faq['title'], answer=faq['description']) for faq in update_data['faqs']]
-
-    if 'main_image_url' in update_data:
-        update_data['main_image_url'] = str(update_data['main_image_url'])
-    if 'buyers_guide_image_url' in update_data:
-        update_data['buyers_guide_image_url'] = str(update_data['buyers_guide_image_url'])
-
-    for key, value in update_data.items():
-        if key not in ('seo_keywords', 'products_id_list', 'categories_id_list', 'faqs'):
-            setattr(article, key, value)
+    apply_article_changes(db, article, update_data)
 
     if image_service:
         if 'main_image_url' in update_data:
@@ -176,6 +175,83 @@ async def update_article(
     db.refresh(article)
     return ArticleResponse.from_orm(article)
 
+async def patch_article(
+    db: Session,
+    blog_id: int,
+    article_id: int,
+    article_patch: ArticlePatch,
+    image_service: Optional[ImageService] = None,
+    minimal: bool = False
+) -> Optional[Union[ArticleResponse, PatchResponse]]:
+    """
+    Partially update an article: only the fields present in the request body are changed,
+    and only the relationships behind those fields are loaded.
+
+    An explicit null clears a nullable column (NULLABLE_ARTICLE_FIELDS); it is ignored for
+    title, slug and the lists, and such fields are not reported as updated.
+
+    :param minimal: Return a PatchResponse instead of reloading the full article.
+    """
+    patch_data = applied_patch_fields(article_patch.model_dump(exclude_unset=True), NULLABLE_ARTICLE_FIELDS)
+    relationships = [ARTICLE_PATCH_RELATIONSHIPS[field] for field in patch_data if field in ARTICLE_PATCH_RELATIONSHIPS]
+
+    article = (
+        db.query(Article)
+        .options(*[selectinload(getattr(Article, relationship)) for relationship in relationships])
+        .filter(Article.id == article_id, Article.blog_id == blog_id)
+        .first()
+    )
+    if not article:
+        return None
+
+    apply_article_changes(db, article, patch_data)
+
+    if image_service:
+        if patch_data.get('main_image_url') is not None:
+            article.main_image_wp_id = await image_service.process_image(
+                entity_type="article_main",
+                entity=article,
+                image_url=str(patch_data['main_image_url'])
+            )
+        if patch_data.get('buyers_guide_image_url') is not None:
+            article.buyers_guide_image_wp_id = await image_service.process_image(
+                entity_type="article_guide",
+                entity=article,
+                image_url=str(patch_data['buyers_guide_image_url'])
+            )
+
+    db.commit()
+
+    if minimal:
+        return PatchResponse(id=article_id, blog_id=blog_id, updated_fields=sorted(patch_data))
+    return get_article_by_id(db, blog_id=blog_id, article_id=article_id)
+
+def apply_article_changes(db: Session, article: Article, update_data: Dict[str, Any]) -> None:
+    """
+    Applies `update_data` to an article: lists given as null are left untouched,
+    every other field is set as given. Does not commit.
+    """
+    if 'seo_keywords' in update_data and update_data['seo_keywords'] is not None:
+        sync_collection(db, article, "seo_keywords", [{"keyword": k} for k in update_data['seo_keywords']])
+
+    if 'products_id_list' in update_data and update_data['products_id_list'] is not None:
+        products = db.query(Product).filter(Product.id.in_(update_data['products_id_list'])).all()
+        article.products = products
+        
+    if 'categories_id_list' in update_data and update_data['categories_id_list'] is not None:
+        sync_collection(db, article, "categories", [{"wp_id": category_id} for category_id in update_data['categories_id_list']])
+
+    if 'faqs' in update_data and update_data['faqs'] is not None:
+        sync_collection(
+            db, article, "faqs",
+            [{"question": faq['title'], "answer": faq['description']} for faq in update_data['faqs']])
+
+    for key, value in update_data.items():
+        if key in ('main_image_url', 'buyers_guide_image_url') and value is not None:
+            value = str(value)
+        if key not in ('seo_keywords', 'products_id_list', 'categories_id_list', 'faqs'):
+            setattr(article, key, value)
+
 def delete_article(db: Session, blog_id: int, article_id: int) -> Optional[ArticleResponse]:
     """
     Delete an article by its ID.
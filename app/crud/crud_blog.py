@@ -2,6 +2,7 @@ from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 from app.models.blog import Blog
 from app.schemas.blog import BlogCreate, BlogUpdate, BlogResponse
+from app.crud.pagination import paginate
 
 def create_blog(db: Session, blog_data: BlogCreate) -> BlogResponse:
     """
@@ -40,7 +41,9 @@ def get_blogs(
     db: Session,
     skip: int = 0,
     limit: int = 10,
-    filter_str: Optional[str] = None
+    filter_str: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: str = "exact"
 ) -> Dict[str, Any]:
     """
     Retrieves a paginated list of blogs from the database, with optional filtering.
@@ -49,7 +52,9 @@ def get_blogs(
     :param skip: Number of records to skip (for pagination).
     :param limit: Maximum number of records to return (for pagination).
     :param filter_str: Optional filter to search by blog name, base_url, or username.
-    :return: A dictionary containing the list of blogs and the total number of records.
+    :param cursor: Opaque keyset cursor; an empty string requests the first page in cursor mode.
+    :param count: How to compute 'total_records': 'exact', 'estimated' or 'none'.
+    :return: A dictionary containing the list of blogs, the total number of records and, in cursor mode, 'next_cursor'.
     """
     query = db.query(Blog)
 
@@ -61,13 +66,15 @@ def get_blogs(
             (Blog.username.ilike(filter_pattern))
         )
 
-    total_records = query.count()
-    blogs = query.offset(skip).limit(limit).all()
+    page = paginate(query, Blog, skip, limit, cursor=cursor, count=count)
 
-    return {
-        "blogs": [BlogResponse.model_validate(b) for b in blogs],
-        "total_records": total_records
+    result = {
+        "blogs": [BlogResponse.model_validate(b) for b in page.items],
+        "total_records": page.total_records
     }
+    if cursor is not None:
+        result["next_cursor"] = page.next_cursor
+    return result
 
 def update_blog(db: Session, blog_id: int, blog_update: BlogUpdate) -> Optional[BlogResponse]:
     """
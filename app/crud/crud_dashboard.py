@@ -1,8 +1,59 @@
+import os
+from collections import defaultdict
+from typing import Dict, Set
+from sqlalchemy import event, func, inspect, select, true, update
+from sqlalchemy.orm.base import NO_VALUE
 from sqlalchemy.orm import Session
 from app.models.article import Article
+from app.models.blog_counters import BlogCounters
 from app.models.product import Product
 from app.schemas.dashboard import DashboardStatsResponse
 
+DASHBOARD_COUNTERS_ENABLED = os.getenv("DASHBOARD_COUNTERS_ENABLED", "false").lower() in ["true", "1", "yes"]
+
+COUNTER_FIELDS = [
+    "published_articles_count",
+    "draft_articles_count",
+    "total_products_count",
+    "out_of_stock_products_count",
+]
+
+def count_dashboard_stats(db: Session, blog_id: int) -> DashboardStatsResponse:
+    """
+    Counts articles and products of a blog in a single query: one conditional aggregate
+    per table, cross joined so each table is scanned once.
+    """
+    article_counts = select(
+        func.count().filter(Article.status == "publish").label("published_articles_count"),
+        func.count().filter(Article.status == "draft").label("draft_articles_count"),
+    ).where(Article.blog_id == blog_id).subquery()
+
+    product_counts = select(
+        func.count().label("total_products_count"),
+        func.count().filter(Product.in_stock == False).label("out_of_stock_products_count"),
+    ).where(Product.blog_id == blog_id).subquery()
+
+    row = db.execute(
+        select(article_counts, product_counts).select_from(article_counts.join(product_counts, true()))
+    ).one()
+
+    return DashboardStatsResponse(**row._mapping)
+
+def refresh_blog_counters(db: Session, blog_id: int) -> DashboardStatsResponse:
+    """
+    Recomputes the maintained counters of a blog from the articles and products tables
+    and stores them in blog_counters. Does not commit.
+    """
+    stats = count_dashboard_stats(db, blog_id)
+    counters = db.get(BlogCounters, blog_id)
+    if counters is None:
+        counters = BlogCounters(blog_id=blog_id)
+        db.add(counters)
+    for field in COUNTER_FIELDS:
+        setattr(counters, field, getattr(stats, field))
+    db.flush()
+    return stats
+
 def get_dashboard_stats(db: Session, blog_id : int) -> DashboardStatsResponse:
     """
     Retrieve statistics for the dashboard:
@@ -10,18 +61,143 @@ def get_dashboard_stats(db: Session, blog_id : int) -> DashboardStatsResponse:
     - number of draft articles
     - total number of products
     - number of out of stock products
+
+    With DASHBOARD_COUNTERS_ENABLED the stats are read from the blog_counters row.
+    This runs on the read replica, so it never writes: blogs without a row yet (it is
+    created by the stock updater) fall back to counting.
+    """
+    if not DASHBOARD_COUNTERS_ENABLED:
+        return count_dashboard_stats(db, blog_id)
+
+    counters = db.get(BlogCounters, blog_id)
+    if counters is None:
+        return count_dashboard_stats(db, blog_id)
+
+    return DashboardStatsResponse(**{field: getattr(counters, field) for field in COUNTER_FIELDS})
+
+def apply_counter_deltas(db: Session, deltas: Dict[int, Dict[str, int]]) -> None:
     """
-    published_articles_count = db.query(Article).filter(Article.blog_id == blog_id, Article.status == "publish").count()
-    
-    draft_articles_count = db.query(Article).filter(Article.blog_id == blog_id, Article.status == "draft").count()
+    Adds the given per-blog deltas to existing blog_counters rows in the current transaction.
+    Blogs without a row are skipped; their row is built by `refresh_blog_counters`.
+
+    :param deltas: Mapping of blog_id to {counter field: delta}.
+    """
+    connection = db.connection()
+    for blog_id, changes in deltas.items():
+        changes = {field: delta for field, delta in changes.items() if delta}
+        if not changes:
+            continue
+        connection.execute(
+            update(BlogCounters)
+            .where(BlogCounters.blog_id == blog_id)
+            .values({field: getattr(BlogCounters, field) + delta for field, delta in changes.items()})
+        )
+
+def recount_blog_counters(db: Session, blog_ids: Set[int]) -> None:
+    """
+    Recomputes existing blog_counters rows with one UPDATE per blog, using only the
+    session's connection so it can run inside a flush.
+    """
+    connection = db.connection()
+    for blog_id in blog_ids:
+        articles = select(
+            func.count().filter(Article.status == "publish"),
+            func.count().filter(Article.status == "draft"),
+        ).where(Article.blog_id == blog_id).subquery()
+        products = select(
+            func.count(),
+            func.count().filter(Product.in_stock == False),
+        ).where(Product.blog_id == blog_id).subquery()
+        published, draft = articles.c
+        total, out_of_stock = products.c
+        connection.execute(
+            update(BlogCounters)
+            .where(BlogCounters.blog_id == blog_id)
+            .values(
+                published_articles_count=select(published).scalar_subquery(),
+                draft_articles_count=select(draft).scalar_subquery(),
+                total_products_count=select(total).scalar_subquery(),
+                out_of_stock_products_count=select(out_of_stock).scalar_subquery(),
+            )
+        )
+
+def _previous_value(obj, key: str):
+    """
+    Returns the value an attribute had before the pending change, or NO_VALUE when it was
+    changed without being loaded first (e.g. on an expired instance).
+    """
+    state = inspect(obj)
+    if key in state.committed_state:
+        return state.committed_state[key]
+    return state.dict.get(key, NO_VALUE)
+
+def _article_counters(status) -> Dict[str, int]:
+    return {
+        "published_articles_count": int(status == "publish"),
+        "draft_articles_count": int(status == "draft"),
+    }
+
+def _product_counters(in_stock) -> Dict[str, int]:
+    return {
+        "total_products_count": 1,
+        "out_of_stock_products_count": int(in_stock is False),
+    }
+
+def _track_counter_changes(session: Session, flush_context) -> None:
+    """
+    after_flush hook that turns pending article and product inserts, status / in_stock
+    changes and deletes into counter deltas. Blogs where a previous value is unknown
+    are recounted instead.
+    """
+    deltas: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    recount: Set[int] = set()
+
+    def add(blog_id, counters, sign):
+        for field, value in counters.items():
+            deltas[blog_id][field] += sign * value
+
+    for obj in session.new:
+        if isinstance(obj, Article):
+            add(obj.blog_id, _article_counters(obj.status), 1)
+        elif isinstance(obj, Product):
+            add(obj.blog_id, _product_counters(obj.in_stock), 1)
+
+    for obj in session.deleted:
+        if not isinstance(obj, (Article, Product)):
+            continue
+        blog_id = _previous_value(obj, "blog_id")
+        if blog_id is NO_VALUE:
+            continue
+        key = "status" if isinstance(obj, Article) else "in_stock"
+        previous = _previous_value(obj, key)
+        if previous is NO_VALUE:
+            recount.add(blog_id)
+        elif isinstance(obj, Article):
+            add(blog_id, _article_counters(previous), -1)
+        else:
+            add(blog_id, _product_counters(previous), -1)
 
-    total_products_count = db.query(Product).filter(Product.blog_id == blog_id).count()
+    for obj in session.dirty:
+        if not isinstance(obj, (Article, Product)):
+            continue
+        key = "status" if isinstance(obj, Article) else "in_stock"
+        if not inspect(obj).attrs[key].history.has_changes():
+            continue
+        previous = _previous_value(obj, key)
+        if previous is NO_VALUE:
+            recount.add(obj.blog_id)
+        elif isinstance(obj, Article):
+            add(obj.blog_id, _article_counters(previous), -1)
+            add(obj.blog_id, _article_counters(obj.status), 1)
+        else:
+            add(obj.blog_id, _product_counters(previous), -1)
+            add(obj.blog_id, _product_counters(obj.in_stock), 1)
 
-    out_of_stock_products_count = db.query(Product).filter(Product.blog_id == blog_id, Product.in_stock == False).count()
+    deltas = {blog_id: changes for blog_id, changes in deltas.items() if blog_id not in recount}
+    if deltas:
+        apply_counter_deltas(session, deltas)
+    if recount:
+        recount_blog_counters(session, recount)
 
-    return DashboardStatsResponse(
-        published_articles_count=published_articles_count,
-        draft_articles_count=draft_articles_count,
-        total_products_count=total_products_count,
-        out_of_stock_products_count=out_of_stock_products_count
-    )
+if DASHBOARD_COUNTERS_ENABLED:
+    event.listen(Session, "after_flush", _track_counter_changes)
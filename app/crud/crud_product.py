@@ -1,18 +1,51 @@
+import asyncio
 import csv
 from datetime import datetime, timezone
 import io
 import json
-from sqlalchemy.orm import Session
+import os
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, selectinload
 from app.models.article import Article
-from app.models.product import Product, ProductAffiliateURL, ProductSpecification, ProductPro, ProductCon, ProductImage
+from app.models.product import Product, ProductAffiliateURL, ProductSpecification, ProductImage, product_store_association
 from app.models.store import Store
 from app.schemas.article import ArticleResponse
-from app.schemas.product import ProductCreate, ProductUpdate, ProductResponse
-from typing import Any, Dict, List, Optional
-from app.scrapers.scraper_factory import scraper_factory
+from app.schemas.patch import PatchResponse
+from app.schemas.product import (
+    ProductBulkCreateResponse,
+    ProductBulkItemResult,
+    ProductCreate,
+    ProductPatch,
+    ProductResponse,
+    ProductUpdate,
+)
+from app.crud.pagination import paginate
+from app.crud.collections import sync_collection
+from app.crud.patch_fields import applied_patch_fields, nullable_columns
+from app.crud.crud_dashboard import DASHBOARD_COUNTERS_ENABLED, apply_counter_deltas
+from app.crud.search import apply_search
+from app.crud.query_options import article_response_options, product_response_options
+from typing import Any, Dict, List, Optional, Union
+from app.scrapers.scraper_factory import async_scraper_factory
 from app.services.image_metadata_service import ImageMetadataService
 from app.services.image_service import ImageService
 
+# Relationship loaded for each PATCH field that changes a collection.
+PRODUCT_PATCH_RELATIONSHIPS = {
+    "store_ids": "stores",
+    "affiliate_urls": "affiliate_urls",
+    "specifications": "specifications",
+    "pros": "pros",
+    "cons": "cons",
+    "image_urls": "images",
+}
+
+# Columns an explicit null clears in a PATCH. name is nullable in the table but required by ProductResponse.
+NULLABLE_PRODUCT_FIELDS = nullable_columns(Product, exclude=["name"])
+
+BULK_SCRAPE_CONCURRENCY = int(os.getenv("BULK_SCRAPE_CONCURRENCY", "5"))
+
 
 async def create_product(
     db: Session, 
@@ -23,7 +56,7 @@ async def create_product(
     """
     Create a new product record in the database.
     """
-    scraper = scraper_factory(str(product.affiliate_urls[0]))
+    scraper = await async_scraper_factory(str(product.affiliate_urls[0]))
     scraped_data = scraper.scrape_product_data()
 
     stores = db.query(Store).filter(Store.id.in_(product.store_ids)).all()
@@ -63,6 +96,138 @@ async def create_product(
     db.refresh(new_product)
     return ProductResponse.from_orm(new_product)
 
+async def create_products_bulk(
+    db: Session,
+    blog_id: int,
+    products: List[ProductCreate],
+    image_service: Optional[ImageService] = None,
+    concurrency: int = BULK_SCRAPE_CONCURRENCY
+    ) -> ProductBulkCreateResponse:
+    """
+    Create many products at once.
+
+    Affiliate URLs are scraped concurrently, at most `concurrency` at a time. The products that
+    scraped successfully are then inserted in one transaction, with one executemany per table
+    (products, affiliate URLs, specifications, images and store links).
+    Items that fail to scrape are reported and skipped; a failed insert rolls back the whole batch.
+
+    With an image service, the images are uploaded to WordPress only once the insert is committed,
+    so a rolled back batch leaves no orphaned media. An image whose upload fails is kept without a
+    wp_id, as in `create_product`.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def scrape(product: ProductCreate) -> Dict[str, Any]:
+        async with semaphore:
+            scraper = await async_scraper_factory(str(product.affiliate_urls[0]))
+            return scraper.scrape_product_data()
+
+    scraped = await asyncio.gather(*[scrape(product) for product in products], return_exceptions=True)
+
+    results = [
+        ProductBulkItemResult(index=index, status="failed", error=str(data))
+        for index, data in enumerate(scraped) if isinstance(data, Exception)
+    ]
+    items = [(index, products[index], data) for index, data in enumerate(scraped) if not isinstance(data, Exception)]
+
+    if items:
+        store_ids = {store_id for _, product, _ in items for store_id in product.store_ids}
+        existing_store_ids = {row.id for row in db.query(Store.id).filter(Store.id.in_(store_ids))}
+        now = datetime.now(timezone.utc)
+
+        try:
+            product_ids = db.execute(
+                insert(Product).returning(Product.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "blog_id": blog_id,
+                        "name": product.name,
+                        "seo_keyword": product.seo_keyword,
+                        "rating": product.rating,
+                        "in_stock": data.get('in_stock'),
+                        "description": data.get('description'),
+                        "full_name": data.get('full_name'),
+                        "last_checked": now,
+                    }
+                    for _, product, data in items
+                ],
+            ).scalars().all()
+
+            affiliate_rows, specification_rows, image_rows, store_rows = [], [], [], []
+            for product_id, (_, product, data) in zip(product_ids, items):
+                affiliate_rows += [{"product_id": product_id, "url": str(url)} for url in product.affiliate_urls]
+                specification_rows += [
+                    {"product_id": product_id, "spec_key": k, "spec_value": v}
+                    for k, v in data.get('specifications', {}).items()
+                ]
+                image_rows += [
+                    {"product_id": product_id, "image_url": img_url}
+                    for img_url in data.get('image_urls', [])
+                ]
+                store_rows += [
+                    {"product_id": product_id, "store_id": store_id}
+                    for store_id in dict.fromkeys(product.store_ids) if store_id in existing_store_ids
+                ]
+
+            for model, rows in [
+                (ProductAffiliateURL, affiliate_rows),
+                (ProductSpecification, specification_rows),
+                (ProductImage, image_rows),
+            ]:
+                if rows:
+                    db.execute(insert(model), rows)
+            if store_rows:
+                db.execute(product_store_association.insert(), store_rows)
+
+            if DASHBOARD_COUNTERS_ENABLED:
+                apply_counter_deltas(db, {blog_id: {
+                    "total_products_count": len(items),
+                    "out_of_stock_products_count": sum(1 for _, _, data in items if data.get('in_stock') is False),
+                }})
+
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            results += [ProductBulkItemResult(index=index, status="failed", error=str(e)) for index, _, _ in items]
+        else:
+            if image_service:
+                await upload_bulk_product_images(db, product_ids, image_service)
+            created = get_products_by_ids(db, blog_id=blog_id, product_ids=product_ids)
+            results += [
+                ProductBulkItemResult(index=index, status="created", product=product)
+                for (index, _, _), product in zip(items, created)
+            ]
+
+    results.sort(key=lambda result: result.index)
+    return ProductBulkCreateResponse(
+        created=sum(1 for result in results if result.status == "created"),
+        failed=sum(1 for result in results if result.status == "failed"),
+        results=results,
+    )
+
+async def upload_bulk_product_images(
+    db: Session,
+    product_ids: List[int],
+    image_service: ImageService
+    ) -> None:
+    """
+    Uploads the images of committed products to WordPress and stores their WordPress IDs in one commit.
+
+    Uploads run one after another: ImageService works in a single local directory that it empties
+    after every image, and renames each download to the file name set for the product, so concurrent
+    uploads would delete or overwrite each other's files.
+    """
+    products = db.query(Product).options(*product_response_options()).filter(Product.id.in_(product_ids)).all()
+
+    for product in products:
+        for image in product.images:
+            image.wp_id = await image_service.process_image(
+                entity_type="product",
+                entity=product,
+                image_url=image.image_url
+            )
+    db.commit()
+
 def get_product_by_id(
     db: Session, 
     blog_id: int,
@@ -71,11 +236,41 @@ def get_product_by_id(
     """
     Retrieve a product by its ID.
     """
-    product = db.query(Product).filter(Product.id == product_id, Product.blog_id == blog_id).first()
+    product = (
+        db.query(Product)
+        .options(*product_response_options())
+        .filter(Product.id == product_id, Product.blog_id == blog_id)
+        .first()
+    )
     if product:
         return ProductResponse.from_orm(product)
     return None
 
+def get_products_by_ids(
+    db: Session,
+    blog_id: int,
+    product_ids: List[int]
+    ) -> List[ProductResponse]:
+    """
+    Retrieve several products by their IDs in one round of queries, keeping the order of `product_ids`.
+    IDs that do not exist in the blog are skipped.
+    """
+    if not product_ids:
+        return []
+
+    products = (
+        db.query(Product)
+        .options(*product_response_options())
+        .filter(Product.id.in_(product_ids), Product.blog_id == blog_id)
+        .all()
+    )
+    products_by_id = {product.id: product for product in products}
+    return [
+        ProductResponse.from_orm(products_by_id[product_id])
+        for product_id in product_ids
+        if product_id in products_by_id
+    ]
+
 def get_products(
     db: Session, 
     blog_id: int,
@@ -83,40 +278,44 @@ def get_products(
     limit: int = 10, 
     sort_field: Optional[str] = None,
     sort_order: Optional[int] = None,
-    filter: Optional[str] = None
+    filter: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: str = "exact"
 ) -> dict:
     """
     Retrieve a list of products, with pagination support, sorting, filtering, and total records.
+    Passing `cursor` switches to keyset pagination and adds `next_cursor` to the result.
     """
     query = db.query(Product).filter(Product.blog_id == blog_id)
 
     if filter:
-        filter_pattern = f"%{filter}%"
-        query = query.filter(
-            Product.name.ilike(filter_pattern) |
-            Product.seo_keyword.ilike(filter_pattern)
-        )
-
-    if sort_field:
-        if sort_order == -1:
-            query = query.order_by(getattr(Product, sort_field).desc())
-        else:
-            query = query.order_by(getattr(Product, sort_field).asc())
+        query = apply_search(query, Product, filter, rank=not sort_field and cursor is None)
 
-    total_records = query.count()
-    products = query.offset(skip).limit(limit).all()
+    query = query.options(*product_response_options())
+    page = paginate(query, Product, skip, limit, sort_field, sort_order, cursor, count)
 
-    return {
-        "products": [ProductResponse.from_orm(product) for product in products],
-        "total_records": total_records
+    result = {
+        "products": [ProductResponse.from_orm(product) for product in page.items],
+        "total_records": page.total_records
     }
+    if cursor is not None:
+        result["next_cursor"] = page.next_cursor
+    return result
 
 
 def get_out_of_stock_products_with_articles(db: Session, blog_id: int) -> List[Dict[str, Any]]:
     """
     Retrieve products that are out of stock and the articles they are part of.
     """
-    out_of_stock_products = db.query(Product).filter(Product.blog_id == blog_id, Product.in_stock == False).all()
+    out_of_stock_products = (
+        db.query(Product)
+        .options(
+            *product_response_options(),
+            selectinload(Product.articles).options(*article_response_options())
+        )
+        .filter(Product.blog_id == blog_id, Product.in_stock == False)
+        .all()
+    )
     result = []
 
     for product in out_of_stock_products:
@@ -143,8 +342,76 @@ async def update_product(
     if not product:
         return None
 
-    update_data = product_update.model_dump()
+    apply_product_changes(db, product, product_update.model_dump())
+
+    if image_service:
+        for img_obj in product.images:
+            wp_id = await image_service.process_image(
+                    entity_type="product",
+                    entity=product,
+                    image_url=img_obj.image_url
+                )
+            img_obj.wp_id = wp_id
 
+    db.commit()
+    db.refresh(product)
+    return ProductResponse.from_orm(product)
+
+async def patch_product(
+    db: Session,
+    blog_id: int,
+    product_id: int,
+    product_patch: ProductPatch,
+    image_service: Optional[ImageService] = None,
+    minimal: bool = False
+    ) -> Optional[Union[ProductResponse, PatchResponse]]:
+    """
+    Partially update a product: only the fields present in the request body are changed,
+    and only the relationships behind those fields are loaded.
+
+    An explicit null clears a nullable column (NULLABLE_PRODUCT_FIELDS); for any other field it
+    is ignored and not reported as updated. With an image service, only newly added images are uploaded.
+
+    :param minimal: Return a PatchResponse instead of reloading the full product.
+    """
+    patch_data = applied_patch_fields(product_patch.model_dump(exclude_unset=True), NULLABLE_PRODUCT_FIELDS)
+    relationships = [PRODUCT_PATCH_RELATIONSHIPS[field] for field in patch_data if field in PRODUCT_PATCH_RELATIONSHIPS]
+
+    product = (
+        db.query(Product)
+        .options(*[selectinload(getattr(Product, relationship)) for relationship in relationships])
+        .filter(Product.id == product_id, Product.blog_id == blog_id)
+        .first()
+    )
+    if not product:
+        return None
+
+    for attr, value in patch_data.items():
+        if value is None:
+            setattr(product, attr, None)
+
+    apply_product_changes(db, product, patch_data)
+
+    if image_service and patch_data.get('image_urls') is not None:
+        for img_obj in product.images:
+            if img_obj.wp_id is None and img_obj not in db.deleted:
+                img_obj.wp_id = await image_service.process_image(
+                    entity_type="product",
+                    entity=product,
+                    image_url=img_obj.image_url
+                )
+
+    db.commit()
+
+    if minimal:
+        return PatchResponse(id=product_id, blog_id=blog_id, updated_fields=sorted(patch_data))
+    return get_product_by_id(db, blog_id=blog_id, product_id=product_id)
+
+def apply_product_changes(db: Session, product: Product, update_data: Dict[str, Any]) -> None:
+    """
+    Applies the non-null fields of `update_data` to a product, syncing its child collections.
+    Does not commit.
+    """
     for attr in ["in_stock", "full_name", "description", "review", "name", "seo_keyword", "rating"]:
         if attr in update_data and update_data[attr] is not None:
             setattr(product, attr, update_data[attr])
@@ -154,21 +421,19 @@ async def update_product(
             product.stores = stores
 
     if 'affiliate_urls' in update_data and update_data['affiliate_urls'] is not None:
-            product.affiliate_urls.clear()
-            product.affiliate_urls = [ProductAffiliateURL(url=str(url)) for url in update_data['affiliate_urls']]
+            sync_collection(db, product, "affiliate_urls", [{"url": str(url)} for url in update_data['affiliate_urls']])
 
     if 'specifications' in update_data and update_data['specifications'] is not None:
-            product.specifications.clear()
-            product.specifications = [
-                ProductSpecification(spec_key=k, spec_value=v) for k, v in update_data['specifications'].items()]
+            sync_collection(
+                db, product, "specifications",
+                [{"spec_key": k, "spec_value": v} for k, v in update_data['specifications'].items()],
+                key="spec_key")
              
     if 'pros' in update_data and update_data['pros'] is not None:
-            product.pros.clear()
-            product.pros = [ProductPro(text=pro) for pro in update_data['pros']]
+            sync_collection(db, product, "pros", [{"text": pro} for pro in update_data['pros']])
 
     if 'cons' in update_data and update_data['cons'] is not None:
-            product.cons.clear()
-            product.cons = [ProductCon(text=con) for con in update_data['cons']]
+            sync_collection(db, product, "cons", [{"text": con} for con in update_data['cons']])
 
     if 'image_urls' in update_data and update_data['image_urls'] is not None:
         new_image_urls = set(
@@ -185,20 +450,6 @@ async def update_product(
             if existing_url not in new_image_urls:
                 db.delete(img_obj)
 
-
-    if image_service:
-        for img_obj in product.images:
-            wp_id = await image_service.process_image(
-                    entity_type="product",
-                    entity=product,
-                    image_url=img_obj.image_url
-                )
-            img_obj.wp_id = wp_id
-
-    db.commit()
-    db.refresh(product)
-    return ProductResponse.from_orm(product)
-
 def delete_product(
     db: Session, 
     blog_id: int,
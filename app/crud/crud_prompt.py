@@ -7,6 +7,8 @@ from app.models.prompt import Prompt
 from app.schemas.prompt import PromptCreate, PromptUpdate, PromptResponse
 from typing import Dict, List, Optional
 from app.services.markdown_service import MarkdownService
+from app.crud.pagination import paginate
+from app.crud.search import apply_search
 
 def create_prompt(db: Session, blog_id: int, prompt: PromptCreate) -> PromptResponse:
     prompt_data = prompt.model_dump()
@@ -30,32 +32,24 @@ def get_prompts(
     limit: int = 10, 
     sort_field: Optional[str] = None,
     sort_order: Optional[int] = None,
-    filter: Optional[str] = None
+    filter: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: str = "exact"
 ) -> dict:
     query = db.query(Prompt).filter(Prompt.blog_id == blog_id)
 
     if filter:
-        filter_pattern = f"%{filter}%"
-        query = query.filter(
-            Prompt.name.ilike(filter_pattern) |
-            Prompt.type.ilike(filter_pattern) |
-            Prompt.subtype.ilike(filter_pattern) |
-            Prompt.text.ilike(filter_pattern)
-        )
+        query = apply_search(query, Prompt, filter, rank=not sort_field and cursor is None)
 
-    if sort_field:
-        if sort_order == -1:
-            query = query.order_by(getattr(Prompt, sort_field).desc())
-        else:
-            query = query.order_by(getattr(Prompt, sort_field).asc())
+    page = paginate(query, Prompt, skip, limit, sort_field, sort_order, cursor, count)
 
-    total_records = query.count()
-    prompts = query.offset(skip).limit(limit).all()
-
-    return {
-        "prompts": [PromptResponse.model_validate(prompt) for prompt in prompts],
-        "total_records": total_records
+    result = {
+        "prompts": [PromptResponse.model_validate(prompt) for prompt in page.items],
+        "total_records": page.total_records
     }
+    if cursor is not None:
+        result["next_cursor"] = page.next_cursor
+    return result
 
 def update_prompt(db: Session, blog_id: int, prompt_id: int, prompt_update: PromptUpdate) -> Optional[PromptResponse]:
     prompt = db.query(Prompt).filter(Prompt.id == prompt_id, Prompt.blog_id == blog_id).first()
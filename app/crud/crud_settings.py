@@ -1,8 +1,12 @@
-from typing import Optional
+from typing import List, Optional
+from sqlalchemy import insert, select, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
-from app.models.settings import Setting
+from app.models.settings import Setting, SettingsVersion
 from app.schemas.settings import SettingBase, SettingCreate, SettingUpdate, SettingResponse
 
+SETTINGS_NOTIFY_CHANNEL = "settings_changed"
+
 def get_setting_by_key(db: Session, key: str) -> Optional[SettingResponse]:
     """
     Returns a setting by its key.
@@ -19,6 +23,35 @@ def get_all_settings(db: Session) -> list[SettingResponse]:
     settings = db.query(Setting).all()
     return [SettingResponse.model_validate(s) for s in settings]
 
+def get_settings_by_prefix(db: Session, prefix: str) -> list[SettingResponse]:
+    """
+    Returns all settings whose key starts with `prefix` followed by a dot, e.g. "images.product".
+    """
+    settings = db.query(Setting).filter(Setting.key.startswith(f"{prefix}.", autoescape=True)).all()
+    return [SettingResponse.model_validate(s) for s in settings]
+
+def get_settings_version(db: Session) -> int:
+    """
+    Returns the current settings version, which is bumped by every settings change.
+    """
+    version = db.query(SettingsVersion.version).filter(SettingsVersion.id == 1).scalar()
+    return version or 0
+
+def bump_settings_version(db: Session) -> None:
+    """
+    Increments the settings version in the current transaction so that other workers
+    refresh their cached settings. On PostgreSQL it also notifies SETTINGS_NOTIFY_CHANNEL,
+    which is delivered to listeners when the transaction commits. Does not commit.
+    """
+    updated = db.query(SettingsVersion).filter(SettingsVersion.id == 1).update(
+        {SettingsVersion.version: SettingsVersion.version + 1},
+        synchronize_session=False
+    )
+    if not updated:
+        db.add(SettingsVersion(id=1, version=1))
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SELECT pg_notify(:channel, '')"), {"channel": SETTINGS_NOTIFY_CHANNEL})
+
 def create_setting(db: Session, setting: SettingCreate) -> SettingResponse:
     """
     Creates a new setting.
@@ -32,10 +65,43 @@ def create_setting(db: Session, setting: SettingCreate) -> SettingResponse:
         description=setting.description,
     )
     db.add(new_setting)
+    bump_settings_version(db)
     db.commit()
     db.refresh(new_setting)
     return SettingResponse.model_validate(new_setting)
 
+def create_missing_settings(db: Session, settings: List[SettingCreate]) -> int:
+    """
+    Inserts the settings whose key does not exist yet with one statement and a single commit.
+    Existing settings are left untouched. Returns the number of inserted settings.
+    """
+    for setting in settings:
+        SettingBase.validate_value(setting.type, setting.value)
+
+    rows = [
+        {"key": s.key, "value": str(s.value), "type": s.type, "description": s.description}
+        for s in settings
+    ]
+    if not rows:
+        return 0
+
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        statement = dialect_insert(Setting).values(rows).on_conflict_do_nothing(index_elements=[Setting.key])
+    else:
+        existing = set(db.scalars(select(Setting.key).where(Setting.key.in_([row["key"] for row in rows]))))
+        rows = [row for row in rows if row["key"] not in existing]
+        if not rows:
+            return 0
+        statement = insert(Setting).values(rows)
+
+    inserted = db.execute(statement).rowcount
+    if inserted:
+        bump_settings_version(db)
+    db.commit()
+    return inserted
+
 def update_setting(db: Session, key: str, setting_update: SettingUpdate) -> Optional[SettingResponse]:
     """
     Updates a setting by its key.
@@ -45,6 +111,7 @@ def update_setting(db: Session, key: str, setting_update: SettingUpdate) -> Opti
         SettingBase.validate_value(setting.type, setting_update.value)
         
         setting.value = str(setting_update.value)
+        bump_settings_version(db)
         db.commit()
         db.refresh(setting)
         return SettingResponse.model_validate(setting)
@@ -57,6 +124,7 @@ def delete_setting(db: Session, key: str) -> Optional[SettingResponse]:
     setting = db.query(Setting).filter(Setting.key == key).first()
     if setting:
         db.delete(setting)
+        bump_settings_version(db)
         db.commit()
         return SettingResponse.model_validate(setting)
     return None
@@ -6,6 +6,8 @@ from sqlalchemy.orm import Session
 from app.models.store import Store
 from app.schemas.stores import StoreCreate, StoreUpdate, StoreResponse
 from app.services.image_service import ImageService
+from app.crud.pagination import paginate
+from app.crud.search import apply_search
 
 
 async def create_store(
@@ -59,7 +61,9 @@ def get_stores(
     limit: int = 10,
     sort_field: Optional[str] = None,
     sort_order: Optional[int] = None,
-    filter: Optional[str] = None
+    filter: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: str = "exact"
 ) -> Dict[str, Any]:
     """
     Retrieves a list of stores for the given blog_id, with pagination, 
@@ -72,32 +76,24 @@ def get_stores(
     :param sort_field: The field by which to sort results.
     :param sort_order: -1 for DESC, otherwise ASC.
     :param filter: A string to filter the stores (by name or base_url).
-    :return: A dictionary containing 'stores' (list) and 'total_records'.
+    :param cursor: Opaque keyset cursor; an empty string requests the first page in cursor mode.
+    :param count: How to compute 'total_records': 'exact', 'estimated' or 'none'.
+    :return: A dictionary containing 'stores' (list), 'total_records' and, in cursor mode, 'next_cursor'.
     """
     query = db.query(Store).filter(Store.blog_id == blog_id)
 
     if filter:
-        filter_pattern = f"%{filter}%"
-        query = query.filter(
-            (Store.name.ilike(filter_pattern)) |
-            (Store.base_url.ilike(filter_pattern))
-        )
-
-    if sort_field:
-        field_attr = getattr(Store, sort_field, None)
-        if field_attr:
-            if sort_order == -1:
-                query = query.order_by(field_attr.desc())
-            else:
-                query = query.order_by(field_attr.asc())
+        query = apply_search(query, Store, filter, rank=not sort_field and cursor is None)
 
-    total_records = query.count()
-    stores = query.offset(skip).limit(limit).all()
+    page = paginate(query, Store, skip, limit, sort_field, sort_order, cursor, count)
 
-    return {
-        "stores": [StoreResponse.model_validate(s) for s in stores],
-        "total_records": total_records
+    result = {
+        "stores": [StoreResponse.model_validate(s) for s in page.items],
+        "total_records": page.total_records
     }
+    if cursor is not None:
+        result["next_cursor"] = page.next_cursor
+    return result
 
 
 def get_store_by_id(
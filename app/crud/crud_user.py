@@ -1,15 +1,56 @@
+import os
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import Session
 from app.models.user import User
 from app.schemas.user import UserCreate, UserBase
+from app.core.cache import TTLCache
 from app.core.security import get_password_hash
 from typing import Optional
 
+# Resolved users are cached by email for USER_CACHE_TTL seconds (0 disables the cache).
+# Changes made through the ORM invalidate the entry right away; changes made by another
+# process or outside the ORM are picked up once the entry expires.
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "1024"))
+
+user_cache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+
 def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
+def get_cached_user_by_email(db: Session, email: str) -> Optional[User]:
+    """
+    Returns the user with the given email from the user cache, loading it on a miss.
+    The returned user is a detached copy that is not bound to `db`; unknown emails are not cached.
+    """
+    user = user_cache.get(email)
+    if user is not None:
+        return user
+
+    db_user = get_user_by_email(db, email)
+    if db_user is None:
+        return None
+
+    user = User(
+        id=db_user.id,
+        email=db_user.email,
+        hashed_password=db_user.hashed_password,
+        name=db_user.name
+    )
+    user_cache.set(email, user)
+    return user
+
+def _invalidate_cached_user(mapper, connection, target: User) -> None:
+    history = inspect(target).attrs.email.history
+    for email in {target.email, *history.deleted}:
+        user_cache.invalidate(email)
+
+event.listen(User, "after_update", _invalidate_cached_user)
+event.listen(User, "after_delete", _invalidate_cached_user)
+
 def create_user(db: Session, user_data: UserCreate) -> User:
     hashed_pw = get_password_hash(user_data.password)
     db_user = User(
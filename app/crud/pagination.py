@@ -0,0 +1,175 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, NamedTuple, Optional
+from sqlalchemy import and_, or_, text
+from sqlalchemy.orm import Query
+
+COUNT_MODES = ("exact", "estimated", "none")
+
+
+class Page(NamedTuple):
+    items: List[Any]
+    total_records: Optional[int]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(sort_field: str, sort_order: int, value: Any, record_id: int) -> str:
+    """
+    Builds an opaque cursor from the sort field and the (value, id) pair of the last returned row.
+    """
+    payload = {"f": sort_field, "o": sort_order, "v": value, "id": record_id}
+    if isinstance(value, datetime):
+        payload["v"] = value.isoformat()
+        payload["t"] = "datetime"
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """
+    Decodes a cursor produced by `encode_cursor`.
+    Raises ValueError if the cursor has been tampered with or is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(payload, dict):
+            raise ValueError
+        if payload.get("t") == "datetime":
+            payload["v"] = datetime.fromisoformat(payload["v"])
+        if not isinstance(payload["f"], str) or not isinstance(payload["id"], int):
+            raise ValueError
+        return payload
+    except (binascii.Error, json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def count_records(query: Query, count: str = "exact") -> Optional[int]:
+    """
+    Counts the rows matched by `query` according to the requested count mode:
+    - exact: a full COUNT(*)
+    - estimated: the planner's row estimate on PostgreSQL, an exact count elsewhere
+    - none: skip counting entirely
+    """
+    if count not in COUNT_MODES:
+        raise ValueError(f"Unsupported count mode: {count}. Use one of: {', '.join(COUNT_MODES)}")
+    if count == "none":
+        return None
+    if count == "estimated":
+        estimate = estimate_count(query)
+        if estimate is not None:
+            return estimate
+    return query.count()
+
+
+def estimate_count(query: Query) -> Optional[int]:
+    """
+    Returns the PostgreSQL planner's row estimate for `query`, or None if it cannot be obtained.
+    """
+    bind = query.session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+
+    statement = query.statement.compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True})
+    plan = query.session.execute(text(f"EXPLAIN (FORMAT JSON) {statement}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError):
+        return None
+
+
+def apply_sorting(query: Query, model, sort_field: Optional[str], sort_order: Optional[int]) -> Query:
+    """
+    Orders the query by `sort_field` (-1 for DESC, otherwise ASC). Unknown fields are ignored.
+    """
+    if sort_field:
+        field_attr = getattr(model, sort_field, None)
+        if field_attr is not None:
+            if sort_order == -1:
+                query = query.order_by(field_attr.desc())
+            else:
+                query = query.order_by(field_attr.asc())
+    return query
+
+
+def paginate(
+    query: Query,
+    model,
+    skip: int = 0,
+    limit: int = 10,
+    sort_field: Optional[str] = None,
+    sort_order: Optional[int] = None,
+    cursor: Optional[str] = None,
+    count: str = "exact"
+) -> Page:
+    """
+    Paginates an already filtered query.
+
+    With `cursor=None` the classic skip/limit mode is used. Passing a cursor (an empty string for
+    the first page) switches to keyset mode: rows are ordered by (sort_field, id) and the next page
+    starts right after the last returned row, so deep pages cost the same as the first one.
+    """
+    total_records = count_records(query, count)
+
+    if cursor is None:
+        query = apply_sorting(query, model, sort_field, sort_order)
+        return Page(query.offset(skip).limit(limit).all(), total_records, None)
+
+    return _keyset_page(query, model, limit, sort_field or "id", -1 if sort_order == -1 else 1, cursor, total_records)
+
+
+def _keyset_page(
+    query: Query,
+    model,
+    limit: int,
+    sort_field: str,
+    sort_order: int,
+    cursor: str,
+    total_records: Optional[int]
+) -> Page:
+    sort_attr = getattr(model, sort_field, None)
+    if sort_attr is None or not hasattr(sort_attr, "desc"):
+        raise ValueError(f"Cannot sort by unknown field: {sort_field}")
+    id_attr = model.id
+    descending = sort_order == -1
+
+    if cursor:
+        position = decode_cursor(cursor)
+        if position["f"] != sort_field or position["o"] != sort_order:
+            raise ValueError("Cursor does not match the requested sort_field and sort_order")
+        query = query.filter(_after_position(sort_attr, id_attr, position["v"], position["id"], descending, sort_field == "id"))
+
+    if sort_field == "id":
+        query = query.order_by(id_attr.desc() if descending else id_attr.asc())
+    elif descending:
+        query = query.order_by(sort_attr.desc().nulls_last(), id_attr.desc())
+    else:
+        query = query.order_by(sort_attr.asc().nulls_last(), id_attr.asc())
+
+    rows = query.limit(limit + 1).all()
+    items = rows[:limit]
+
+    next_cursor = None
+    if len(rows) > limit and items:
+        last = items[-1]
+        next_cursor = encode_cursor(sort_field, sort_order, getattr(last, sort_field), last.id)
+
+    return Page(items, total_records, next_cursor)
+
+
+def _after_position(sort_attr, id_attr, value: Any, record_id: int, descending: bool, sort_by_id: bool):
+    """
+    Builds the WHERE clause selecting rows strictly after (value, record_id), with NULLs sorted last.
+    """
+    id_after = id_attr < record_id if descending else id_attr > record_id
+    if sort_by_id:
+        return id_after
+    if value is None:
+        return and_(sort_attr.is_(None), id_after)
+
+    value_after = sort_attr < value if descending else sort_attr > value
+    return or_(value_after, and_(sort_attr == value, id_after), sort_attr.is_(None))
@@ -0,0 +1,24 @@
+from typing import Any, Dict, Iterable, Set
+from sqlalchemy import inspect
+
+
+def nullable_columns(model: Any, exclude: Iterable[str] = ()) -> Set[str]:
+    """
+    Returns the attributes of a model that a PATCH may clear with an explicit null: its nullable
+    columns, without primary and foreign keys.
+
+    :param model: The mapped class (e.g. Product).
+    :param exclude: Nullable columns that the API still requires, e.g. because the response schema does.
+    """
+    return {
+        attribute.key for attribute in inspect(model).column_attrs
+        if all(column.nullable and not column.primary_key and not column.foreign_keys for column in attribute.columns)
+    } - set(exclude)
+
+
+def applied_patch_fields(patch_data: Dict[str, Any], nullable: Set[str]) -> Dict[str, Any]:
+    """
+    Returns the fields of a PATCH body that are applied: every non-null value, and nulls only
+    for the `nullable` columns. Nulls for required columns and child lists are dropped.
+    """
+    return {key: value for key, value in patch_data.items() if value is not None or key in nullable}
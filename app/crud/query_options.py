@@ -0,0 +1,36 @@
+from typing import Tuple
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+from app.models.article import Article
+from app.models.product import Product
+
+
+def product_response_options() -> Tuple[LoaderOption, ...]:
+    """
+    Loader options covering every relationship read by ProductResponse.from_orm.
+
+    Each collection is fetched with one SELECT ... WHERE product_id IN (...) per query,
+    so the number of statements stays constant regardless of how many products are loaded.
+    """
+    return (
+        selectinload(Product.stores),
+        selectinload(Product.affiliate_urls),
+        selectinload(Product.specifications),
+        selectinload(Product.images),
+        selectinload(Product.pros),
+        selectinload(Product.cons),
+    )
+
+
+def article_response_options() -> Tuple[LoaderOption, ...]:
+    """
+    Loader options covering every relationship read by ArticleResponse.from_orm.
+
+    Linked products are only needed for their IDs, so the rest of their columns are not loaded.
+    """
+    return (
+        selectinload(Article.categories),
+        selectinload(Article.seo_keywords),
+        selectinload(Article.faqs),
+        selectinload(Article.products).load_only(Product.id),
+    )
@@ -0,0 +1,72 @@
+from typing import Dict, List, Tuple
+from sqlalchemy import func, literal_column, or_
+from sqlalchemy.orm import Query
+from app.models.article import Article
+from app.models.product import Product
+from app.models.prompt import Prompt
+from app.models.store import Store
+
+TS_CONFIG = "simple"
+
+# Columns matched as a case-insensitive substring (ILIKE '%term%'). On PostgreSQL each one
+# has a pg_trgm GIN index, which also serves the relevance ranking.
+TRIGRAM_FIELDS: Dict[type, Tuple] = {
+    Product: (Product.name, Product.seo_keyword),
+    Article: (Article.title, Article.slug),
+    Store: (Store.name, Store.base_url),
+    Prompt: (Prompt.name, Prompt.type, Prompt.subtype, Prompt.text),
+}
+
+# Low-cardinality columns, also matched as a case-insensitive substring but neither indexed
+# nor ranked: the blog_id filter (ix_articles_blog_id_status) already narrows them down.
+UNINDEXED_FIELDS: Dict[type, Tuple] = {
+    Article: (Article.status,),
+}
+
+# Long text bodies that PostgreSQL also matches with full-text search, through the
+# `search_vector` tsvector column generated by the migrations. The ILIKE match on the same
+# column (see TRIGRAM_FIELDS) still catches partial words that the full-text search misses.
+FULL_TEXT_FIELDS: Dict[type, Tuple] = {
+    Prompt: (Prompt.text,),
+}
+
+
+def search_conditions(model, term: str, dialect_name: str) -> Tuple[List, List]:
+    """
+    Returns the filter conditions matching `term` on `model` and, on PostgreSQL, the
+    relevance terms to order them by.
+
+    Every database matches the same substrings. PostgreSQL additionally matches the
+    FULL_TEXT_FIELDS with websearch_to_tsquery and ranks them with ts_rank.
+    """
+    trigram_fields = TRIGRAM_FIELDS[model]
+    pattern = f"%{term}%"
+
+    conditions = [field.ilike(pattern) for field in trigram_fields + UNINDEXED_FIELDS.get(model, ())]
+    if dialect_name != "postgresql":
+        return conditions, []
+
+    rank_terms = [func.similarity(field, term) for field in trigram_fields]
+    if FULL_TEXT_FIELDS.get(model):
+        search_vector = literal_column(f"{model.__tablename__}.search_vector")
+        ts_query = func.websearch_to_tsquery(TS_CONFIG, term)
+        conditions.append(search_vector.op("@@")(ts_query))
+        rank_terms.append(func.ts_rank(search_vector, ts_query))
+    return conditions, rank_terms
+
+
+def apply_search(query: Query, model, term: str, rank: bool = False) -> Query:
+    """
+    Filters `query` to the rows of `model` matching the search term: a substring of any
+    TRIGRAM_FIELDS or UNINDEXED_FIELDS column or, on PostgreSQL, a full-text match of a
+    FULL_TEXT_FIELDS column.
+
+    On PostgreSQL the substring matches are backed by pg_trgm GIN indexes and results can be
+    ordered by relevance. Other databases run the same substring filter without ranking.
+    """
+    conditions, rank_terms = search_conditions(model, term, query.session.get_bind().dialect.name)
+
+    query = query.filter(or_(*conditions))
+    if rank and rank_terms:
+        query = query.order_by(func.greatest(*rank_terms).desc(), model.id.asc())
+    return query
@@ -1,27 +1,127 @@
-from contextlib import contextmanager
-from typing import Generator
-from fastapi import HTTPException, status
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, Optional, TypeVar, Union
+from fastapi import Depends, HTTPException, status
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 import os
 from dotenv import load_dotenv
 from sqlalchemy.exc import OperationalError
+from app.core.db_pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
+from app.core.sql_instrumentation import SQL_INSTRUMENTATION_ENABLED, install_sql_instrumentation
 
 load_dotenv()
 
+T = TypeVar("T")
+
 SQLALCHEMY_DATABASE_URL = os.getenv("SQLALCHEMY_DATABASE_URL")
+SQLALCHEMY_READ_REPLICA_URL = os.getenv("SQLALCHEMY_READ_REPLICA_URL")
+SQLALCHEMY_ASYNC_ENABLED = os.getenv("SQLALCHEMY_ASYNC_ENABLED", "false").lower() in ["true", "1", "yes"]
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+SQLALCHEMY_POOL_SIZE = int(os.getenv("SQLALCHEMY_POOL_SIZE", "5"))
+SQLALCHEMY_MAX_OVERFLOW = int(os.getenv("SQLALCHEMY_MAX_OVERFLOW", "10"))
+SQLALCHEMY_POOL_TIMEOUT = float(os.getenv("SQLALCHEMY_POOL_TIMEOUT", "30"))
+
+
+def get_pool_options(database_url: str, poolclass: type) -> Dict[str, Any]:
+    """
+    Returns the pool arguments for `create_engine` / `create_async_engine`.
+    In-memory SQLite keeps SQLAlchemy's default single-connection pool.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": SQLALCHEMY_POOL_SIZE,
+        "max_overflow": SQLALCHEMY_MAX_OVERFLOW,
+        "pool_timeout": SQLALCHEMY_POOL_TIMEOUT,
+    }
+
+
+def create_database_engine(database_url: str):
+    """
+    Creates a sync engine with the shared pool settings and, if enabled, SQL instrumentation.
+    """
+    database_engine = create_engine(
+        database_url,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        echo=False,
+        **get_pool_options(database_url, InstrumentedQueuePool))
+    if SQL_INSTRUMENTATION_ENABLED:
+        install_sql_instrumentation(database_engine)
+    return database_engine
+
+
+def create_async_database_engine(database_url: str):
+    """
+    Creates an async engine with the shared pool settings and, if enabled, SQL instrumentation.
+    """
+    database_engine = create_async_engine(
+        database_url,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        echo=False,
+        **get_pool_options(database_url, InstrumentedAsyncAdaptedQueuePool))
+    if SQL_INSTRUMENTATION_ENABLED:
+        install_sql_instrumentation(database_engine)
+    return database_engine
+
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=1800,
-    echo=False)
+engine = create_database_engine(SQLALCHEMY_DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+
+def get_async_database_url(database_url: str, explicit_url: Optional[str] = None) -> str:
+    """
+    Returns the URL used by an async engine: `explicit_url` if given,
+    otherwise `database_url` with its driver swapped for the matching async driver.
+    """
+    if explicit_url:
+        return explicit_url
+
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend: {backend}")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+async_engine = None
+AsyncSessionLocal: Optional[async_sessionmaker] = None
+
+if SQLALCHEMY_ASYNC_ENABLED:
+    async_engine = create_async_database_engine(
+        get_async_database_url(SQLALCHEMY_DATABASE_URL, os.getenv("SQLALCHEMY_ASYNC_DATABASE_URL")))
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+# Optional read replica for read-only endpoints. Without it, reads use the primary sessions above.
+read_engine = None
+ReadSessionLocal: Optional[sessionmaker] = None
+async_read_engine = None
+AsyncReadSessionLocal: Optional[async_sessionmaker] = AsyncSessionLocal
+
+if SQLALCHEMY_READ_REPLICA_URL:
+    read_engine = create_database_engine(SQLALCHEMY_READ_REPLICA_URL)
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+    if SQLALCHEMY_ASYNC_ENABLED:
+        async_read_engine = create_async_database_engine(get_async_database_url(SQLALCHEMY_READ_REPLICA_URL))
+        AsyncReadSessionLocal = async_sessionmaker(bind=async_read_engine, autoflush=False, expire_on_commit=False)
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency that provides a database session.
@@ -36,4 +136,81 @@ def get_db() -> Generator[Session, None, None]:
             detail="Database is unavailable. Please try again later."
         )
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def get_read_db(db: Session = Depends(get_db)) -> Generator[Session, None, None]:
+    """
+    Dependency for read-only endpoints. Provides a session on the read replica when
+    SQLALCHEMY_READ_REPLICA_URL is set, and the primary session from `get_db` otherwise.
+    Anything that writes, or must see its own writes, should keep using `get_db`.
+    """
+    if ReadSessionLocal is None:
+        yield db
+        return
+
+    read_db = ReadSessionLocal()
+    try:
+        yield read_db
+    except OperationalError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database is unavailable. Please try again later."
+        )
+    finally:
+        read_db.close()
+
+
+@asynccontextmanager
+async def async_session_scope(session_factory: async_sessionmaker) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Opens an AsyncSession from `session_factory`, mapping connection errors to a 503.
+    """
+    async with session_factory() as session:
+        try:
+            yield session
+        except OperationalError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database is unavailable. Please try again later."
+            )
+
+
+async def get_async_db(db: Session = Depends(get_db)) -> AsyncGenerator[Union[AsyncSession, Session], None]:
+    """
+    Dependency that provides an AsyncSession when SQLALCHEMY_ASYNC_ENABLED is set,
+    and falls back to the regular session from `get_db` otherwise.
+    Pair it with `run_sync` (or the variants in app.crud.async_crud) so callers work with both.
+    """
+    if AsyncSessionLocal is None:
+        yield db
+        return
+
+    async with async_session_scope(AsyncSessionLocal) as session:
+        yield session
+
+
+async def get_async_read_db(db: Session = Depends(get_read_db)) -> AsyncGenerator[Union[AsyncSession, Session], None]:
+    """
+    Read-only counterpart of `get_async_db`: an AsyncSession on the replica (or the primary
+    when no replica is configured) when async is enabled, the session from `get_read_db` otherwise.
+    """
+    if AsyncReadSessionLocal is None:
+        yield db
+        return
+
+    async with async_session_scope(AsyncReadSessionLocal) as session:
+        yield session
+
+
+async def run_sync(db: Union[AsyncSession, Session], fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Runs a synchronous crud function against either kind of session.
+
+    With an AsyncSession the function runs through `AsyncSession.run_sync`, so every round trip
+    (including lazy loads) is awaited on the async driver instead of blocking the event loop.
+    With a regular Session the function is simply called.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return fn(db, *args, **kwargs)
@@ -1,9 +1,15 @@
+import hashlib
+import hmac
+import os
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, HTTPBasic, HTTPBasicCredentials
 import jwt
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from passlib.context import CryptContext  
-from app.core.jwt import decode_access_token
+from app.core.cache import TTLCache
+from app.core.jwt import SECRET_KEY, decode_access_token
+from app.crud.crud_user import get_cached_user_by_email
 from app.models.user import User
 from app.database import get_db
 
@@ -11,6 +17,23 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/login")
 security = HTTPBasic()
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Successful HTTP Basic verifications are remembered for BASIC_AUTH_CACHE_TTL seconds (0 disables),
+# so browsing the docs does not run bcrypt on every request. Entries are keyed by an HMAC of the
+# credentials, never by the plain password, and any user update or delete clears the cache.
+BASIC_AUTH_CACHE_TTL = float(os.getenv("BASIC_AUTH_CACHE_TTL", "300"))
+
+verified_credentials_cache = TTLCache(maxsize=256, ttl=BASIC_AUTH_CACHE_TTL)
+
+def _credentials_key(credentials: HTTPBasicCredentials) -> str:
+    message = f"{credentials.username}\0{credentials.password}".encode()
+    return hmac.new(SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()
+
+def _clear_verified_credentials(mapper, connection, target: User) -> None:
+    verified_credentials_cache.clear()
+
+event.listen(User, "after_update", _clear_verified_credentials)
+event.listen(User, "after_delete", _clear_verified_credentials)
+
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
@@ -24,7 +47,7 @@ def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_
     except jwt.PyJWTError:
         raise credentials_exception
 
-    user = db.query(User).filter(User.email == email).first()
+    user = get_cached_user_by_email(db, email)
     if user is None:
         raise credentials_exception
     return user
@@ -33,11 +56,17 @@ def get_current_user_basic(
     credentials: HTTPBasicCredentials = Depends(security),
     db: Session = Depends(get_db),
 ):
-    user = db.query(User).filter(User.email == credentials.username).first()
+    key = _credentials_key(credentials)
+    user = verified_credentials_cache.get(key)
+    if user is not None:
+        return user
+
+    user = get_cached_user_by_email(db, credentials.username)
     if not user or not verify_password(credentials.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Basic"},
         )
+    verified_credentials_cache.set(key, user)
     return user
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Table, Text, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, Table, Text, ForeignKey
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -6,11 +6,15 @@ article_product_association = Table(
     "article_product_association",
     Base.metadata,
     Column("article_id", Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True),
-    Column("product_id", Integer, ForeignKey("products.id", ondelete="CASCADE"), primary_key=True)
+    Column("product_id", Integer, ForeignKey("products.id", ondelete="CASCADE"), primary_key=True, index=True)
 )
 
 class Article(Base):
     __tablename__ = "articles"
+    __table_args__ = (
+        Index("ix_articles_blog_id_status", "blog_id", "status"),
+        Index("ix_articles_blog_id_id", "blog_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     blog_id = Column(Integer, ForeignKey("blogs.id", ondelete="CASCADE"), nullable=False)
@@ -45,14 +49,14 @@ class Category(Base):
     id = Column(Integer, primary_key=True, index=True)
     wp_id = Column(Integer, nullable=False)
 
-    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False, index=True)
     article = relationship("Article", back_populates="categories")
 
 class ArticleFAQ(Base):
     __tablename__ = "article_faqs"
 
     id = Column(Integer, primary_key=True, index=True)
-    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False, index=True)
     question = Column(String, nullable=False)
     answer = Column(Text, nullable=False)
 
@@ -62,7 +66,7 @@ class ArticleSEOKeyword(Base):
     __tablename__ = "article_seo_keywords"
 
     id = Column(Integer, primary_key=True, index=True)
-    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False, index=True)
     keyword = Column(String, nullable=False)
 
     article = relationship("Article", back_populates="seo_keywords")
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, ForeignKey, Integer
+from app.database import Base
+
+class BlogCounters(Base):
+    __tablename__ = "blog_counters"
+
+    blog_id = Column(Integer, ForeignKey("blogs.id", ondelete="CASCADE"), primary_key=True)
+    published_articles_count = Column(Integer, nullable=False, default=0)
+    draft_articles_count = Column(Integer, nullable=False, default=0)
+    total_products_count = Column(Integer, nullable=False, default=0)
+    out_of_stock_products_count = Column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, Integer, String, Text, Float, Boolean, ForeignKey, Table
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, Float, Boolean, ForeignKey, Table
 from sqlalchemy.orm import relationship
 from app.database import Base
 from datetime import datetime, timezone
@@ -7,11 +7,15 @@ product_store_association = Table(
     "product_store_association",
     Base.metadata,
     Column("product_id", Integer, ForeignKey("products.id", ondelete="CASCADE"), primary_key=True),
-    Column("store_id", Integer, ForeignKey("stores.id", ondelete="CASCADE"), primary_key=True)
+    Column("store_id", Integer, ForeignKey("stores.id", ondelete="CASCADE"), primary_key=True, index=True)
 )
 
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        Index("ix_products_blog_id_in_stock", "blog_id", "in_stock"),
+        Index("ix_products_blog_id_last_checked", "blog_id", "last_checked"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     blog_id = Column(Integer, ForeignKey("blogs.id", ondelete="CASCADE"), nullable=False)
@@ -37,7 +41,7 @@ class ProductAffiliateURL(Base):
     __tablename__ = "product_affiliate_urls"
 
     id = Column(Integer, primary_key=True, index=True)
-    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False, index=True)
     url = Column(String, nullable=False)
 
     product = relationship("Product", back_populates="affiliate_urls")
@@ -46,7 +50,7 @@ class ProductSpecification(Base):
     __tablename__ = "product_specifications"
 
     id = Column(Integer, primary_key=True, index=True)
-    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False, index=True)
     spec_key = Column(String, nullable=False)
     spec_value = Column(String, nullable=False)
 
@@ -56,7 +60,7 @@ class ProductImage(Base):
     __tablename__ = "product_images"
 
     id = Column(Integer, primary_key=True, index=True)
-    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False, index=True)
     image_url = Column(String, nullable=False)
     wp_id = Column(Integer, nullable=True)
 
@@ -66,7 +70,7 @@ class ProductPro(Base):
     __tablename__ = "product_pros"
 
     id = Column(Integer, primary_key=True, index=True)
-    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False, index=True)
     text = Column(String, nullable=False)
 
     product = relationship("Product", back_populates="pros")
@@ -75,7 +79,7 @@ class ProductCon(Base):
     __tablename__ = "product_cons"
 
     id = Column(Integer, primary_key=True, index=True)
-    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False, index=True)
     text = Column(String, nullable=False)
 
     product = relationship("Product", back_populates="cons")
\ No newline at end of file
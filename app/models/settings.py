@@ -9,3 +9,9 @@ class Setting(Base):
     value = Column(Text, nullable=True)
     type = Column(String, nullable=False)
     description = Column(String, nullable=True)
+
+class SettingsVersion(Base):
+    __tablename__ = "settings_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
@@ -1,9 +1,12 @@
-from sqlalchemy import Column, ForeignKey, Integer, DateTime, Float
+from sqlalchemy import Column, ForeignKey, Index, Integer, DateTime, Float
 from app.database import Base
 from datetime import datetime, timezone
 
 class StockCheckLog(Base):
     __tablename__ = "stock_check_logs"
+    __table_args__ = (
+        Index("ix_stock_check_logs_blog_id_check_time", "blog_id", "check_time"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     blog_id = Column(Integer, ForeignKey("blogs.id", ondelete="CASCADE"), nullable=False)
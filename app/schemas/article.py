@@ -28,6 +28,27 @@ class ArticleUpdate(ArticleBase):
     faqs: Optional[List[dict]]
     conclusion: Optional[str]
 
+class ArticlePatch(BaseModel):
+    title: Optional[str] = None
+    slug: Optional[str] = None
+    categories_id_list: Optional[List[int]] = None
+    author_id: Optional[int] = None
+    status: Optional[str] = None
+    seo_keywords: Optional[List[str]] = None
+    meta_title: Optional[str] = None
+    meta_description: Optional[str] = None
+    main_image_url: Optional[HttpUrl] = None
+    buyers_guide_image_url: Optional[HttpUrl] = None
+    products_id_list: Optional[List[int]] = None
+    wp_id: Optional[int] = None
+    main_image_wp_id: Optional[int] = None
+    buyers_guide_image_wp_id: Optional[int] = None
+    content: Optional[str] = None
+    introduction: Optional[str] = None
+    buyers_guide: Optional[str] = None
+    faqs: Optional[List[dict]] = None
+    conclusion: Optional[str] = None
+
 class ArticleResponse(ArticleBase):
     id: int
     blog_id: int
@@ -54,9 +75,9 @@ class ArticleResponse(ArticleBase):
             seo_keywords=[kw.keyword for kw in article.seo_keywords],
             meta_title=article.meta_title,
             meta_description=article.meta_description,
-            main_image_url=HttpUrl(article.main_image_url),
+            main_image_url=HttpUrl(article.main_image_url) if article.main_image_url else None,
             main_image_wp_id=article.main_image_wp_id,
-            buyers_guide_image_url=HttpUrl(article.buyers_guide_image_url),
+            buyers_guide_image_url=HttpUrl(article.buyers_guide_image_url) if article.buyers_guide_image_url else None,
             buyers_guide_image_wp_id=article.buyers_guide_image_wp_id,
             products_id_list=[product.id for product in article.products],
             content=article.content,
@@ -0,0 +1,34 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+class PoolStatsResponse(BaseModel):
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    avg_wait_ms: float
+    p99_wait_ms: float
+    max_wait_ms: float
+    sample_size: int
+
+class DatabasePoolsResponse(BaseModel):
+    sync_pool: Optional[PoolStatsResponse] = None
+    async_pool: Optional[PoolStatsResponse] = None
+    read_pool: Optional[PoolStatsResponse] = None
+    async_read_pool: Optional[PoolStatsResponse] = None
+
+class ProviderHealthResponse(BaseModel):
+    provider: str
+    state: str
+    requests: int
+    error_rate: float
+    p50_latency_ms: float
+    p95_latency_ms: float
+
+class ScrapingProvidersResponse(BaseModel):
+    providers: List[ProviderHealthResponse]
+    hedge_after: float
@@ -0,0 +1,7 @@
+from typing import List
+from pydantic import BaseModel
+
+class PatchResponse(BaseModel):
+    id: int
+    blog_id: int
+    updated_fields: List[str]
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, HttpUrl
-from typing import List, Optional, Dict
+from pydantic import BaseModel, Field, HttpUrl
+from typing import List, Literal, Optional, Dict
 from app.models.product import Product
 
 class ProductBase(BaseModel):
@@ -23,6 +23,21 @@ class ProductUpdate(ProductBase):
     pros: Optional[List[str]]
     cons: Optional[List[str]]
 
+class ProductPatch(BaseModel):
+    name: Optional[str] = None
+    store_ids: Optional[List[int]] = None
+    affiliate_urls: Optional[List[HttpUrl]] = None
+    seo_keyword: Optional[str] = None
+    rating: Optional[float] = None
+    in_stock: Optional[bool] = None
+    full_name: Optional[str] = None
+    description: Optional[str] = None
+    specifications: Optional[Dict[str, str]] = None
+    image_urls: Optional[List[HttpUrl]] = None
+    review: Optional[str] = None
+    pros: Optional[List[str]] = None
+    cons: Optional[List[str]] = None
+
 class ProductResponse(ProductBase):
     id: int
     blog_id: int
@@ -59,3 +74,20 @@ class ProductResponse(ProductBase):
 
     class Config:
         from_attributes = True
+
+# Largest batch accepted by the bulk endpoint; every item is scraped within the request.
+MAX_BULK_PRODUCTS = 100
+
+class ProductBulkCreate(BaseModel):
+    products: List[ProductCreate] = Field(..., min_length=1, max_length=MAX_BULK_PRODUCTS)
+
+class ProductBulkItemResult(BaseModel):
+    index: int
+    status: Literal["created", "failed"]
+    product: Optional[ProductResponse] = None
+    error: Optional[str] = None
+
+class ProductBulkCreateResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[ProductBulkItemResult]
@@ -1,13 +1,55 @@
 from abc import ABC, abstractmethod
+import asyncio
 import os
-from bs4 import BeautifulSoup
-import requests
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+import httpx
 
+from app.scrapers.http_client import close_async_client, get_async_client, get_provider_semaphore
+from app.scrapers.page_cache import SCRAPE_CACHE_TTL, get_page_cache
+from app.scrapers.provider_health import SCRAPER_HEDGE_AFTER, provider_selector
 from app.services.settings_service import SettingsService
 
+# BeautifulSoup tree builders the scrapers are tested with. lxml is pinned in requirements.txt.
+SUPPORTED_HTML_PARSERS = ("lxml", "html.parser")
+SCRAPER_HTML_PARSER = os.getenv("SCRAPER_HTML_PARSER", "lxml")
+if SCRAPER_HTML_PARSER not in SUPPORTED_HTML_PARSERS:
+    raise ValueError(f"SCRAPER_HTML_PARSER must be one of {SUPPORTED_HTML_PARSERS}, got {SCRAPER_HTML_PARSER!r}")
+
+ParseTarget = Tuple[Optional[str], str]
+
 class BaseScraper(ABC):
-    def __init__(self, product_url: str):
+    # Getter of every field returned by scrape_product_data.
+    FIELD_GETTERS = {
+        "in_stock": "get_in_stock",
+        "description": "get_description",
+        "specifications": "get_specifications",
+        "image_urls": "get_image_urls",
+        "full_name": "get_full_name",
+    }
+
+    # Elements each field is extracted from, as (tag name or None for any tag, CSS class) pairs.
+    # When set, parsing keeps only the subtrees of the requested fields.
+    FIELD_TARGETS: Dict[str, Tuple[ParseTarget, ...]] = {}
+
+    def __init__(
+        self,
+        product_url: str,
+        page_content: Optional[BeautifulSoup] = None,
+        fields: Optional[Set[str]] = None,
+        cache_ttl: float = SCRAPE_CACHE_TTL
+    ):
+        """
+        :param product_url: The product page URL.
+        :param page_content: The already parsed page; fetched on demand by subclasses when omitted.
+        :param fields: The fields that will be scraped, all of them by default. Only their parts of the page are parsed.
+        :param cache_ttl: Maximum age in seconds of a page served from the page cache instead of the providers.
+        """
         self.product_url = product_url
+        self.page_content = page_content
+        self.fields = self.validate_fields(fields)
+        self.cache_ttl = cache_ttl
 
     @abstractmethod
     def get_full_name(self) -> str:
@@ -29,39 +71,189 @@ class BaseScraper(ABC):
     def get_image_urls(self) -> list:
         pass
 
-    def scrape_product_data(self) -> dict:
+    def scrape_product_data(self, fields: Optional[Set[str]] = None) -> dict:
         """
-        Aggregate all the product data by calling the specific methods.
+        Aggregate the product data by calling the specific methods.
+
+        :param fields: Subset of FIELD_GETTERS to return, e.g. {"in_stock"}. Defaults to the
+            fields the scraper was created with.
         """
+        fields = self.fields if fields is None else self.validate_fields(fields)
+        if not fields <= self.fields:
+            raise ValueError(f"Fields {sorted(fields - self.fields)} were not parsed for this scraper")
         return {
-            "in_stock": self.get_in_stock(),
-            "description": self.get_description(),
-            "specifications": self.get_specifications(),
-            "image_urls": self.get_image_urls(),
-            "full_name": self.get_full_name(),
+            field: getattr(self, getter)()
+            for field, getter in self.FIELD_GETTERS.items() if field in fields
         }
 
-    def _fetch_page_content(self) -> BeautifulSoup:
+    @classmethod
+    def validate_fields(cls, fields: Optional[Iterable[str]] = None) -> Set[str]:
+        """
+        Returns the requested fields as a set (all fields when None), rejecting unknown ones.
+        """
+        if fields is None:
+            return set(cls.FIELD_GETTERS)
+        fields = set(fields)
+        unknown = fields - set(cls.FIELD_GETTERS)
+        if unknown:
+            raise ValueError(f"Unknown product fields: {sorted(unknown)}")
+        return fields
+
+    @classmethod
+    def parse_targets(cls, fields: Optional[Set[str]] = None) -> Tuple[ParseTarget, ...]:
         """
-        Fetch the page content using Crawlbase with fallback for JavaScript API key.
+        Returns the elements the given fields (all by default) are extracted from.
         """
-        crawlbase_api_key = SettingsService.get_setting_value("scraping.api.crawlbase_api_key")
-        scrapingfish_api_key = SettingsService.get_setting_value("scraping.api.scrapingfish_api_key")
+        fields = cls.validate_fields(fields)
+        return tuple(
+            target
+            for field in cls.FIELD_GETTERS if field in fields
+            for target in cls.FIELD_TARGETS.get(field, ())
+        )
 
-        if not crawlbase_api_key:
+    @staticmethod
+    def matches_target(targets: Tuple[ParseTarget, ...], name: str, attrs: Optional[dict] = None) -> bool:
+        """
+        Returns whether an element is one of `targets`. Works both on raw attributes while
+        parsing (class is a string) and on parsed tags (class is a list).
+        """
+        classes = (attrs or {}).get("class") or ()
+        if isinstance(classes, str):
+            classes = classes.split()
+        return any((tag is None or tag == name) and css_class in classes for tag, css_class in targets)
+
+    @classmethod
+    def parse_page(cls, content: bytes, fields: Optional[Set[str]] = None) -> BeautifulSoup:
+        """
+        Parses a fetched page with SCRAPER_HTML_PARSER, keeping only the subtrees of the requested fields.
+        """
+        targets = cls.parse_targets(fields)
+        parse_only = SoupStrainer(lambda name, attrs=None: cls.matches_target(targets, name, attrs)) if targets else None
+        return BeautifulSoup(content, SCRAPER_HTML_PARSER, parse_only=parse_only)
+
+    @staticmethod
+    def _get_api_keys() -> Dict[str, str]:
+        api_keys = SettingsService.get_settings("scraping.api", ["crawlbase_api_key", "scrapingfish_api_key"])
+        if not api_keys["crawlbase_api_key"]:
             raise ValueError("CRAWLBASE_API_KEY is not set.")
+        return api_keys
+
+    @staticmethod
+    def _crawlbase_url(api_key: str, product_url: str) -> str:
+        return f"https://api.crawlbase.com/?token={api_key}&url={product_url}"
+
+    @staticmethod
+    def _scrapingfish_url(api_key: str, product_url: str) -> str:
+        return f"https://scraping.narf.ai/api/v1/?api_key={api_key}&url={product_url}"
 
-        crawlbase_url = f"https://api.crawlbase.com/?token={crawlbase_api_key}&url={self.product_url}"
-        response = requests.get(crawlbase_url)
-
-        if response.status_code != 200:
-            if not scrapingfish_api_key:
-                raise ValueError("SCRAPINGFISH_API_KEY is not set.")
-            
-            scrapingfish_url = f"https://scraping.narf.ai/api/v1/?api_key={scrapingfish_api_key}&url={self.product_url}"
-            response = requests.get(scrapingfish_url)
-            
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to fetch page content after fallback. Status Code: {response.status_code}")
-        
-        return BeautifulSoup(response.content, "html.parser")
+    @classmethod
+    def _provider_urls(cls, api_keys: Dict[str, str], product_url: str) -> List[Tuple[str, str]]:
+        """
+        Returns the (provider, request URL) pairs to try for a page, in the order chosen by the
+        provider selector. Providers without an API key are left out.
+        """
+        urls = {"crawlbase": cls._crawlbase_url(api_keys["crawlbase_api_key"], product_url)}
+        if api_keys["scrapingfish_api_key"]:
+            urls["scrapingfish"] = cls._scrapingfish_url(api_keys["scrapingfish_api_key"], product_url)
+        return [(provider, urls[provider]) for provider in provider_selector.order() if provider in urls]
+
+    @staticmethod
+    async def _request_provider(client: httpx.AsyncClient, provider: str, url: str) -> httpx.Response:
+        """
+        Sends one provider call once a slot of that provider's semaphore is free, and records
+        its outcome and latency. A call cancelled by a faster hedged request is not recorded.
+        """
+        async with get_provider_semaphore(provider):
+            provider_selector.begin(provider)
+            start = time.monotonic()
+            try:
+                response = await client.get(url)
+            except httpx.HTTPError:
+                provider_selector.record(provider, False, time.monotonic() - start)
+                raise
+        provider_selector.record(provider, response.status_code == 200, time.monotonic() - start)
+        return response
+
+    @classmethod
+    async def _download_page_async(cls, product_url: str) -> bytes:
+        """
+        Download the page from the scraping providers on the pooled async client: Crawlbase first
+        and Scrapingfish as the fallback, unless the circuit of the preferred one is open. A non-200
+        response, a timeout or a connection error falls back. With SCRAPER_HEDGE_AFTER set, the next
+        provider is also asked once the current call has been running that long, and the first page
+        returned wins while the other call is cancelled.
+        """
+        api_keys = cls._get_api_keys()
+        client = get_async_client()
+        providers = cls._provider_urls(api_keys, product_url)
+
+        status_code = None
+        error = None
+        pending = set()
+        try:
+            while providers or pending:
+                if providers:
+                    provider, url = providers.pop(0)
+                    pending.add(asyncio.ensure_future(cls._request_provider(client, provider, url)))
+                hedge_after = SCRAPER_HEDGE_AFTER if providers and SCRAPER_HEDGE_AFTER > 0 else None
+                done, pending = await asyncio.wait(pending, timeout=hedge_after, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if isinstance(task.exception(), httpx.HTTPError):
+                        error = task.exception()
+                        continue
+                    response = task.result()
+                    if response.status_code == 200:
+                        return response.content
+                    status_code = response.status_code
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if not api_keys["scrapingfish_api_key"]:
+            raise ValueError("SCRAPINGFISH_API_KEY is not set.")
+        if status_code is None and error is not None:
+            raise error
+        raise RuntimeError(f"Failed to fetch page content after fallback. Status Code: {status_code}")
+
+    @classmethod
+    async def _fetch_page_content_async(
+        cls, product_url: str, fields: Optional[Set[str]] = None, cache_ttl: float = SCRAPE_CACHE_TTL
+    ) -> BeautifulSoup:
+        """
+        Fetch the page content from the page cache, or from the providers on a miss.
+        Cache access and parsing run in worker threads.
+        """
+        cache = get_page_cache()
+        content = await asyncio.to_thread(cache.get, product_url, cache_ttl) if cache else None
+        if content is None:
+            content = await cls._download_page_async(product_url)
+            if cache:
+                await asyncio.to_thread(cache.set, product_url, content)
+
+        return await asyncio.to_thread(cls.parse_page, content, fields)
+
+    def _fetch_page_content(self) -> BeautifulSoup:
+        """
+        Blocking wrapper around `_fetch_page_content_async`, for scrapers built without a page
+        outside of an event loop. Async callers should construct the scraper with `create` instead.
+        """
+        async def fetch() -> BeautifulSoup:
+            try:
+                return await self._fetch_page_content_async(self.product_url, self.fields, self.cache_ttl)
+            finally:
+                await close_async_client()
+
+        return asyncio.run(fetch())
+
+    @classmethod
+    async def create(
+        cls, product_url: str, fields: Optional[Set[str]] = None, cache_ttl: float = SCRAPE_CACHE_TTL
+    ) -> "BaseScraper":
+        """
+        Builds the scraper after fetching its page without blocking the event loop.
+        """
+        fields = cls.validate_fields(fields)
+        page_content = await cls._fetch_page_content_async(product_url, fields, cache_ttl)
+        return cls(product_url, page_content=page_content, fields=fields, cache_ttl=cache_ttl)
@@ -1,16 +1,55 @@
-from bs4 import BeautifulSoup
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+from bs4 import BeautifulSoup, Tag
 from app.scrapers.base_scraper import BaseScraper
+from app.scrapers.page_cache import SCRAPE_CACHE_TTL
 
 class EmagScraper(BaseScraper):
-    def __init__(self, product_url: str):
-        super().__init__(product_url)
-        self.page_content = self._fetch_page_content() 
+    FIELD_TARGETS = {
+        "full_name": (("h1", "page-title"),),
+        "in_stock": (("div", "stock-and-genius"),),
+        "description": (("div", "product-page-description-text"),),
+        "specifications": (("table", "specifications-table"),),
+        "image_urls": ((None, "product-gallery-inner"),),
+    }
+
+    def __init__(
+        self,
+        product_url: str,
+        page_content: Optional[BeautifulSoup] = None,
+        fields: Optional[Set[str]] = None,
+        cache_ttl: float = SCRAPE_CACHE_TTL
+    ):
+        super().__init__(product_url, page_content, fields, cache_ttl)
+        if self.page_content is None:
+            self.page_content = self._fetch_page_content()
+        self._sections: Optional[Dict[str, List[Tag]]] = None
+
+    @property
+    def sections(self) -> Dict[str, List[Tag]]:
+        """
+        The target elements of the scraped fields grouped by their class, collected
+        in a single traversal and shared by all the getters.
+        """
+        if self._sections is None:
+            targets = self.parse_targets(self.fields)
+            sections = defaultdict(list)
+            for element in self.page_content.find_all(lambda tag: self.matches_target(targets, tag.name, tag.attrs)):
+                for tag, css_class in targets:
+                    if (tag is None or tag == element.name) and css_class in element.get("class", []):
+                        sections[css_class].append(element)
+            self._sections = sections
+        return self._sections
+
+    def _first(self, css_class: str) -> Optional[Tag]:
+        elements = self.sections.get(css_class)
+        return elements[0] if elements else None
 
     def get_full_name(self) -> str:
         """
         Extract and return the full product name from the page content.
         """
-        full_name_element = self.page_content.find('h1', class_='page-title')
+        full_name_element = self._first('page-title')
         if full_name_element:
             return full_name_element.get_text(strip=True)
         return ""
@@ -21,8 +60,8 @@ class EmagScraper(BaseScraper):
         Returns True if the product is in stock or in limited quantity,
         Returns False if the product is out of stock.
         """
-        stock_element = self.page_content.find('div', class_='stock-and-genius')
-        
+        stock_element = self._first('stock-and-genius')
+
         if stock_element:
             stock_status = stock_element.find('span', class_='label')
             if stock_status:
@@ -39,7 +78,7 @@ class EmagScraper(BaseScraper):
         Extract and return the product description from the page content,
         including text within <ul>, <ol>, and <li> elements.
         """
-        description_element = self.page_content.find('div', class_='product-page-description-text')
+        description_element = self._first('product-page-description-text')
 
         if description_element:
             description_text_parts = []
@@ -49,7 +88,7 @@ class EmagScraper(BaseScraper):
                 elif element.name in ['ul', 'ol']:
                     for li in element.find_all('li'):
                         description_text_parts.append(li.get_text(strip=True))
-            
+
             return ' '.join(description_text_parts).strip()
 
         return ""
@@ -59,7 +98,7 @@ class EmagScraper(BaseScraper):
         Extract and return the product specifications from the page content,
         with values separated by commas instead of newlines.
         """
-        specs_tables = self.page_content.find_all('table', class_='table table-striped specifications-table')
+        specs_tables = self.sections.get('specifications-table', [])
         product_specs = {}
         for table in specs_tables:
             rows = table.find_all('tr')
@@ -75,7 +114,10 @@ class EmagScraper(BaseScraper):
         """
         Extract and return a list of image URLs from the page content.
         """
-        image_elements = self.page_content.select('.product-gallery-inner .thumbnail-wrapper a[href]')
+        image_elements = [
+            link
+            for gallery in self.sections.get('product-gallery-inner', [])
+            for link in gallery.select('.thumbnail-wrapper a[href]')
+        ]
         image_urls = [img['href'] for img in image_elements[:5]]
         return image_urls
-
@@ -0,0 +1,67 @@
+import asyncio
+import os
+import threading
+import weakref
+from typing import Dict
+import httpx
+
+SCRAPER_TIMEOUT = float(os.getenv("SCRAPER_TIMEOUT", "60"))
+SCRAPER_MAX_CONNECTIONS = int(os.getenv("SCRAPER_MAX_CONNECTIONS", "20"))
+
+# Maximum number of requests in flight per scraping provider, per event loop.
+PROVIDER_CONCURRENCY = {
+    "crawlbase": int(os.getenv("SCRAPER_CRAWLBASE_CONCURRENCY", "10")),
+    "scrapingfish": int(os.getenv("SCRAPER_SCRAPINGFISH_CONCURRENCY", "5")),
+}
+
+# httpx clients and asyncio semaphores are bound to the event loop they were first used in,
+# so the app loop and loops started by scripts (asyncio.run) each get their own.
+_loop_state: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = weakref.WeakKeyDictionary()
+_loop_state_lock = threading.Lock()
+
+
+def _get_loop_state() -> Dict:
+    loop = asyncio.get_running_loop()
+    with _loop_state_lock:
+        state = _loop_state.get(loop)
+        if state is None:
+            state = {
+                "client": httpx.AsyncClient(
+                    timeout=SCRAPER_TIMEOUT,
+                    follow_redirects=True,
+                    limits=httpx.Limits(
+                        max_connections=SCRAPER_MAX_CONNECTIONS,
+                        max_keepalive_connections=SCRAPER_MAX_CONNECTIONS,
+                    ),
+                ),
+                "semaphores": {
+                    provider: asyncio.Semaphore(limit) for provider, limit in PROVIDER_CONCURRENCY.items()
+                },
+            }
+            _loop_state[loop] = state
+        return state
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Returns the pooled httpx client of the running event loop.
+    """
+    return _get_loop_state()["client"]
+
+
+def get_provider_semaphore(provider: str) -> asyncio.Semaphore:
+    """
+    Returns the semaphore limiting concurrent requests to `provider` in the running event loop.
+    """
+    return _get_loop_state()["semaphores"][provider]
+
+
+async def close_async_client() -> None:
+    """
+    Closes the httpx client of the running event loop, e.g. on application shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    with _loop_state_lock:
+        state = _loop_state.pop(loop, None)
+    if state is not None:
+        await state["client"].aclose()
@@ -0,0 +1,123 @@
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+SCRAPE_CACHE_ENABLED = os.getenv("SCRAPE_CACHE_ENABLED", "true").lower() in ["true", "1", "yes"]
+SCRAPE_CACHE_PATH = os.getenv("SCRAPE_CACHE_PATH", "cache/scrape_cache.sqlite3")
+SCRAPE_CACHE_MAX_BYTES = int(os.getenv("SCRAPE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# How old a cached page may be, per use case, in seconds. 0 always fetches.
+SCRAPE_CACHE_TTL = float(os.getenv("SCRAPE_CACHE_TTL", "3600"))
+SCRAPE_CACHE_STOCK_TTL = float(os.getenv("SCRAPE_CACHE_STOCK_TTL", "600"))
+
+# Query parameters that only track the visit and do not change the product page.
+TRACKING_PARAMETERS = {"ref", "fbclid", "gclid", "msclkid"}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Returns the cache key of a product URL: lowercase scheme and host, no fragment, no trailing
+    slash, and sorted query parameters without tracking ones (utm_*, ref, ...).
+    """
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.startswith("utm_") and name not in TRACKING_PARAMETERS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+class PageCache:
+    """
+    Size-bounded on-disk cache of fetched product pages, stored zlib-compressed in a SQLite file
+    shared by all workers. Entries are keyed by normalized URL; when the compressed bodies
+    exceed `max_bytes` the least recently read pages are evicted.
+    """
+
+    def __init__(self, path: str, max_bytes: int = SCRAPE_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "url TEXT PRIMARY KEY, body BLOB NOT NULL, size INTEGER NOT NULL, "
+                "fetched_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS ix_pages_accessed_at ON pages (accessed_at)")
+            self._connection = connection
+        return self._connection
+
+    def get(self, url: str, max_age: float) -> Optional[bytes]:
+        """
+        Returns the cached page of `url` if it was fetched less than `max_age` seconds ago.
+        """
+        if max_age <= 0:
+            return None
+        key = normalize_url(url)
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute("SELECT body, fetched_at FROM pages WHERE url = ?", (key,)).fetchone()
+            if row is None or now - row[1] > max_age:
+                return None
+            connection.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (now, key))
+        return zlib.decompress(row[0])
+
+    def set(self, url: str, content: bytes) -> None:
+        """
+        Stores a freshly fetched page and evicts the least recently read pages over the size limit.
+        """
+        body = zlib.compress(content)
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO pages (url, body, size, fetched_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (normalize_url(url), body, len(body), now, now)
+            )
+            self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        excess = connection.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        evicted = []
+        for key, size in connection.execute("SELECT url, size FROM pages ORDER BY accessed_at"):
+            evicted.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM pages WHERE url = ?", evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM pages")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+page_cache = PageCache(SCRAPE_CACHE_PATH) if SCRAPE_CACHE_ENABLED else None
+
+
+def get_page_cache() -> Optional[PageCache]:
+    """
+    Returns the shared page cache, or None when SCRAPE_CACHE_ENABLED is off.
+    """
+    return page_cache
@@ -0,0 +1,157 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence
+
+SCRAPER_HEALTH_WINDOW = int(os.getenv("SCRAPER_HEALTH_WINDOW", "50"))
+SCRAPER_CIRCUIT_MIN_REQUESTS = int(os.getenv("SCRAPER_CIRCUIT_MIN_REQUESTS", "10"))
+SCRAPER_CIRCUIT_ERROR_RATE = float(os.getenv("SCRAPER_CIRCUIT_ERROR_RATE", "0.5"))
+SCRAPER_CIRCUIT_COOLDOWN = float(os.getenv("SCRAPER_CIRCUIT_COOLDOWN", "30"))
+# Seconds to wait for the preferred provider before also asking the next one; 0 disables hedging.
+SCRAPER_HEDGE_AFTER = float(os.getenv("SCRAPER_HEDGE_AFTER", "0"))
+
+# Providers in order of preference.
+SCRAPING_PROVIDERS = ["crawlbase", "scrapingfish"]
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ProviderHealth:
+    """
+    Rolling latency and error rate of one scraping provider, with a circuit breaker.
+
+    The circuit opens when at least `min_requests` of the last `window` calls were recorded and
+    their error rate reaches `error_rate`. After `cooldown` seconds it lets a single trial
+    call through (half open): a success closes it with a fresh window, a failure opens it again.
+    Thread safe, as it is shared by the event loops of the app and of the scripts.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int = SCRAPER_HEALTH_WINDOW,
+        min_requests: int = SCRAPER_CIRCUIT_MIN_REQUESTS,
+        error_rate: float = SCRAPER_CIRCUIT_ERROR_RATE,
+        cooldown: float = SCRAPER_CIRCUIT_COOLDOWN,
+    ):
+        self.name = name
+        self.min_requests = min_requests
+        self.error_rate_threshold = error_rate
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._calls = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trial_started_at: Optional[float] = None
+
+    def _current_state(self) -> str:
+        now = time.monotonic()
+        if self._state == OPEN and now - self._opened_at >= self.cooldown:
+            self._state = HALF_OPEN
+            self._trial_started_at = None
+        # A trial call that never reported back (e.g. a cancelled hedged request) frees its slot after a cooldown.
+        if self._trial_started_at is not None and now - self._trial_started_at >= self.cooldown:
+            self._trial_started_at = None
+        return self._state
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def is_available(self) -> bool:
+        """
+        Returns whether a call may be sent now: the circuit is closed, or half open with no trial call in flight.
+        """
+        with self._lock:
+            state = self._current_state()
+            return state == CLOSED or (state == HALF_OPEN and self._trial_started_at is None)
+
+    def begin(self) -> None:
+        """
+        Marks a call as sent. In the half-open state it is the trial call.
+        """
+        with self._lock:
+            if self._current_state() == HALF_OPEN:
+                self._trial_started_at = time.monotonic()
+
+    def record(self, success: bool, latency: float) -> None:
+        """
+        Records the outcome of a call and opens or closes the circuit accordingly.
+
+        :param success: Whether the provider returned the page.
+        :param latency: Duration of the call in seconds.
+        """
+        with self._lock:
+            if self._current_state() == HALF_OPEN:
+                self._trial_started_at = None
+                if success:
+                    self._state = CLOSED
+                    self._calls.clear()
+                else:
+                    self._open()
+            self._calls.append((success, latency))
+            if self._state == CLOSED and len(self._calls) >= self.min_requests:
+                failures = sum(1 for ok, _ in self._calls if not ok)
+                if failures / len(self._calls) >= self.error_rate_threshold:
+                    self._open()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the circuit state, the error rate and the p50 / p95 latency (in milliseconds) over the window.
+        """
+        with self._lock:
+            state = self._current_state()
+            calls = list(self._calls)
+
+        latencies = sorted(latency for _, latency in calls)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 3)
+
+        return {
+            "provider": self.name,
+            "state": state,
+            "requests": len(calls),
+            "error_rate": round(sum(1 for ok, _ in calls if not ok) / len(calls), 3) if calls else 0.0,
+            "p50_latency_ms": percentile(0.5),
+            "p95_latency_ms": percentile(0.95),
+        }
+
+
+class ProviderSelector:
+    """
+    Orders the scraping providers for a fetch: providers whose circuit lets a call through
+    come first, in order of preference, and providers with an open circuit are kept as a last resort.
+    """
+
+    def __init__(self, providers: Sequence[str] = SCRAPING_PROVIDERS):
+        self.health = {provider: ProviderHealth(provider) for provider in providers}
+
+    def order(self) -> List[str]:
+        available = []
+        unavailable = []
+        for provider, health in self.health.items():
+            (available if health.is_available() else unavailable).append(provider)
+        return available + unavailable
+
+    def begin(self, provider: str) -> None:
+        self.health[provider].begin()
+
+    def record(self, provider: str, success: bool, latency: float) -> None:
+        self.health[provider].record(success, latency)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [self.health[provider].snapshot() for provider in self.order()]
+
+
+provider_selector = ProviderSelector()
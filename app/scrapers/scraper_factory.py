@@ -1,12 +1,33 @@
+from typing import Optional, Set, Type
 from app.scrapers.base_scraper import BaseScraper
 from app.scrapers.emag_scraper import EmagScraper
+from app.scrapers.page_cache import SCRAPE_CACHE_TTL
 
-def scraper_factory(product_url: str) -> BaseScraper:
+def get_scraper_class(product_url: str) -> Type[BaseScraper]:
     """
-    Factory function to create the appropriate scraper based on the product URL.
+    Returns the scraper class able to handle the product URL.
     """
     if "emag.ro" in product_url:
-        return EmagScraper(product_url)
+        return EmagScraper
     
     else:
         raise ValueError(f"No scraper available for the provided URL: {product_url}")
+
+def scraper_factory(
+    product_url: str, fields: Optional[Set[str]] = None, cache_ttl: float = SCRAPE_CACHE_TTL
+) -> BaseScraper:
+    """
+    Factory function to create the appropriate scraper based on the product URL.
+    Blocks while the page is fetched through `async_scraper_factory`'s path; not callable from a running event loop. `fields` limits parsing to the given product fields,
+    and pages cached less than `cache_ttl` seconds ago are reused.
+    """
+    return get_scraper_class(product_url)(product_url, fields=fields, cache_ttl=cache_ttl)
+
+async def async_scraper_factory(
+    product_url: str, fields: Optional[Set[str]] = None, cache_ttl: float = SCRAPE_CACHE_TTL
+) -> BaseScraper:
+    """
+    Async variant of `scraper_factory`: the page is fetched on the pooled async client,
+    so other requests keep being served while it downloads.
+    """
+    return await get_scraper_class(product_url).create(product_url, fields=fields, cache_ttl=cache_ttl)
@@ -85,9 +85,10 @@ class EdenAIService:
         :return: A dictionary with provider names as keys and a dictionary of generated text and cost as values.
         """
         url = f"{self.base_url}/text/chat"
-        temperature = SettingsService.get_setting_value("ai.parameters.temperature")
-        max_tokens = SettingsService.get_setting_value("ai.parameters.max_tokens")
-        request_timeout = SettingsService.get_setting_value("ai.parameters.timeout")
+        parameters = SettingsService.get_settings("ai.parameters", ["temperature", "max_tokens", "timeout"])
+        temperature = parameters["temperature"]
+        max_tokens = parameters["max_tokens"]
+        request_timeout = parameters["timeout"]
         headers = {
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json'
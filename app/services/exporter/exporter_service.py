@@ -8,6 +8,8 @@ from app.models.product import Product
 from app.models.article import Article
 from app.models.prompt import Prompt
 from sqlalchemy.orm import Query
+from app.crud.query_options import article_response_options, product_response_options
+from app.crud.search import apply_search
 from io import StringIO
 
 def apply_filters_sorting_pagination(query: Query, model, skip: int, limit: int, sort_field: Optional[str], sort_order: Optional[int], filter: Optional[str]) -> Query:
@@ -30,11 +32,7 @@ def export_stores(db: Session, blog_id: int, skip: int, limit: int, sort_field:
     query = db.query(Store).filter(Store.blog_id == blog_id)
 
     if filter:
-        filter_pattern = f"%{filter}%"
-        query = query.filter(
-            Store.name.ilike(filter_pattern) |
-            Store.base_url.ilike(filter_pattern)
-        )
+        query = apply_search(query, Store, filter, rank=not sort_field)
     
     query = apply_filters_sorting_pagination(query, Store, skip, limit, sort_field, sort_order, None)
     stores = query.all()
@@ -58,14 +56,10 @@ def export_products(
     query = db.query(Product).filter(Product.blog_id == blog_id)
 
     if filter:
-        filter_pattern = f"%{filter}%"
-        query = query.filter(
-            Product.name.ilike(filter_pattern) |
-            Product.seo_keyword.ilike(filter_pattern)
-        )
+        query = apply_search(query, Product, filter, rank=not sort_field)
 
     query = apply_filters_sorting_pagination(query, Product, skip, limit, sort_field, sort_order, None)
-    products = query.all()
+    products = query.options(*product_response_options()).all()
 
     output = io.StringIO()
     writer = csv.writer(output)
@@ -117,15 +111,10 @@ def export_articles(
     query = db.query(Article).filter(Article.blog_id == blog_id)
 
     if filter:
-        filter_pattern = f"%{filter}%"
-        query = query.filter(
-            Article.title.ilike(filter_pattern) |
-            Article.slug.ilike(filter_pattern) |
-            Article.status.ilike(filter_pattern)
-        )
+        query = apply_search(query, Article, filter, rank=not sort_field)
 
     query = apply_filters_sorting_pagination(query, Article, skip, limit, sort_field, sort_order, None)
-    articles = query.all()
+    articles = query.options(*article_response_options()).all()
 
     output = io.StringIO()
     writer = csv.writer(output)
@@ -177,13 +166,7 @@ def export_prompts(
     query = db.query(Prompt).filter(Prompt.blog_id == blog_id)
 
     if filter:
-        filter_pattern = f"%{filter}%"
-        query = query.filter(
-            Prompt.name.ilike(filter_pattern) |
-            Prompt.type.ilike(filter_pattern) |
-            Prompt.subtype.ilike(filter_pattern) |
-            Prompt.text.ilike(filter_pattern)
-        )
+        query = apply_search(query, Prompt, filter, rank=not sort_field)
 
     query = apply_filters_sorting_pagination(query, Prompt, skip, limit, sort_field, sort_order, None)
     prompts = query.all()
@@ -17,12 +17,17 @@ class ImageMetadataService:
         sanitized = sanitized.strip('-')
         return sanitized
 
-    def generate_metadata(self, entity_type: str, entity: object, output_json: Optional[dict] = None) -> Tuple[str, str]:
+    def generate_metadata(
+        self, entity_type: str, entity: object, output_json: Optional[dict] = None, image_settings: Optional[dict] = None
+    ) -> Tuple[str, str]:
         """
         Generate file name and alt text metadata for a given entity type using settings and placeholders.
+        `image_settings` can pass the already loaded "images.{entity_type}" settings.
         """
-        file_name_template = SettingsService.get_setting_value(f"images.{entity_type}.file_name")
-        alt_text_template = SettingsService.get_setting_value(f"images.{entity_type}.alt_text")
+        if image_settings is None:
+            image_settings = SettingsService.get_settings(f"images.{entity_type}", ["file_name", "alt_text"])
+        file_name_template = image_settings["file_name"]
+        alt_text_template = image_settings["alt_text"]
 
         if entity_type == "product":
             replacements = self.placeholder_service.get_replacements_for_product(entity, output_json)
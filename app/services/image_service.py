@@ -24,10 +24,15 @@ class ImageService:
         Process an image for a given entity type (e.g., store, product, article).
         """
         try:
-            width = SettingsService.get_setting_value(f"images.{entity_type}.width")
-            height = SettingsService.get_setting_value(f"images.{entity_type}.height")
-
-            file_name, alt_text = self.metadata_service.generate_metadata(entity_type, entity, output_json)
+            image_settings = SettingsService.get_settings(
+                f"images.{entity_type}", ["width", "height", "file_name", "alt_text"]
+            )
+            width = image_settings["width"]
+            height = image_settings["height"]
+
+            file_name, alt_text = self.metadata_service.generate_metadata(
+                entity_type, entity, output_json, image_settings=image_settings
+            )
 
             image_path = await self.download_image(image_url)
             renamed_image_path = self.rename_image(image_path, file_name)
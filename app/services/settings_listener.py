@@ -0,0 +1,93 @@
+import logging
+import os
+import select
+import threading
+from typing import Any, Optional
+from app.crud.crud_settings import SETTINGS_NOTIFY_CHANNEL, get_settings_version
+from app.services.settings_service import SettingsService
+
+logger = logging.getLogger(__name__)
+
+SETTINGS_POLL_INTERVAL = float(os.getenv("SETTINGS_POLL_INTERVAL", "1"))
+RECONNECT_DELAY = 5.0
+
+
+class SettingsListener:
+    """
+    Background thread that invalidates the settings cache of this worker as soon as
+    another worker changes a setting.
+
+    On PostgreSQL it LISTENs on SETTINGS_NOTIFY_CHANNEL over a dedicated connection, which the
+    settings crud notifies in the same transaction as the change. Other databases poll the
+    settings_version row every SETTINGS_POLL_INTERVAL seconds. While the listener is connected
+    SettingsService skips its own TTL version checks.
+    """
+
+    def __init__(self, engine: Any, session_factory: Any, poll_interval: float = SETTINGS_POLL_INTERVAL):
+        self.engine = engine
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        target = self._listen if self.engine.dialect.name == "postgresql" else self._poll
+        self._thread = threading.Thread(target=target, name="settings-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=self.poll_interval + 1)
+        self._thread = None
+        SettingsService.watched = False
+
+    def _listen(self) -> None:
+        while not self._stop.is_set():
+            connection = None
+            try:
+                dialect = self.engine.dialect
+                connect_args, connect_kwargs = dialect.create_connect_args(self.engine.url)
+                connection = dialect.connect(*connect_args, **connect_kwargs)
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {SETTINGS_NOTIFY_CHANNEL}")
+
+                # Changes made while disconnected were not notified.
+                SettingsService.invalidate_cache()
+                SettingsService.watched = True
+
+                while not self._stop.is_set():
+                    if select.select([connection], [], [], self.poll_interval) == ([], [], []):
+                        continue
+                    connection.poll()
+                    if connection.notifies:
+                        connection.notifies.clear()
+                        SettingsService.invalidate_cache()
+            except Exception as e:
+                logger.warning("Settings listener lost its connection: %s", e)
+                SettingsService.watched = False
+                self._stop.wait(RECONNECT_DELAY)
+            finally:
+                if connection is not None:
+                    connection.close()
+
+    def _poll(self) -> None:
+        version = None
+        while not self._stop.is_set():
+            try:
+                with self.session_factory() as db:
+                    current = get_settings_version(db)
+                # The first poll also invalidates: a change may have landed before the listener started.
+                if current != version:
+                    SettingsService.invalidate_cache()
+                version = current
+                SettingsService.watched = True
+            except Exception as e:
+                logger.warning("Settings version poll failed: %s", e)
+                SettingsService.watched = False
+            self._stop.wait(self.poll_interval)
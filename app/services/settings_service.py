@@ -1,33 +1,125 @@
+import os
+import threading
+import time
 from app.database import SessionLocal
 from app.schemas.settings import SettingCreate, SettingResponse
-from app.crud.crud_settings import get_setting_by_key, create_setting
-from typing import Any
+from app.crud.crud_settings import (
+    get_setting_by_key,
+    get_all_settings,
+    get_settings_by_prefix,
+    get_settings_version,
+    create_missing_settings,
+)
+from typing import Any, Dict, Iterable, Optional
+
+# Typed setting values are served from memory. Every SETTINGS_CACHE_TTL seconds the settings
+# version is checked and the values are reloaded if another worker changed them.
+# 0 disables the cache and reads the setting from the database on every call.
+SETTINGS_CACHE_TTL = float(os.getenv("SETTINGS_CACHE_TTL", "30"))
 
 class SettingsService:
     """
     Service class for managing settings.
     """
 
+    _lock = threading.Lock()
+    _values: Dict[str, Any] = {}
+    _version: Optional[int] = None
+    _checked_at = 0.0
+    # Set by SettingsListener while it delivers invalidations, making the TTL checks unnecessary.
+    watched = False
+
     @staticmethod
-    def get_setting_value(key: str) -> Any:
+    def convert_value(setting: SettingResponse) -> Any:
+        """
+        Converts the stored string value of a setting to its declared type.
+        """
+        if setting.type == "integer":
+            return int(setting.value)
+        elif setting.type == "float":
+            return float(setting.value)
+        elif setting.type == "boolean":
+            return setting.value.lower() in ["true", "1", "yes"]
+        elif setting.type == "string":
+            return setting.value
+        else:
+            raise ValueError(f"Unsupported setting type: {setting.type}")
+
+    @classmethod
+    def invalidate_cache(cls):
+        """
+        Makes the next lookup reload all settings. Called after settings are changed in this process.
+        """
+        with cls._lock:
+            cls._version = None
+            cls._checked_at = 0.0
+
+    @classmethod
+    def _refresh(cls, force: bool = False) -> Dict[str, Any]:
+        """
+        Returns the cached values, checking the settings version once the TTL has passed
+        and reloading every setting with a single query when it changed.
+        """
+        with cls._lock:
+            now = time.monotonic()
+            fresh = cls.watched or now - cls._checked_at < SETTINGS_CACHE_TTL
+            if not force and cls._version is not None and fresh:
+                return cls._values
+
+            with SessionLocal() as db:
+                version = get_settings_version(db)
+                if force or version != cls._version:
+                    cls._values = {setting.key: cls.convert_value(setting) for setting in get_all_settings(db)}
+                    cls._version = version
+
+            cls._checked_at = now
+            return cls._values
+
+    @classmethod
+    def get_setting_value(cls, key: str) -> Any:
         """
         Returns the value of a setting by its key.
         """
-        with SessionLocal() as db:
-            setting = get_setting_by_key(db, key)
-            if not setting:
-                raise ValueError(f"Setting with key '{key}' not found")
-
-            if setting.type == "integer":
-                return int(setting.value)
-            elif setting.type == "float":
-                return float(setting.value)
-            elif setting.type == "boolean":
-                return setting.value.lower() in ["true", "1", "yes"]
-            elif setting.type == "string":
-                return setting.value
-            else:
-                raise ValueError(f"Unsupported setting type: {setting.type}")
+        if SETTINGS_CACHE_TTL <= 0:
+            with SessionLocal() as db:
+                setting = get_setting_by_key(db, key)
+                if not setting:
+                    raise ValueError(f"Setting with key '{key}' not found")
+                return cls.convert_value(setting)
+
+        values = cls._refresh()
+        if key not in values:
+            # The setting may have been created by another worker since the last check.
+            values = cls._refresh(force=True)
+        if key not in values:
+            raise ValueError(f"Setting with key '{key}' not found")
+        return values[key]
+
+    @classmethod
+    def get_settings(cls, prefix: str, keys: Iterable[str] = ()) -> Dict[str, Any]:
+        """
+        Returns the typed values of all settings under a prefix, keyed by the rest of their key.
+        E.g. get_settings("images.product", ["width", "height"]) returns {"width": 1080, "height": 1080, ...}.
+
+        :param prefix: The common key prefix, without the trailing dot.
+        :param keys: Keys under the prefix the caller needs; a missing one raises the same
+            ValueError as get_setting_value.
+        """
+        if SETTINGS_CACHE_TTL <= 0:
+            with SessionLocal() as db:
+                settings = {s.key: cls.convert_value(s) for s in get_settings_by_prefix(db, prefix)}
+        else:
+            settings = cls._refresh()
+            if any(f"{prefix}.{key}" not in settings for key in keys):
+                # The settings may have been created by another worker since the last check.
+                settings = cls._refresh(force=True)
+
+        for key in keys:
+            if f"{prefix}.{key}" not in settings:
+                raise ValueError(f"Setting with key '{prefix}.{key}' not found")
+
+        start = len(prefix) + 1
+        return {key[start:]: value for key, value in settings.items() if key.startswith(f"{prefix}.")}
 
     @staticmethod
     def initialize_default_settings():
@@ -80,7 +172,6 @@ class SettingsService:
         ]
 
         with SessionLocal() as db:
-            for default_setting in default_settings:
-                existing = get_setting_by_key(db, default_setting["key"])
-                if not existing:
-                    create_setting(db, SettingCreate(**default_setting))
+            create_missing_settings(db, [SettingCreate(**default_setting) for default_setting in default_settings])
+
+        SettingsService.invalidate_cache()
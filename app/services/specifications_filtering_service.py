@@ -108,8 +108,11 @@ class SpecificationsFilteringService:
         Returns:
             spec_relevance: A dictionary with specifications as keys and relevance scores as values.
         """
-        frequency_percentage = SettingsService.get_setting_value("specifications.filtering.relevance_threshold")
-        variability_percentage = SettingsService.get_setting_value("specifications.filtering.variability_threshold")
+        thresholds = SettingsService.get_settings(
+            "specifications.filtering", ["relevance_threshold", "variability_threshold"]
+        )
+        frequency_percentage = thresholds["relevance_threshold"]
+        variability_percentage = thresholds["variability_threshold"]
         spec_relevance = {}
         for spec in spec_frequency:
             frequency_score = spec_frequency[spec] / total_products 
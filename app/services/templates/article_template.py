@@ -3,7 +3,7 @@ import re
 from app.models.gutenberg_blocks.default_blocks import SpacerBlock, ParagraphBlock, HeadingBlock, ImageBlock
 from app.models.gutenberg_blocks.custom_blocks import AccordionBlock, ComparisonItemBlock, ComparisonTableBlock
 from app.schemas.article import ArticleResponse
-from app.crud.crud_product import get_product_by_id
+from app.crud.crud_product import get_products_by_ids
 from app.services.specifications_filtering_service import SpecificationsFilteringService
 from app.services.wordpress_service import WordPressService
 from app.services.templates.product_template import ProductTemplate
@@ -31,15 +31,13 @@ class ArticleTemplate:
         """
         products_with_images = []
 
-        products = []
-        for product_id in self.article.products_id_list:
-            product = get_product_by_id(self.db, self.wp_service.blog_id, product_id) 
-            if product:
-                image_data = None
-                if product.image_ids:
-                    image_id = product.image_ids[0]
-                    image_data = await self.wp_service.get_image_by_id(image_id) 
-                products_with_images.append((product, image_data))
+        products = get_products_by_ids(self.db, self.wp_service.blog_id, self.article.products_id_list)
+        for product in products:
+            image_data = None
+            if product.image_ids:
+                image_id = product.image_ids[0]
+                image_data = await self.wp_service.get_image_by_id(image_id) 
+            products_with_images.append((product, image_data))
 
         products = [product for product, _ in products_with_images] 
         filtered_products = self.specifications_filter_service.filter_specifications(products)
@@ -4,23 +4,31 @@ import os
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from apscheduler.schedulers.background import BackgroundScheduler
-from app.core.setup_middleware import setup_middleware
+from app.core.setup_middleware import SetupMiddleware
+from app.core.sql_instrumentation import SQL_INSTRUMENTATION_ENABLED, SQLInstrumentationMiddleware
 from app.models.user import User
-from app.services.settings_service import SettingsService
+from app.services.settings_service import SETTINGS_CACHE_TTL, SettingsService
+from app.services.settings_listener import SettingsListener
+from app.database import SessionLocal, engine
+from app.scrapers.http_client import close_async_client
 from scripts.update_stock import scheduled_stock_update
 from app.api.api_v1.router import api_router
 from contextlib import asynccontextmanager
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from app.dependencies.auth import get_current_user_basic
 
 scheduler = BackgroundScheduler()
+settings_listener = SettingsListener(engine, SessionLocal)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
-    Lifespan event handler for FastAPI that starts and stops the scheduler.
+    Lifespan event handler for FastAPI that starts and stops the scheduler
+    and the settings invalidation listener, and closes the scraping HTTP client.
     """
+    if SETTINGS_CACHE_TTL > 0:
+        settings_listener.start()
 
     check_inteval_days = SettingsService.get_setting_value("scraping.log.stock_check_interval")
     
@@ -35,10 +43,15 @@ async def lifespan(app: FastAPI):
     yield
 
     scheduler.shutdown()
+    settings_listener.stop()
+    await close_async_client()
 
 app = FastAPI(lifespan=lifespan, docs_url=None, redoc_url=None, openapi_url=None)
 
-app.middleware("http")(setup_middleware)
+app.add_middleware(SetupMiddleware)
+
+if SQL_INSTRUMENTATION_ENABLED:
+    app.add_middleware(SQLInstrumentationMiddleware)
 
 origins = os.getenv(
     "CORS_ORIGINS", "http://localhost:4200,http://localhost:8000"
@@ -66,6 +79,12 @@ async def custom_swagger_ui(current_user: User = Depends(get_current_user_basic)
 async def custom_redoc_ui(current_user: User = Depends(get_current_user_basic)):
     return get_redoc_html(openapi_url="/openapi.json", title="API Docs")
 
+# The routes do not change at runtime, so the schema is generated and serialized once.
+openapi_body = None
+
 @app.get("/openapi.json", include_in_schema=False)
 async def openapi(current_user: User = Depends(get_current_user_basic)):
-    return JSONResponse(app.openapi())
+    global openapi_body
+    if openapi_body is None:
+        openapi_body = JSONResponse(app.openapi()).body
+    return Response(content=openapi_body, media_type="application/json")
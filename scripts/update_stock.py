@@ -1,93 +1,221 @@
+import asyncio
+import os
 import time
 from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
+from app.crud.crud_dashboard import DASHBOARD_COUNTERS_ENABLED, refresh_blog_counters
 from app.database import SessionLocal
 from app.models.blog import Blog
-from app.models.product import Product
+from app.models.product import Product, ProductAffiliateURL
 from app.models.stock_check_log import StockCheckLog
-from app.scrapers.scraper_factory import scraper_factory
+from app.scrapers.http_client import close_async_client
+from app.scrapers.page_cache import SCRAPE_CACHE_STOCK_TTL
+from app.scrapers.scraper_factory import async_scraper_factory
 from app.services.settings_service import SettingsService
 
+STOCK_CHECK_WORKERS = int(os.getenv("STOCK_CHECK_WORKERS", "10"))
+STOCK_CHECK_DOMAIN_CONCURRENCY = int(os.getenv("STOCK_CHECK_DOMAIN_CONCURRENCY", "4"))
+# Overall time budget of a run in seconds; 0 means no deadline.
+STOCK_CHECK_DEADLINE = float(os.getenv("STOCK_CHECK_DEADLINE", "0"))
+STOCK_CHECK_COMMIT_BATCH = 100
+# Stock checks only parse and extract the stock block of product pages.
+STOCK_FIELDS = {"in_stock"}
 
-def check_and_update_product_stock(db: Session, product: Product) -> bool:
+
+class StockCheckLimits:
     """
-    Checks the stock status of a product and updates its details if necessary.
-    Returns True if the product is in stock, False otherwise.
-    If an error occurs during scraping, the product is skipped and its old in_stock value is returned.
+    Limits shared by all checks of one run: the number of checks in flight, the number of
+    checks per affiliate domain and the deadline. The per-provider limits are applied by the
+    scraper HTTP client (SCRAPER_CRAWLBASE_CONCURRENCY / SCRAPER_SCRAPINGFISH_CONCURRENCY).
     """
-    try:
-        affiliate_urls = product.affiliate_urls
-        if not affiliate_urls:
-            return product.in_stock
-
-        scraper = scraper_factory(affiliate_urls[0].url)
-        scraped_data = scraper.scrape_product_data()
 
-        in_stock = scraped_data.get('in_stock')
+    def __init__(
+        self,
+        workers: int = STOCK_CHECK_WORKERS,
+        domain_concurrency: int = STOCK_CHECK_DOMAIN_CONCURRENCY,
+        deadline: float = STOCK_CHECK_DEADLINE,
+    ):
+        self.workers = asyncio.Semaphore(workers)
+        self.domain_concurrency = domain_concurrency
+        self.domains: Dict[str, asyncio.Semaphore] = {}
+        self.deadline = time.monotonic() + deadline if deadline > 0 else None
+
+    def domain(self, url: str) -> asyncio.Semaphore:
+        netloc = urlparse(url).netloc
+        if netloc not in self.domains:
+            self.domains[netloc] = asyncio.Semaphore(self.domain_concurrency)
+        return self.domains[netloc]
+
+    def remaining(self) -> Optional[float]:
+        """
+        Seconds left until the deadline, or None without a deadline.
+        """
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+
+async def check_product_stock(product_id: int, url: str, limits: StockCheckLimits) -> Optional[bool]:
+    """
+    Scrapes the stock status of a product from its affiliate URL.
+    Returns None if the product could not be checked: the scrape failed, or the deadline
+    passed before or during the check.
+    """
+    # The domain slot is taken first, so checks queued behind a busy domain do not hold a worker
+    # that a check of another domain could use.
+    async with limits.domain(url), limits.workers:
+        remaining = limits.remaining()
+        if remaining is not None and remaining <= 0:
+            return None
+        try:
+            scraper = await asyncio.wait_for(async_scraper_factory(url, fields=STOCK_FIELDS, cache_ttl=SCRAPE_CACHE_STOCK_TTL), timeout=remaining)
+            return scraper.scrape_product_data(fields=STOCK_FIELDS).get('in_stock')
+        except asyncio.TimeoutError:
+            print(f"Deadline reached while checking product {product_id}")
+            return None
+        except Exception as e:
+            print(f"Error while checking product {product_id}: {e}")
+            return None
+
+
+def get_products_to_check(db: Session, blog_id: int, threshold_time: Optional[datetime] = None) -> List[Product]:
+    """
+    Returns the products of a blog that are due for a stock check.
 
-        if product.in_stock != in_stock:
-            product.in_stock = in_stock
+    :param db: The database session.
+    :param blog_id: The ID of the blog.
+    :param threshold_time: Products checked after this moment are skipped. None selects every product.
+    """
+    query = db.query(Product).filter(Product.blog_id == blog_id)
+    if threshold_time is not None:
+        query = query.filter((Product.last_checked == None) | (Product.last_checked < threshold_time))
+    return query.all()
 
-        product.last_checked = datetime.now(timezone.utc)
-        db.commit()
 
-        return in_stock
-    except Exception as e:
-        print(f"Error while checking product {product.id}: {e}")
-        return product.in_stock
+def get_first_affiliate_urls(db: Session, blog_id: int) -> Dict[int, str]:
+    """
+    Returns the first affiliate URL of every product of a blog that has one, keyed by product ID.
+    """
+    rows = (
+        db.query(ProductAffiliateURL.product_id, ProductAffiliateURL.url)
+        .join(Product, Product.id == ProductAffiliateURL.product_id)
+        .filter(Product.blog_id == blog_id)
+        .order_by(ProductAffiliateURL.id)
+    )
+    urls: Dict[int, str] = {}
+    for product_id, url in rows:
+        urls.setdefault(product_id, url)
+    return urls
+
+
+def save_stock_results(db: Session, results: List[Dict]) -> None:
+    """
+    Stores the checked stock status and check time of products with one executemany and commits.
+    """
+    if results:
+        db.execute(update(Product), results)
+    db.commit()
 
 
-def update_product_stocks(db: Session, manual_run: bool = False):
+async def update_blog_stocks(db: Session, blog: Blog, threshold_time: Optional[datetime], limits: StockCheckLimits) -> StockCheckLog:
     """
-    Updates the stock status of products per blog. For each blog:
-      - Gets the list of products that need stock checking (based on last_checked or forced if manual_run).
-      - Scrapes and updates stock info.
-      - Logs the check result in StockCheckLog with the correct blog_id.
+    Checks the due products of one blog concurrently and logs the result in StockCheckLog.
+    Products that could not be checked keep their old in_stock value and last_checked date,
+    so they are picked up again by the next run. If saving the results fails, the checks still
+    running are cancelled before the error is raised.
+    """
+    start_time = time.time()
+
+    products_to_check = get_products_to_check(db, blog.id, threshold_time)
+    affiliate_urls = get_first_affiliate_urls(db, blog.id) if products_to_check else {}
+    total_products = db.query(Product).filter(Product.blog_id == blog.id).count()
+
+    out_of_stock_count = 0
+    tasks = []
+    for product in products_to_check:
+        url = affiliate_urls.get(product.id)
+        if url is None:
+            out_of_stock_count += int(not product.in_stock)
+            continue
+        task = asyncio.ensure_future(check_product_stock(product.id, url, limits))
+        tasks.append((task, product.id, product.in_stock))
+
+    pending_results = []
+    try:
+        for task, product_id, previous_in_stock in tasks:
+            in_stock = await task
+            if in_stock is None:
+                in_stock = previous_in_stock
+            else:
+                pending_results.append({"id": product_id, "in_stock": in_stock, "last_checked": datetime.now(timezone.utc)})
+            if not in_stock:
+                out_of_stock_count += 1
 
-    :param db: The database session.
-    :param manual_run: If True, updates stock for ALL products in each blog. Otherwise, only those past the interval.
+            if len(pending_results) >= STOCK_CHECK_COMMIT_BATCH:
+                save_stock_results(db, pending_results)
+                pending_results = []
+        save_stock_results(db, pending_results)
+    finally:
+        unfinished = [task for task, _, _ in tasks if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
+
+    in_stock_count = total_products - out_of_stock_count
+    duration = time.time() - start_time
+
+    stock_check_log = StockCheckLog(
+        blog_id=blog.id,
+        duration=duration,
+        in_stock_count=in_stock_count,
+        out_of_stock_count=out_of_stock_count
+    )
+    db.add(stock_check_log)
+    if DASHBOARD_COUNTERS_ENABLED:
+        refresh_blog_counters(db, blog.id)
+    db.commit()
+
+    print(f"[Blog ID={blog.id}] Stock check complete. "
+          f"Duration: {duration:.2f} seconds. "
+          f"In stock: {in_stock_count}, Out of stock: {out_of_stock_count}.")
+    return stock_check_log
+
+
+async def run_stock_checks(db: Session, manual_run: bool = False, limits: Optional[StockCheckLimits] = None):
+    """
+    Async body of `update_product_stocks`: blogs are processed one after another, the products
+    of each blog concurrently within `limits`.
     """
     check_interval_days = SettingsService.get_setting_value("scraping.log.stock_check_interval")
     now = datetime.now(timezone.utc)
+    limits = limits or StockCheckLimits()
 
-    blogs = db.query(Blog).all()
-
-    for blog in blogs:
-        start_time = time.time()
+    try:
+        for blog in db.query(Blog).all():
+            threshold_time = None if manual_run else now - timedelta(days=check_interval_days)
+            await update_blog_stocks(db, blog, threshold_time, limits)
+    finally:
+        await close_async_client()
 
-        if manual_run:
-            products_to_check = db.query(Product).filter(Product.blog_id == blog.id).all()
-        else:
-            threshold_time = now - timedelta(days=check_interval_days)
-            products_to_check = db.query(Product).filter(
-                Product.blog_id == blog.id,
-                (Product.last_checked == None) | (Product.last_checked < threshold_time)
-            ).all()
 
-        total_products = db.query(Product).filter(Product.blog_id == blog.id).count()
-        out_of_stock_count = 0
+def update_product_stocks(db: Session, manual_run: bool = False, limits: Optional[StockCheckLimits] = None):
+    """
+    Updates the stock status of products per blog. For each blog:
+      - Gets the list of products that need stock checking (based on last_checked or forced if manual_run).
+      - Scrapes and updates stock info, STOCK_CHECK_WORKERS products at a time.
+      - Logs the check result in StockCheckLog with the correct blog_id.
 
-        for product in products_to_check:
-            in_stock = check_and_update_product_stock(db, product)
-            if not in_stock:
-                out_of_stock_count += 1
+    Once STOCK_CHECK_DEADLINE passes, the remaining products are left for the next run.
 
-        in_stock_count = total_products - out_of_stock_count
-        duration = time.time() - start_time
-
-        stock_check_log = StockCheckLog(
-            blog_id=blog.id,
-            duration=duration,
-            in_stock_count=in_stock_count,
-            out_of_stock_count=out_of_stock_count
-        )
-        db.add(stock_check_log)
-        db.commit()
-
-        print(f"[Blog ID={blog.id}] Stock check complete. "
-              f"Duration: {duration:.2f} seconds. "
-              f"In stock: {in_stock_count}, Out of stock: {out_of_stock_count}.")
+    :param db: The database session.
+    :param manual_run: If True, updates stock for ALL products in each blog. Otherwise, only those past the interval.
+    :param limits: Concurrency limits and deadline; built from the environment when omitted.
+    """
+    asyncio.run(run_stock_checks(db, manual_run, limits))
 
 
 def scheduled_stock_update():
@@ -0,0 +1,106 @@
+from typing import Any, Callable, Sequence
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.sql_instrumentation import install_sql_instrumentation, track_queries
+from app.database import Base
+from app.models.blog import Blog
+from app.models.store import Store
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """
+    In-memory SQLite engine shared by the database tests, with the SQL instrumentation installed.
+    StaticPool keeps its single connection, and so the data, across sessions and threads.
+    Test modules create the tables in their own fixtures and drop them afterwards.
+    """
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    install_sql_instrumentation(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def tables(engine):
+    """
+    Creates every table for the duration of one test.
+    """
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield
+    finally:
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="module")
+def module_tables(engine):
+    """
+    Creates every table for the duration of one test module, for modules seeding read-only data once.
+    """
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield
+    finally:
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="session")
+def seed_blog():
+    """
+    Returns a factory that adds a blog to a session and flushes it, so its id can be used right away.
+    """
+    def seed(session: Session, name: str = "Blog", base_url: str = "https://blog.example.com") -> Blog:
+        blog = Blog(name=name, base_url=base_url, username="wp", api_key="key")
+        session.add(blog)
+        session.flush()
+        return blog
+
+    return seed
+
+
+@pytest.fixture(scope="session")
+def seed_store():
+    """
+    Returns a factory that adds a store of a blog to a session.
+    """
+    def seed(session: Session, blog: Blog, name: str = "Store", base_url: str = "https://store.example.com") -> Store:
+        store = Store(blog_id=blog.id, name=name, base_url=base_url)
+        session.add(store)
+        return store
+
+    return seed
+
+
+@pytest.fixture
+def assert_constant_query_count():
+    """
+    Returns a checker that calls `run(size)` for every size and fails the test when the number
+    of statements issued through `engine` changes with the size (the usual N+1 signature).
+    """
+    def check(engine: Any, run: Callable[[int], Any], sizes: Sequence[int] = (2, 10)) -> int:
+        install_sql_instrumentation(engine)
+        counts = {}
+        repeated = []
+        for size in sizes:
+            with track_queries() as stats:
+                run(size)
+            counts[size] = stats.statement_count
+            repeated = stats.repeated_statements()
+
+        if len(set(counts.values())) > 1:
+            details = "\n".join(f"  {count}x {shape}" for shape, count in repeated)
+            pytest.fail(f"Query count grows with result size {counts}; repeated statements:\n{details}")
+        return counts[sizes[0]]
+
+    return check
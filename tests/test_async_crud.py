@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base, run_sync
+from app.models.blog import Blog
+from app.models.store import Store
+from app.models.product import Product, ProductAffiliateURL
+from app.crud import async_crud
+from app.crud.crud_product import get_products
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+@pytest.fixture(scope="module")
+def database_path(tmp_path_factory):
+    """
+    Creates a file-backed SQLite database shared by a sync and an async engine, seeded with one blog.
+    """
+    path = tmp_path_factory.mktemp("async") / "async.db"
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+
+    session = sessionmaker(bind=engine)()
+    blog = Blog(name="Blog", base_url="https://blog.example.com", username="wp", api_key="key")
+    session.add(blog)
+    session.flush()
+    store = Store(blog_id=blog.id, name="Store", base_url="https://store.example.com")
+    session.add_all([
+        Product(
+            blog_id=blog.id,
+            name=f"Product {i}",
+            seo_keyword=f"keyword-{i}",
+            rating=4.0,
+            stores=[store],
+            affiliate_urls=[ProductAffiliateURL(url=f"https://store.example.com/p/{i}")],
+        )
+        for i in range(3)
+    ])
+    session.commit()
+    session.close()
+    engine.dispose()
+    return path
+
+
+def run_with_async_session(path, fn):
+    """
+    Opens an aiosqlite-backed AsyncSession on `path` and awaits `fn(session)`.
+    """
+    async def runner():
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        try:
+            async with async_sessionmaker(bind=async_engine)() as session:
+                return await fn(session)
+        finally:
+            await async_engine.dispose()
+    return asyncio.run(runner())
+
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_async_variant_matches_sync_result(database_path):
+    engine = create_engine(f"sqlite:///{database_path}", poolclass=StaticPool)
+    session = sessionmaker(bind=engine)()
+    expected = get_products(session, blog_id=1, limit=10)
+    session.close()
+
+    result = run_with_async_session(
+        database_path,
+        lambda db: async_crud.get_products(db, blog_id=1, limit=10),
+    )
+
+    assert result["total_records"] == expected["total_records"] == 3
+    assert [p.model_dump() for p in result["products"]] == [p.model_dump() for p in expected["products"]]
+
+
+def test_async_variant_returns_none_for_missing_row(database_path):
+    result = run_with_async_session(
+        database_path,
+        lambda db: async_crud.get_product_by_id(db, blog_id=1, product_id=999),
+    )
+
+    assert result is None
+
+
+def test_run_sync_calls_function_directly_with_sync_session():
+    session = object()
+
+    result = asyncio.run(run_sync(session, lambda db, value: (db, value), "value"))
+
+    assert result == (session, "value")
@@ -0,0 +1,108 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from main import app
+from app.core.cache import TTLCache
+from app.core.security import get_password_hash
+from app.crud import crud_user
+from app.database import get_db
+from app.dependencies import auth
+from app.models.user import User
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+@pytest.fixture
+def verifications(monkeypatch, tables, session_factory):
+    """
+    Seeds a docs user, empties the caches and counts bcrypt verifications.
+    """
+    db = session_factory()
+    db.add(User(email="admin@example.com", hashed_password=get_password_hash("secret"), name="Admin"))
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setitem(app.dependency_overrides, get_db, override_get_db)
+    monkeypatch.setattr(auth, "verified_credentials_cache", TTLCache(maxsize=16, ttl=60))
+    monkeypatch.setattr(crud_user, "user_cache", TTLCache(maxsize=16, ttl=60))
+
+    calls = []
+    verify_password = auth.verify_password
+
+    def counting_verify_password(plain_password, hashed_password):
+        calls.append(plain_password)
+        return verify_password(plain_password, hashed_password)
+
+    monkeypatch.setattr(auth, "verify_password", counting_verify_password)
+    return calls
+
+# ------------------------------ TEST FUNCTIONS ------------------------------ #
+
+def test_successful_verification_is_cached(verifications):
+    client = TestClient(app)
+
+    for path in ["/docs", "/redoc", "/docs"]:
+        assert client.get(path, auth=("admin@example.com", "secret")).status_code == 200
+
+    assert verifications == ["secret"]
+
+
+def test_failed_verification_is_not_cached(verifications):
+    client = TestClient(app)
+
+    assert client.get("/docs", auth=("admin@example.com", "wrong")).status_code == 401
+    assert client.get("/docs", auth=("admin@example.com", "wrong")).status_code == 401
+    assert client.get("/docs", auth=("admin@example.com", "secret")).status_code == 200
+
+    assert verifications == ["wrong", "wrong", "secret"]
+
+
+def test_cache_keys_do_not_contain_the_password(verifications):
+    client = TestClient(app)
+    client.get("/docs", auth=("admin@example.com", "secret"))
+
+    key = next(iter(auth.verified_credentials_cache._entries))
+    assert "secret" not in key
+    assert "admin" not in key
+
+
+def test_user_changes_clear_verified_credentials(verifications, session_factory):
+    client = TestClient(app)
+    assert client.get("/docs", auth=("admin@example.com", "secret")).status_code == 200
+
+    db = session_factory()
+    db.query(User).one().hashed_password = get_password_hash("changed")
+    db.commit()
+    db.close()
+
+    assert client.get("/docs", auth=("admin@example.com", "secret")).status_code == 401
+    assert client.get("/docs", auth=("admin@example.com", "changed")).status_code == 200
+
+
+def test_openapi_document_is_generated_once(verifications, monkeypatch):
+    monkeypatch.setattr(main, "openapi_body", None)
+    client = TestClient(app)
+    generated = []
+    openapi = app.openapi
+
+    def counting_openapi():
+        generated.append(1)
+        return openapi()
+
+    monkeypatch.setattr(app, "openapi", counting_openapi)
+
+    first = client.get("/openapi.json", auth=("admin@example.com", "secret"))
+    second = client.get("/openapi.json", auth=("admin@example.com", "secret"))
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers["content-type"] == "application/json"
+    assert first.content == second.content
+    assert "paths" in first.json()
+    assert generated == [1]
@@ -0,0 +1,227 @@
+import asyncio
+import uuid
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.sql_instrumentation import track_queries
+from app.crud import crud_product
+from app.crud.crud_product import create_products_bulk
+from app.models.product import Product, ProductSpecification
+from app.schemas.product import MAX_BULK_PRODUCTS, ProductBulkCreate, ProductCreate
+from app.services import image_service as image_service_module
+from app.services.image_service import ImageService
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+class FakeScraper:
+    """
+    Stands in for a store scraper; tracks how many page fetches run at the same time.
+    """
+    running = 0
+    max_running = 0
+
+    def __init__(self, product_url):
+        self.product_url = product_url
+
+    @classmethod
+    async def create(cls, product_url):
+        cls.running += 1
+        cls.max_running = max(cls.max_running, cls.running)
+        await asyncio.sleep(0.02)
+        cls.running -= 1
+
+        if "broken" in product_url:
+            raise RuntimeError("Failed to fetch page content")
+        return cls(product_url)
+
+    def scrape_product_data(self):
+        number = self.product_url.rsplit("/", 1)[-1]
+        return {
+            "in_stock": number != "0",
+            "description": f"Description {number}",
+            "full_name": f"Full name {number}",
+            "specifications": {"Color": "Black", "Size": number},
+            "image_urls": [f"https://store.example.com/img/{number}.jpg"],
+        }
+
+
+@pytest.fixture
+def db(monkeypatch, tables, session_factory, seed_blog, seed_store):
+    """
+    Creates one blog and store and replaces the scraper factory with FakeScraper.
+    """
+    monkeypatch.setattr(crud_product, "async_scraper_factory", FakeScraper.create)
+    FakeScraper.max_running = 0
+    session = session_factory()
+    seed_store(session, seed_blog(session))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def product_create(url: str, name: str) -> ProductCreate:
+    return ProductCreate(name=name, store_ids=[1], affiliate_urls=[url], seo_keyword=name.lower(), rating=4.5)
+
+
+class TwoImageScraper(FakeScraper):
+    """
+    FakeScraper returning two images per product.
+    """
+
+    def scrape_product_data(self):
+        data = super().scrape_product_data()
+        data["image_urls"].append(data["image_urls"][0].replace(".jpg", "-back.jpg"))
+        return data
+
+
+class FakeWordPressService:
+    """
+    Records each upload with whether its file was still on disk when WordPress received it.
+    """
+
+    def __init__(self):
+        self.uploads = []
+
+    async def upload_image(self, image_path, file_name, alt_text=None):
+        await asyncio.sleep(0.01)
+        self.uploads.append((file_name, Path(image_path).exists()))
+        return len(self.uploads)
+
+
+@pytest.fixture
+def local_image_service(monkeypatch, tmp_path):
+    """
+    A real ImageService working in a temporary directory, downloading a small generated image and
+    naming every product image after the product, so the images of one product share a file name.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        image_service_module.SettingsService, "get_settings",
+        staticmethod(lambda prefix, keys=(): {"width": 10, "height": 10, "file_name": "{name}", "alt_text": "{name}"})
+    )
+
+    async def download_image(self, image_url):
+        await asyncio.sleep(0)
+        path = self.image_dir / f"{uuid.uuid4()}.png"
+        Image.new("RGB", (20, 20)).save(path)
+        return path
+
+    monkeypatch.setattr(ImageService, "download_image", download_image)
+    return ImageService(FakeWordPressService())
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_bulk_create_reports_each_item(db):
+    products = [product_create(f"https://store.example.com/p/{i}", f"Product {i}") for i in range(3)]
+    products.insert(1, product_create("https://store.example.com/broken", "Broken"))
+
+    response = asyncio.run(create_products_bulk(db, blog_id=1, products=products))
+
+    assert response.created == 3
+    assert response.failed == 1
+    assert [result.status for result in response.results] == ["created", "failed", "created", "created"]
+    assert "Failed to fetch page content" in response.results[1].error
+
+    first = response.results[0].product
+    assert first.name == "Product 0"
+    assert first.in_stock is False
+    assert first.store_ids == [1]
+    assert first.specifications == {"Color": "Black", "Size": "0"}
+    assert [str(url) for url in first.image_urls] == ["https://store.example.com/img/0.jpg"]
+    assert db.query(Product).count() == 3
+
+
+def test_bulk_create_bounds_concurrency_and_batches_inserts(db):
+    products = [product_create(f"https://store.example.com/p/{i}", f"Product {i}") for i in range(12)]
+
+    with track_queries() as stats:
+        response = asyncio.run(create_products_bulk(db, blog_id=1, products=products, concurrency=3))
+
+    assert response.created == 12
+    assert 1 < FakeScraper.max_running <= 3
+    inserts = {shape.split(" (")[0]: count for shape, count in stats.fingerprints.items() if shape.startswith("INSERT")}
+    # SQLite has no insert sentinel for an ordered RETURNING, so only PostgreSQL batches the product rows.
+    assert inserts.pop("INSERT INTO products") <= 12
+    assert inserts == {
+        "INSERT INTO product_affiliate_urls": 1,
+        "INSERT INTO product_specifications": 1,
+        "INSERT INTO product_images": 1,
+        "INSERT INTO product_store_association": 1,
+    }
+    assert db.query(ProductSpecification).count() == 24
+
+
+class FakeImageService:
+    """
+    Records WordPress uploads with the ID of their product and how many run at the same time.
+    """
+
+    def __init__(self):
+        self.uploads = []
+        self.running = 0
+        self.max_running = 0
+
+    async def process_image(self, entity_type, entity, image_url):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        self.uploads.append((entity.id, image_url))
+        return len(self.uploads)
+
+
+def test_bulk_create_uploads_images_after_commit(db):
+    image_service = FakeImageService()
+    products = [product_create(f"https://store.example.com/p/{i}", f"Product {i}") for i in range(6)]
+
+    response = asyncio.run(create_products_bulk(db, blog_id=1, products=products, image_service=image_service, concurrency=2))
+
+    assert response.created == 6
+    assert len(image_service.uploads) == 6
+    assert all(product_id is not None for product_id, _ in image_service.uploads)
+    assert image_service.max_running == 1
+    assert sorted(image_id for result in response.results for image_id in result.product.image_ids) == [1, 2, 3, 4, 5, 6]
+
+
+def test_bulk_create_uploads_every_image_of_a_product(db, monkeypatch, local_image_service):
+    monkeypatch.setattr(crud_product, "async_scraper_factory", TwoImageScraper.create)
+    products = [product_create(f"https://store.example.com/p/{i}", f"Product {i}") for i in range(2)]
+
+    response = asyncio.run(create_products_bulk(db, blog_id=1, products=products, image_service=local_image_service))
+
+    assert response.created == 2
+    assert local_image_service.wordpress_service.uploads == [
+        ("Product-0", True), ("Product-0", True), ("Product-1", True), ("Product-1", True)
+    ]
+    assert sorted(image_id for result in response.results for image_id in result.product.image_ids) == [1, 2, 3, 4]
+
+
+def test_bulk_create_does_not_upload_images_of_a_rolled_back_batch(db, monkeypatch):
+    image_service = FakeImageService()
+    products = [product_create(f"https://store.example.com/p/{i}", f"Product {i}") for i in range(2)]
+
+    def failing_counter_deltas(db, deltas):
+        raise SQLAlchemyError("insert failed")
+    monkeypatch.setattr(crud_product, "DASHBOARD_COUNTERS_ENABLED", True)
+    monkeypatch.setattr(crud_product, "apply_counter_deltas", failing_counter_deltas)
+
+    response = asyncio.run(create_products_bulk(db, blog_id=1, products=products, image_service=image_service))
+
+    assert response.failed == 2
+    assert image_service.uploads == []
+    assert db.query(Product).count() == 0
+
+
+def test_bulk_request_size_is_limited():
+    product = product_create("https://store.example.com/p/1", "Product")
+
+    with pytest.raises(ValidationError):
+        ProductBulkCreate(products=[product] * (MAX_BULK_PRODUCTS + 1))
+    with pytest.raises(ValidationError):
+        ProductBulkCreate(products=[])
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from app.core.sql_instrumentation import track_queries
+from app.crud.crud_product import update_product
+from app.models.product import Product, ProductAffiliateURL, ProductCon, ProductPro, ProductSpecification
+from app.schemas.product import ProductUpdate
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+SPEC_COUNT = 40
+SPECIFICATIONS = {f"Spec {i}": f"Value {i}" for i in range(SPEC_COUNT)}
+PROS = ["Fast", "Quiet", "Cheap"]
+
+
+@pytest.fixture
+def db(tables, session_factory, seed_blog, seed_store):
+    """
+    Seeds one product with 40 specifications, a few pros and cons and an affiliate URL.
+    """
+    session = session_factory()
+
+    blog = seed_blog(session)
+    store = seed_store(session, blog)
+    session.add(Product(
+        blog_id=blog.id,
+        name="Product",
+        seo_keyword="product",
+        rating=4.0,
+        stores=[store],
+        affiliate_urls=[ProductAffiliateURL(url="https://store.example.com/p/1")],
+        specifications=[ProductSpecification(spec_key=k, spec_value=v) for k, v in SPECIFICATIONS.items()],
+        pros=[ProductPro(text=text) for text in PROS],
+        cons=[ProductCon(text="Heavy")],
+    ))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def product_update(**changes) -> ProductUpdate:
+    data = {
+        "name": "Product",
+        "store_ids": [1],
+        "affiliate_urls": ["https://store.example.com/p/1"],
+        "seo_keyword": "product",
+        "rating": 4.0,
+        "in_stock": None,
+        "full_name": None,
+        "description": None,
+        "specifications": SPECIFICATIONS,
+        "image_urls": None,
+        "image_ids": None,
+        "review": None,
+        "pros": PROS,
+        "cons": ["Heavy"],
+    }
+    data.update(changes)
+    return ProductUpdate(**data)
+
+
+def write_statements(stats):
+    return [shape for shape in stats.fingerprints if not shape.startswith("SELECT")]
+
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_unchanged_collections_are_not_rewritten(db):
+    with track_queries() as stats:
+        asyncio.run(update_product(db, blog_id=1, product_id=1, product_update=product_update()))
+
+    assert write_statements(stats) == []
+
+
+def test_editing_one_pro_updates_one_row(db):
+    pro_ids = [pro.id for pro in db.get(Product, 1).pros]
+
+    with track_queries() as stats:
+        result = asyncio.run(update_product(
+            db, blog_id=1, product_id=1, product_update=product_update(pros=["Fast", "Silent", "Cheap"])))
+
+    assert write_statements(stats) == ["UPDATE product_pros SET text=? WHERE product_pros.id = ?"]
+    assert result.pros == ["Fast", "Silent", "Cheap"]
+    assert result.specifications == SPECIFICATIONS
+    assert [pro.id for pro in db.get(Product, 1).pros] == pro_ids
+
+
+def test_collections_grow_shrink_and_match_by_key(db):
+    specifications = {k: v for k, v in SPECIFICATIONS.items() if k != "Spec 0"}
+    specifications["Spec 1"] = "Changed"
+    specifications["Spec 40"] = "New"
+
+    result = asyncio.run(update_product(
+        db, blog_id=1, product_id=1,
+        product_update=product_update(specifications=specifications, pros=["Fast"], cons=["Heavy", "Loud"])))
+
+    assert result.specifications == specifications
+    assert result.pros == ["Fast"]
+    assert result.cons == ["Heavy", "Loud"]
+    assert db.query(ProductPro).count() == 1
+    assert db.query(ProductSpecification).count() == SPEC_COUNT
+
+
+def test_reordered_collections_keep_the_requested_order(db):
+    specifications = dict(reversed(list(SPECIFICATIONS.items())))
+    specifications["Spec 40"] = "New"
+
+    result = asyncio.run(update_product(
+        db, blog_id=1, product_id=1, product_update=product_update(specifications=specifications)))
+
+    assert list(result.specifications.items()) == list(specifications.items())
+    assert db.query(ProductSpecification).count() == SPEC_COUNT + 1
+
+
+def test_specifications_added_before_existing_ones_keep_the_requested_order(db):
+    specifications = {"Spec 40": "New", **SPECIFICATIONS}
+
+    result = asyncio.run(update_product(
+        db, blog_id=1, product_id=1, product_update=product_update(specifications=specifications)))
+
+    assert list(result.specifications.items()) == list(specifications.items())
@@ -0,0 +1,120 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.crud import crud_dashboard
+from app.crud.crud_dashboard import count_dashboard_stats, get_dashboard_stats, refresh_blog_counters
+from app.models.article import Article
+from app.models.blog_counters import BlogCounters
+from app.models.product import Product
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+@pytest.fixture
+def db(tables, session_factory, seed_blog):
+    """
+    Seeds two blogs with products and articles in every counted state.
+    """
+    session = session_factory()
+
+    for b in range(2):
+        blog = seed_blog(session, name=f"Blog {b}", base_url=f"https://blog{b}.example.com")
+        session.add_all([
+            Product(blog_id=blog.id, name="In stock", seo_keyword="a", rating=4.0, in_stock=True),
+            Product(blog_id=blog.id, name="Out of stock", seo_keyword="b", rating=4.0, in_stock=False),
+            Product(blog_id=blog.id, name="Unchecked", seo_keyword="c", rating=4.0, in_stock=None),
+            Article(blog_id=blog.id, title="Published", slug="published", status="publish"),
+            Article(blog_id=blog.id, title="Draft", slug="draft", status="draft"),
+            Article(blog_id=blog.id, title="Draft 2", slug="draft-2"),
+        ])
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def counters_enabled(monkeypatch):
+    """
+    Turns on the maintained counters for the duration of a test.
+    """
+    monkeypatch.setattr(crud_dashboard, "DASHBOARD_COUNTERS_ENABLED", True)
+    event.listen(Session, "after_flush", crud_dashboard._track_counter_changes)
+    try:
+        yield
+    finally:
+        event.remove(Session, "after_flush", crud_dashboard._track_counter_changes)
+
+
+def assert_counters_match(db, blog_id):
+    db.expire_all()
+    counters = db.get(BlogCounters, blog_id)
+    assert counters is not None
+    expected = count_dashboard_stats(db, blog_id)
+    assert get_dashboard_stats(db, blog_id) == expected
+
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_stats_use_a_single_query(db, engine):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        stats = get_dashboard_stats(db, blog_id=1)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert len(statements) == 1
+    assert stats.published_articles_count == 1
+    assert stats.draft_articles_count == 2
+    assert stats.total_products_count == 3
+    assert stats.out_of_stock_products_count == 1
+
+
+def test_counters_follow_writes(db, counters_enabled):
+    assert get_dashboard_stats(db, blog_id=1).total_products_count == 3
+    assert db.get(BlogCounters, 1) is None
+
+    refresh_blog_counters(db, blog_id=1)
+    db.commit()
+
+    db.add(Product(blog_id=1, name="New", seo_keyword="d", rating=4.0, in_stock=False))
+    db.add(Article(blog_id=1, title="New", slug="new", status="publish"))
+    db.commit()
+    assert_counters_match(db, 1)
+
+    product = db.query(Product).filter(Product.name == "Unchecked", Product.blog_id == 1).one()
+    product.in_stock = False
+    article = db.query(Article).filter(Article.title == "Draft", Article.blog_id == 1).one()
+    article.status = "publish"
+    db.commit()
+    assert_counters_match(db, 1)
+
+    db.delete(db.query(Product).filter(Product.name == "Out of stock", Product.blog_id == 1).one())
+    db.delete(db.query(Article).filter(Article.title == "Draft 2", Article.blog_id == 1).one())
+    db.commit()
+    assert_counters_match(db, 1)
+
+    stats = get_dashboard_stats(db, blog_id=1)
+    assert stats.published_articles_count == 3
+    assert stats.draft_articles_count == 0
+    assert stats.total_products_count == 3
+    assert stats.out_of_stock_products_count == 2
+    assert db.get(BlogCounters, 2) is None
+
+
+def test_counters_recount_when_previous_value_is_unknown(db, counters_enabled):
+    refresh_blog_counters(db, blog_id=1)
+    db.commit()
+
+    product = db.query(Product).filter(Product.name == "In stock", Product.blog_id == 1).one()
+    db.expire(product, ["in_stock"])
+    product.in_stock = False
+    db.commit()
+
+    assert_counters_match(db, 1)
+    assert get_dashboard_stats(db, blog_id=1).out_of_stock_products_count == 2
@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import create_engine, exc
+
+from app.core.db_pool import InstrumentedQueuePool, PoolStats, get_pool_stats
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+@pytest.fixture
+def engine(tmp_path):
+    """
+    A file-backed SQLite engine with a single-connection instrumented pool and a short timeout.
+    """
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_pool_stats_track_checkouts_and_timeouts(engine):
+    connection = engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    stats = get_pool_stats(engine)
+    assert stats["pool_size"] == 1
+    assert stats["checked_out"] == 1
+    assert stats["overflow"] == 0
+    assert stats["checkouts"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["p99_wait_ms"] >= 50
+
+    connection.close()
+    assert get_pool_stats(engine)["checked_out"] == 0
+
+
+def test_pool_stats_survive_dispose(engine):
+    engine.connect().close()
+    engine.dispose()
+    engine.connect().close()
+
+    assert get_pool_stats(engine)["checkouts"] == 2
+
+
+def test_uninstrumented_engine_has_no_stats():
+    assert get_pool_stats(create_engine("sqlite://")) is None
+    assert get_pool_stats(None) is None
+
+
+def test_p99_uses_the_slowest_samples():
+    stats = PoolStats(sample_size=100)
+    for _ in range(98):
+        stats.record_checkout(0.001)
+    stats.record_checkout(0.5)
+    stats.record_checkout(1.0)
+
+    snapshot = stats.snapshot()
+    assert snapshot["p99_wait_ms"] == 1000.0
+    assert snapshot["avg_wait_ms"] == pytest.approx(15.98)
+    assert snapshot["sample_size"] == 100
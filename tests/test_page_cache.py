@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.scrapers import base_scraper
+from app.scrapers.emag_scraper import EmagScraper
+from app.scrapers.page_cache import PageCache, normalize_url
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+PAGE = b'<html><body><h1 class="page-title">Laptop X</h1>' + b"<p>filler</p>" * 500 + b"</body></html>"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    page_cache = PageCache(str(tmp_path / "cache" / "pages.sqlite3"))
+    yield page_cache
+    page_cache.close()
+
+
+@pytest.fixture
+def provider_calls(monkeypatch, cache):
+    """
+    Serves provider requests from PAGE and routes scrapers through the temporary cache.
+    """
+    monkeypatch.setattr(base_scraper, "get_page_cache", lambda: cache)
+    monkeypatch.setattr(
+        base_scraper.SettingsService, "get_settings",
+        staticmethod(lambda prefix, keys=(): {"crawlbase_api_key": "crawl", "scrapingfish_api_key": "fish"})
+    )
+    calls = []
+
+    def handle(request):
+        calls.append(str(request.url))
+        return httpx.Response(200, content=PAGE)
+
+    monkeypatch.setattr(
+        base_scraper, "get_async_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handle))
+    )
+    return calls
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_normalize_url_drops_tracking_and_fragments():
+    assert normalize_url("HTTPS://WWW.emag.ro/laptop-x/pd/D1/?utm_source=blog&ref=home&b=2&a=1#reviews") == \
+        "https://www.emag.ro/laptop-x/pd/D1?a=1&b=2"
+    assert normalize_url("https://www.emag.ro/laptop-x/pd/D1") == normalize_url("https://www.emag.ro/laptop-x/pd/D1/")
+
+
+def test_pages_are_stored_compressed_and_expire(cache):
+    cache.set("https://www.emag.ro/p/1?utm_medium=x", PAGE)
+
+    assert cache.get("https://www.emag.ro/p/1", max_age=60) == PAGE
+    stored = cache._connect().execute("SELECT size FROM pages").fetchone()[0]
+    assert stored < len(PAGE) / 5
+
+    time.sleep(0.02)
+    assert cache.get("https://www.emag.ro/p/1", max_age=0.01) is None
+    assert cache.get("https://www.emag.ro/p/1", max_age=0) is None
+
+
+def test_least_recently_read_pages_are_evicted(cache):
+    cache.set("https://www.emag.ro/p/1", PAGE)
+    size = cache._connect().execute("SELECT size FROM pages").fetchone()[0]
+    cache.max_bytes = size * 2
+
+    cache.set("https://www.emag.ro/p/2", PAGE)
+    time.sleep(0.01)
+    cache.get("https://www.emag.ro/p/1", max_age=60)
+    cache.set("https://www.emag.ro/p/3", PAGE)
+
+    assert cache.get("https://www.emag.ro/p/1", max_age=60) == PAGE
+    assert cache.get("https://www.emag.ro/p/2", max_age=60) is None
+    assert cache.get("https://www.emag.ro/p/3", max_age=60) == PAGE
+
+
+def test_scrapers_reuse_cached_pages_within_the_ttl(provider_calls):
+    first = asyncio.run(EmagScraper.create("https://www.emag.ro/laptop-x?utm_source=a"))
+    second = asyncio.run(EmagScraper.create("https://www.emag.ro/laptop-x", fields={"full_name"}, cache_ttl=60))
+
+    assert first.get_full_name() == second.get_full_name() == "Laptop X"
+    assert len(provider_calls) == 1
+
+
+def test_zero_ttl_always_fetches(provider_calls):
+    asyncio.run(EmagScraper.create("https://www.emag.ro/laptop-x"))
+    asyncio.run(EmagScraper.create("https://www.emag.ro/laptop-x", cache_ttl=0))
+
+    assert len(provider_calls) == 2
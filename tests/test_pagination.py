@@ -0,0 +1,109 @@
+import base64
+
+import pytest
+
+from app.models.product import Product
+from app.crud.crud_product import get_products
+from app.crud.pagination import decode_cursor, encode_cursor
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+@pytest.fixture(scope="module")
+def db(module_tables, session_factory, seed_blog):
+    """
+    Seeds one blog with products whose full names repeat and are sometimes NULL,
+    to exercise the (sort_field, id) tie-breaking of keyset pagination.
+    """
+    session = session_factory()
+    blog = seed_blog(session)
+
+    full_names = ["b", "a", None, "c", "a", None, "b", "d", "a", "c", None]
+    for i, full_name in enumerate(full_names):
+        session.add(Product(blog_id=blog.id, name=f"Product {i}", full_name=full_name, seo_keyword=f"keyword-{i}", rating=float(i)))
+    session.commit()
+    try:
+        yield session, blog.id
+    finally:
+        session.close()
+
+
+def walk_pages(session, blog_id, **kwargs):
+    """
+    Follows next_cursor until the last page and returns the IDs in the order they were served.
+    """
+    ids, cursor = [], ""
+    while cursor is not None:
+        page = get_products(session, blog_id=blog_id, limit=3, cursor=cursor, **kwargs)
+        ids.extend(product.id for product in page["products"])
+        cursor = page["next_cursor"]
+    return ids
+
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+@pytest.mark.parametrize("sort_field, sort_order", [
+    (None, None),
+    ("full_name", 1),
+    ("full_name", -1),
+    ("rating", -1),
+])
+def test_cursor_pages_cover_every_row_once(db, sort_field, sort_order):
+    session, blog_id = db
+
+    ids = walk_pages(session, blog_id, sort_field=sort_field, sort_order=sort_order)
+
+    all_ids = [id_ for (id_,) in session.query(Product.id).filter(Product.blog_id == blog_id)]
+    assert sorted(ids) == sorted(all_ids)
+    assert len(ids) == len(set(ids))
+
+
+def test_cursor_pages_follow_sort_order_with_nulls_last(db):
+    session, blog_id = db
+
+    ids = walk_pages(session, blog_id, sort_field="full_name", sort_order=1)
+
+    products = {p.id: p for p in session.query(Product).filter(Product.blog_id == blog_id)}
+    names = [products[id_].full_name for id_ in ids]
+    non_null = [name for name in names if name is not None]
+    assert non_null == sorted(non_null)
+    assert names[len(non_null):] == [None] * (len(names) - len(non_null))
+
+
+def test_offset_mode_is_unchanged(db):
+    session, blog_id = db
+
+    result = get_products(session, blog_id=blog_id, skip=0, limit=3)
+
+    assert "next_cursor" not in result
+    assert result["total_records"] == 11
+    assert len(result["products"]) == 3
+
+
+def test_count_none_skips_total_records(db):
+    session, blog_id = db
+
+    result = get_products(session, blog_id=blog_id, limit=3, cursor="", count="none")
+
+    assert result["total_records"] is None
+    assert result["next_cursor"] is not None
+
+
+def test_cursor_must_match_requested_sort(db):
+    session, blog_id = db
+    cursor = encode_cursor("full_name", 1, "a", 1)
+
+    with pytest.raises(ValueError):
+        get_products(session, blog_id=blog_id, cursor=cursor, sort_field="rating")
+
+
+@pytest.mark.parametrize("payload", ['[1, 2]', '42', '"text"', 'null'])
+def test_cursor_that_is_not_an_object_is_rejected(payload):
+    cursor = base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+def test_malformed_cursor_is_rejected():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
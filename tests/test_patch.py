@@ -0,0 +1,119 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from app.core.sql_instrumentation import track_queries
+from app.database import get_db
+from app.dependencies.auth import get_current_user
+from app.models.article import Article, ArticleSEOKeyword
+from app.models.product import Product, ProductAffiliateURL, ProductPro, ProductSpecification
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+@pytest.fixture
+def client(monkeypatch, tables, session_factory, seed_blog, seed_store):
+    """
+    Seeds one product and one article and routes the API to the test database.
+    """
+    session = session_factory()
+    blog = seed_blog(session)
+    store = seed_store(session, blog)
+    session.add(Product(
+        blog_id=blog.id,
+        name="Product",
+        seo_keyword="product",
+        rating=4.0,
+        description="Old description",
+        stores=[store],
+        affiliate_urls=[ProductAffiliateURL(url="https://store.example.com/p/1")],
+        specifications=[ProductSpecification(spec_key="Color", spec_value="Black")],
+        pros=[ProductPro(text="Fast")],
+    ))
+    session.add(Article(
+        blog_id=blog.id,
+        title="Article",
+        slug="article",
+        status="draft",
+        main_image_url="https://blog.example.com/main.jpg",
+        buyers_guide_image_url="https://blog.example.com/guide.jpg",
+        seo_keywords=[ArticleSEOKeyword(keyword="keyword")],
+    ))
+    session.commit()
+    session.close()
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setitem(app.dependency_overrides, get_db, override_get_db)
+    monkeypatch.setitem(app.dependency_overrides, get_current_user, lambda: None)
+    return TestClient(app)
+
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_patch_product_changes_only_sent_fields(client):
+    response = client.patch("/api/v1/1/products/1", json={"review": "Great", "description": None})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["review"] == "Great"
+    assert data["description"] is None
+    assert data["name"] == "Product"
+    assert data["specifications"] == {"Color": "Black"}
+    assert data["pros"] == ["Fast"]
+
+
+def test_patch_product_minimal_response_skips_reload(client):
+    with track_queries() as stats:
+        response = client.patch("/api/v1/1/products/1?minimal=true", json={"pros": ["Fast", "Quiet"]})
+
+    assert response.status_code == 200
+    assert response.json() == {"id": 1, "blog_id": 1, "updated_fields": ["pros"]}
+    loaded_tables = {shape.split(" FROM ")[1].split(" ")[0] for shape in stats.fingerprints if shape.startswith("SELECT")}
+    assert loaded_tables == {"products", "product_pros"}
+
+    product = client.get("/api/v1/1/products/1").json()
+    assert product["pros"] == ["Fast", "Quiet"]
+
+
+def test_patch_article_ignores_null_for_required_fields(client):
+    response = client.patch("/api/v1/1/articles/1", json={"title": None, "status": "publish", "seo_keywords": ["a", "b"]})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["title"] == "Article"
+    assert data["status"] == "publish"
+    assert data["seo_keywords"] == ["a", "b"]
+
+
+def test_patch_missing_product_returns_404(client):
+    assert client.patch("/api/v1/1/products/999", json={"review": "x"}).status_code == 404
+
+
+def test_patch_article_clears_image_url_with_null(client):
+    response = client.patch("/api/v1/1/articles/1", json={"main_image_url": None})
+
+    assert response.status_code == 200
+    assert response.json()["main_image_url"] is None
+    assert response.json()["buyers_guide_image_url"] == "https://blog.example.com/guide.jpg"
+    assert client.get("/api/v1/1/articles/1").status_code == 200
+
+
+def test_patch_reports_only_applied_fields(client):
+    response = client.patch(
+        "/api/v1/1/products/1?minimal=true",
+        json={"name": None, "seo_keyword": None, "pros": None, "review": None, "rating": 5.0}
+    )
+
+    assert response.json()["updated_fields"] == ["rating", "review"]
+    product = client.get("/api/v1/1/products/1").json()
+    assert product["name"] == "Product"
+    assert product["seo_keyword"] == "product"
+    assert product["pros"] == ["Fast"]
+
+    response = client.patch("/api/v1/1/articles/1?minimal=true", json={"slug": None, "faqs": None, "meta_title": None})
+    assert response.json()["updated_fields"] == ["meta_title"]
@@ -0,0 +1,188 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.scrapers import base_scraper, provider_health
+from app.scrapers.emag_scraper import EmagScraper
+from app.scrapers.provider_health import CLOSED, HALF_OPEN, OPEN, ProviderHealth, ProviderSelector
+from app.scrapers.scraper_factory import scraper_factory
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+PAGE = b'<html><body><h1 class="page-title">Laptop X</h1></body></html>'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Replaces the monotonic clock of the circuit breaker with one moved by the test.
+    """
+    now = {"value": 1000.0}
+    monkeypatch.setattr(provider_health.time, "monotonic", lambda: now["value"])
+    return now
+
+
+@pytest.fixture
+def selector():
+    return ProviderSelector()
+
+
+@pytest.fixture
+def transport(monkeypatch, selector):
+    """
+    Serves provider requests from a handler set by the test, with a fresh provider selector and no page cache.
+    """
+    monkeypatch.setattr(base_scraper, "get_page_cache", lambda: None)
+    monkeypatch.setattr(base_scraper, "provider_selector", selector)
+    monkeypatch.setattr(
+        base_scraper.SettingsService, "get_settings",
+        staticmethod(lambda prefix, keys=(): {"crawlbase_api_key": "crawl", "scrapingfish_api_key": "fish"})
+    )
+    state = {"handler": None, "requests": []}
+
+    async def handle(request):
+        state["requests"].append(request.url.host)
+        return await state["handler"](request)
+
+    monkeypatch.setattr(
+        base_scraper, "get_async_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handle))
+    )
+    return state
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_circuit_opens_on_error_rate(clock):
+    health = ProviderHealth("crawlbase", window=10, min_requests=4, error_rate=0.5, cooldown=30)
+    health.record(True, 0.1)
+    health.record(False, 0.1)
+    health.record(True, 0.1)
+    assert health.state == CLOSED
+
+    health.record(False, 0.1)
+    assert health.state == OPEN
+    assert not health.is_available()
+
+
+def test_circuit_half_opens_after_cooldown_with_a_single_trial(clock):
+    health = ProviderHealth("crawlbase", window=10, min_requests=1, error_rate=0.5, cooldown=30)
+    health.record(False, 0.1)
+    clock["value"] += 30
+
+    assert health.state == HALF_OPEN
+    assert health.is_available()
+    health.begin()
+    assert not health.is_available()
+
+    health.record(False, 0.1)
+    assert health.state == OPEN
+
+    clock["value"] += 30
+    health.begin()
+    health.record(True, 0.1)
+    assert health.state == CLOSED
+    assert health.snapshot()["requests"] == 1
+
+
+def test_lost_trial_frees_its_slot_after_cooldown(clock):
+    health = ProviderHealth("crawlbase", min_requests=1, cooldown=30)
+    health.record(False, 0.1)
+    clock["value"] += 30
+    health.begin()
+    assert not health.is_available()
+
+    clock["value"] += 30
+    assert health.is_available()
+
+
+def test_snapshot_reports_error_rate_and_latency_percentiles():
+    health = ProviderHealth("crawlbase", window=100, min_requests=100)
+    for i in range(1, 101):
+        health.record(i % 4 != 0, i / 1000)
+
+    snapshot = health.snapshot()
+    assert snapshot["error_rate"] == 0.25
+    assert snapshot["p50_latency_ms"] == 51.0
+    assert snapshot["p95_latency_ms"] == 96.0
+
+
+def test_open_providers_are_tried_last(selector, clock):
+    assert selector.order() == ["crawlbase", "scrapingfish"]
+    for _ in range(provider_health.SCRAPER_CIRCUIT_MIN_REQUESTS):
+        selector.record("crawlbase", False, 0.1)
+
+    assert selector.order() == ["scrapingfish", "crawlbase"]
+
+
+def test_fetch_skips_a_provider_with_an_open_circuit(transport, selector):
+    async def handler(request):
+        return httpx.Response(200, content=PAGE)
+    transport["handler"] = handler
+    for _ in range(provider_health.SCRAPER_CIRCUIT_MIN_REQUESTS):
+        selector.record("crawlbase", False, 0.1)
+
+    scraper = asyncio.run(EmagScraper.create("https://www.emag.ro/laptop-x"))
+
+    assert scraper.get_full_name() == "Laptop X"
+    assert transport["requests"] == ["scraping.narf.ai"]
+
+
+def test_fetch_records_provider_outcomes(transport, selector):
+    async def handler(request):
+        if request.url.host == "api.crawlbase.com":
+            return httpx.Response(503)
+        return httpx.Response(200, content=PAGE)
+    transport["handler"] = handler
+
+    asyncio.run(EmagScraper.create("https://www.emag.ro/laptop-x"))
+
+    crawlbase, scrapingfish = selector.snapshot()
+    assert (crawlbase["provider"], crawlbase["requests"], crawlbase["error_rate"]) == ("crawlbase", 1, 1.0)
+    assert (scrapingfish["provider"], scrapingfish["requests"], scrapingfish["error_rate"]) == ("scrapingfish", 1, 0.0)
+
+
+def test_slow_provider_is_hedged(transport, monkeypatch):
+    monkeypatch.setattr(base_scraper, "SCRAPER_HEDGE_AFTER", 0.05)
+    cancelled = []
+
+    async def handler(request):
+        if request.url.host == "api.crawlbase.com":
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(request.url.host)
+                raise
+        return httpx.Response(200, content=PAGE)
+    transport["handler"] = handler
+
+    scraper = asyncio.run(EmagScraper.create("https://www.emag.ro/laptop-x"))
+
+    assert scraper.get_full_name() == "Laptop X"
+    assert transport["requests"] == ["api.crawlbase.com", "scraping.narf.ai"]
+    assert cancelled == ["api.crawlbase.com"]
+
+
+def test_fast_provider_is_not_hedged(transport, monkeypatch):
+    monkeypatch.setattr(base_scraper, "SCRAPER_HEDGE_AFTER", 1)
+
+    async def handler(request):
+        return httpx.Response(200, content=PAGE)
+    transport["handler"] = handler
+
+    asyncio.run(EmagScraper.create("https://www.emag.ro/laptop-x"))
+
+    assert transport["requests"] == ["api.crawlbase.com"]
+
+
+def test_blocking_factory_uses_the_async_provider_path(transport, selector):
+    async def handler(request):
+        return httpx.Response(200, content=PAGE)
+    transport["handler"] = handler
+    for _ in range(provider_health.SCRAPER_CIRCUIT_MIN_REQUESTS):
+        selector.record("crawlbase", False, 0.1)
+
+    scraper = scraper_factory("https://www.emag.ro/laptop-x")
+
+    assert scraper.get_full_name() == "Laptop X"
+    assert transport["requests"] == ["scraping.narf.ai"]
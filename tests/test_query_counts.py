@@ -0,0 +1,133 @@
+import pytest
+
+from app.core.sql_instrumentation import track_queries
+from app.models.article import Article, ArticleSEOKeyword, ArticleFAQ, Category
+from app.models.product import Product, ProductAffiliateURL, ProductSpecification, ProductImage, ProductPro, ProductCon
+from app.crud.crud_product import get_products, get_product_by_id, get_out_of_stock_products_with_articles
+from app.crud.crud_article import get_articles, get_latest_articles
+from app.services.exporter.exporter_service import export_products, export_articles
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+PRODUCT_COUNT = 30
+
+
+@pytest.fixture(scope="module")
+def db(module_tables, session_factory, seed_blog, seed_store):
+    """
+    Creates the schema in an in-memory database and seeds one blog with products and articles,
+    each of them having every child collection populated.
+    """
+    session = session_factory()
+    blog = seed_blog(session)
+    store = seed_store(session, blog)
+
+    for i in range(PRODUCT_COUNT):
+        product = Product(
+            blog_id=blog.id,
+            name=f"Product {i}",
+            seo_keyword=f"keyword-{i}",
+            rating=4.0,
+            in_stock=False,
+            stores=[store],
+            affiliate_urls=[ProductAffiliateURL(url=f"https://store.example.com/p/{i}")],
+            specifications=[ProductSpecification(spec_key="Color", spec_value="Black")],
+            images=[ProductImage(image_url=f"https://store.example.com/img/{i}.jpg", wp_id=i)],
+            pros=[ProductPro(text="Good")],
+            cons=[ProductCon(text="Bad")],
+        )
+        product.articles = [Article(
+            blog_id=blog.id,
+            title=f"Article {i}",
+            slug=f"article-{i}",
+            main_image_url="https://blog.example.com/main.jpg",
+            buyers_guide_image_url="https://blog.example.com/guide.jpg",
+            categories=[Category(wp_id=1)],
+            seo_keywords=[ArticleSEOKeyword(keyword=f"keyword-{i}")],
+            faqs=[ArticleFAQ(question="Question?", answer="Answer")],
+        )]
+        session.add(product)
+
+    session.commit()
+    try:
+        yield session, blog.id
+    finally:
+        session.close()
+
+
+def count_queries(session, fn, **kwargs) -> int:
+    """
+    Runs `fn` against a clean identity map and returns the number of statements it issued.
+    """
+    session.expunge_all()
+    with track_queries() as stats:
+        fn(session, **kwargs)
+    return stats.statement_count
+
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_get_products_query_count_is_independent_of_page_size(db, engine, assert_constant_query_count):
+    session, blog_id = db
+
+    assert_constant_query_count(
+        engine,
+        lambda size: count_queries(session, get_products, blog_id=blog_id, limit=size),
+        sizes=(2, PRODUCT_COUNT),
+    )
+
+
+def test_get_product_by_id_loads_relationships_eagerly(db):
+    session, blog_id = db
+    product_id = session.query(Product.id).filter(Product.blog_id == blog_id).first()[0]
+
+    queries = count_queries(session, get_product_by_id, blog_id=blog_id, product_id=product_id)
+
+    assert queries <= 7
+
+
+def test_export_products_query_count_is_independent_of_page_size(db, engine, assert_constant_query_count):
+    session, blog_id = db
+
+    assert_constant_query_count(
+        engine,
+        lambda size: count_queries(session, export_products, blog_id=blog_id, limit=size),
+        sizes=(2, PRODUCT_COUNT),
+    )
+
+
+def test_out_of_stock_products_query_count_is_bounded(db):
+    session, blog_id = db
+
+    queries = count_queries(session, get_out_of_stock_products_with_articles, blog_id=blog_id)
+
+    assert queries < PRODUCT_COUNT
+
+
+def test_get_articles_query_count_is_independent_of_page_size(db, engine, assert_constant_query_count):
+    session, blog_id = db
+
+    assert_constant_query_count(
+        engine,
+        lambda size: count_queries(session, get_articles, blog_id=blog_id, limit=size),
+        sizes=(2, PRODUCT_COUNT),
+    )
+
+
+def test_get_latest_articles_query_count_is_independent_of_limit(db, engine, assert_constant_query_count):
+    session, blog_id = db
+
+    assert_constant_query_count(
+        engine,
+        lambda size: count_queries(session, get_latest_articles, blog_id=blog_id, limit=size),
+        sizes=(2, PRODUCT_COUNT),
+    )
+
+
+def test_export_articles_query_count_is_independent_of_page_size(db, engine, assert_constant_query_count):
+    session, blog_id = db
+
+    assert_constant_query_count(
+        engine,
+        lambda size: count_queries(session, export_articles, blog_id=blog_id, limit=size),
+        sizes=(2, PRODUCT_COUNT),
+    )
@@ -0,0 +1,148 @@
+import re
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.models.prompt import Prompt
+from app.models.stock_check_log import StockCheckLog
+from app.models.article import Article, ArticleSEOKeyword, ArticleFAQ, Category
+from app.models.product import Product, ProductAffiliateURL, ProductSpecification, ProductImage, ProductPro, ProductCon
+from app.crud.crud_product import get_products, get_out_of_stock_products_with_articles
+from app.crud.crud_article import get_articles, get_latest_articles
+from app.crud.crud_store import get_stores
+from app.crud.crud_prompt import get_prompts
+from app.crud.crud_dashboard import get_dashboard_stats
+from app.crud.crud_stock_check_log import get_stock_check_logs
+from scripts.update_stock import get_products_to_check
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+BLOG_COUNT = 4
+PRODUCTS_PER_BLOG = 50
+
+# Small lookup tables that are fine to scan.
+UNINDEXED_TABLES = {"blogs", "users", "settings", "setup_status"}
+
+HOT_QUERIES = [
+    ("get_products", lambda db, blog_id: get_products(db, blog_id=blog_id, limit=20)),
+    ("get_products (cursor)", lambda db, blog_id: get_products(db, blog_id=blog_id, limit=20, cursor="", sort_field="last_checked")),
+    ("get_out_of_stock_products_with_articles", lambda db, blog_id: get_out_of_stock_products_with_articles(db, blog_id=blog_id)),
+    ("get_articles", lambda db, blog_id: get_articles(db, blog_id=blog_id, limit=20)),
+    ("get_latest_articles", lambda db, blog_id: get_latest_articles(db, blog_id=blog_id, limit=5)),
+    ("get_stores", lambda db, blog_id: get_stores(db, blog_id=blog_id)),
+    ("get_prompts", lambda db, blog_id: get_prompts(db, blog_id=blog_id)),
+    ("get_dashboard_stats", lambda db, blog_id: get_dashboard_stats(db, blog_id=blog_id)),
+    ("get_stock_check_logs", lambda db, blog_id: get_stock_check_logs(
+        db, blog_id=blog_id, start_date=datetime(2024, 1, 1), end_date=datetime(2024, 12, 31))),
+    ("get_products_to_check", lambda db, blog_id: get_products_to_check(
+        db, blog_id, threshold_time=datetime.now() - timedelta(days=14))),
+]
+
+
+@pytest.fixture(scope="module")
+def db(module_tables, engine, session_factory, seed_blog, seed_store):
+    """
+    Seeds several blogs with products, articles and logs so the planner has a realistic choice to make.
+    The indexes come from the model declarations; test_migrations checks that the migrations create the same ones.
+    """
+    session = session_factory()
+
+    for b in range(BLOG_COUNT):
+        blog = seed_blog(session, name=f"Blog {b}", base_url=f"https://blog{b}.example.com")
+        store = seed_store(session, blog, name=f"Store {b}", base_url=f"https://store{b}.example.com")
+        session.add(Prompt(blog_id=blog.id, name="Review", type="Product", subtype="Review", text="Review {name}."))
+
+        for i in range(PRODUCTS_PER_BLOG):
+            product = Product(
+                blog_id=blog.id,
+                name=f"Product {i}",
+                seo_keyword=f"keyword-{i}",
+                rating=4.0,
+                in_stock=i % 3 != 0,
+                last_checked=datetime(2024, 1, 1) + timedelta(days=i),
+                stores=[store],
+                affiliate_urls=[ProductAffiliateURL(url=f"https://store{b}.example.com/p/{i}")],
+                specifications=[ProductSpecification(spec_key="Color", spec_value="Black")],
+                images=[ProductImage(image_url=f"https://store{b}.example.com/img/{i}.jpg")],
+                pros=[ProductPro(text="Good")],
+                cons=[ProductCon(text="Bad")],
+            )
+            product.articles = [Article(
+                blog_id=blog.id,
+                title=f"Article {i}",
+                slug=f"article-{i}",
+                status="publish" if i % 2 else "draft",
+                main_image_url="https://blog.example.com/main.jpg",
+                buyers_guide_image_url="https://blog.example.com/guide.jpg",
+                categories=[Category(wp_id=1)],
+                seo_keywords=[ArticleSEOKeyword(keyword=f"keyword-{i}")],
+                faqs=[ArticleFAQ(question="Question?", answer="Answer")],
+            )]
+            session.add(product)
+            session.add(StockCheckLog(
+                blog_id=blog.id,
+                check_time=datetime(2024, 1, 1) + timedelta(days=i),
+                duration=1.0,
+                in_stock_count=1,
+                out_of_stock_count=0,
+            ))
+
+    session.commit()
+    with engine.connect() as connection:
+        connection.exec_driver_sql("ANALYZE")
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def capture_statements(session, fn):
+    """
+    Runs `fn` and returns every SELECT statement it issued together with its parameters.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = session.get_bind()
+    session.expunge_all()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        fn(session, 2)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements
+
+
+def full_table_scans(session, statement, parameters):
+    """
+    Returns the hot tables that SQLite reads with a full scan when executing `statement`.
+    Scans of anonymous derived tables (e.g. a one-row aggregate subquery) are not reported.
+    """
+    with session.get_bind().connect() as connection:
+        plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+
+    scans = []
+    for row in plan:
+        detail = row[-1]
+        match = re.match(r"SCAN (\w+)", detail)
+        if (
+            match and "USING" not in detail
+            and not match.group(1).startswith("anon_") and match.group(1) not in UNINDEXED_TABLES
+        ):
+            scans.append(detail)
+    return scans
+
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+@pytest.mark.parametrize("name, fn", HOT_QUERIES, ids=[name for name, _ in HOT_QUERIES])
+def test_hot_queries_use_an_index(db, name, fn):
+    statements = capture_statements(db, fn)
+    assert statements, f"{name} did not issue any query"
+
+    for statement, parameters in statements:
+        scans = full_table_scans(db, statement, parameters)
+        assert not scans, f"{name} runs a full table scan ({', '.join(scans)}) for:\n{statement}"
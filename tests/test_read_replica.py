@@ -0,0 +1,66 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from main import app
+from app import database
+from app.database import Base, get_db
+from app.dependencies.auth import get_current_user
+from app.models.product import Product
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+def seed_engine(seed_blog, product_names):
+    """
+    Creates a separate in-memory database with one blog holding the given products.
+    """
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    blog = seed_blog(session)
+    session.add_all([Product(blog_id=blog.id, name=name, seo_keyword=name, rating=4.0, in_stock=True) for name in product_names])
+    session.commit()
+    session.close()
+    return engine
+
+
+@pytest.fixture
+def client(monkeypatch, seed_blog):
+    """
+    Points `get_db` at a primary database and the read replica session factory at a second
+    database with different contents, so responses show which one served them.
+    """
+    primary = sessionmaker(bind=seed_engine(seed_blog, ["Primary product"]))
+    replica = sessionmaker(bind=seed_engine(seed_blog, ["Replica product", "Replica product 2"]))
+
+    def override_get_db():
+        db = primary()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(database, "ReadSessionLocal", replica)
+    monkeypatch.setattr(database, "AsyncReadSessionLocal", None)
+    monkeypatch.setitem(app.dependency_overrides, get_db, override_get_db)
+    monkeypatch.setitem(app.dependency_overrides, get_current_user, lambda: None)
+    yield TestClient(app)
+
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_read_endpoints_use_the_replica(client):
+    products = client.get("/api/v1/1/products/").json()
+    assert [p["name"] for p in products["products"]] == ["Replica product", "Replica product 2"]
+
+    stats = client.get("/api/v1/1/dashboard/stats").json()
+    assert stats["total_products_count"] == 2
+
+
+def test_write_endpoints_stay_on_the_primary(client):
+    response = client.delete("/api/v1/1/products/1")
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Primary product"
@@ -0,0 +1,208 @@
+import asyncio
+
+import httpx
+import pytest
+from bs4 import BeautifulSoup
+
+from app.scrapers import base_scraper, http_client
+from app.scrapers.emag_scraper import EmagScraper
+from app.scrapers.provider_health import ProviderSelector
+from app.scrapers.scraper_factory import async_scraper_factory
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+PAGE = b"""
+<html><body>
+<h1 class="page-title">Laptop X</h1>
+<div class="stock-and-genius"><span class="label label-in_stock">in stoc</span></div>
+</body></html>
+"""
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    """
+    Serves provider requests from a handler set by the test instead of the network,
+    without the page cache.
+    """
+    monkeypatch.setattr(base_scraper, "get_page_cache", lambda: None)
+    monkeypatch.setattr(base_scraper, "provider_selector", ProviderSelector())
+    monkeypatch.setattr(
+        base_scraper.SettingsService, "get_settings",
+        staticmethod(lambda prefix, keys=(): {"crawlbase_api_key": "crawl", "scrapingfish_api_key": "fish"})
+    )
+    state = {"handler": None, "requests": []}
+
+    async def handle(request):
+        state["requests"].append(request.url.host)
+        return await state["handler"](request)
+
+    monkeypatch.setattr(
+        base_scraper, "get_async_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handle))
+    )
+    return state
+
+
+@pytest.fixture(params=base_scraper.SUPPORTED_HTML_PARSERS)
+def html_parser(request, monkeypatch):
+    """
+    Runs the test once with every supported SCRAPER_HTML_PARSER.
+    """
+    monkeypatch.setattr(base_scraper, "SCRAPER_HTML_PARSER", request.param)
+    return request.param
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_async_factory_builds_scraper_from_fetched_page(transport):
+    async def handler(request):
+        return httpx.Response(200, content=PAGE)
+    transport["handler"] = handler
+
+    scraper = asyncio.run(async_scraper_factory("https://www.emag.ro/laptop-x"))
+
+    assert isinstance(scraper, EmagScraper)
+    assert scraper.get_full_name() == "Laptop X"
+    assert scraper.get_in_stock() is True
+    assert transport["requests"] == ["api.crawlbase.com"]
+
+
+def test_async_fetch_falls_back_to_scrapingfish(transport):
+    async def handler(request):
+        if request.url.host == "api.crawlbase.com":
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(200, content=PAGE)
+    transport["handler"] = handler
+
+    scraper = asyncio.run(EmagScraper.create("https://www.emag.ro/laptop-x"))
+
+    assert scraper.get_full_name() == "Laptop X"
+    assert transport["requests"] == ["api.crawlbase.com", "scraping.narf.ai"]
+
+
+def test_async_fetch_raises_when_both_providers_fail(transport):
+    async def handler(request):
+        return httpx.Response(503)
+    transport["handler"] = handler
+
+    with pytest.raises(RuntimeError, match="Status Code: 503"):
+        asyncio.run(EmagScraper.create("https://www.emag.ro/laptop-x"))
+
+
+def test_provider_concurrency_is_limited(transport, monkeypatch):
+    monkeypatch.setitem(http_client.PROVIDER_CONCURRENCY, "crawlbase", 2)
+    running = {"now": 0, "max": 0}
+
+    async def handler(request):
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+        await asyncio.sleep(0.02)
+        running["now"] -= 1
+        return httpx.Response(200, content=PAGE)
+    transport["handler"] = handler
+
+    async def scrape_many():
+        return await asyncio.gather(*[EmagScraper.create(f"https://www.emag.ro/p/{i}") for i in range(6)])
+
+    assert len(asyncio.run(scrape_many())) == 6
+    assert running["max"] == 2
+
+
+def test_each_event_loop_gets_its_own_client():
+    async def client():
+        current = http_client.get_async_client()
+        assert http_client.get_async_client() is current
+        await http_client.close_async_client()
+        return current
+
+    assert asyncio.run(client()) is not asyncio.run(client())
+
+
+PRODUCT_PAGE = b"""
+<html><head><script>var tracking = 1;</script><style>.x{}</style></head><body>
+<nav class="megamenu"><ul><li><a href="/a">Laptopuri</a></li></ul></nav>
+<h1 class="page-title"> Laptop X 15" </h1>
+<div class="stock-and-genius"><span class="label label-limited_stock_qty">ultimele bucati</span></div>
+<div class="product-gallery-inner">
+  <div class="thumbnail-wrapper"><a href="https://img.example.com/1.jpg">1</a></div>
+  <div class="thumbnail-wrapper"><a href="https://img.example.com/2.jpg">2</a></div>
+</div>
+<div class="product-page-description-text"><p>Fast.</p><ul><li>Light</li><li>Quiet</li></ul></div>
+<table class="table table-striped specifications-table">
+  <tr><td>Culoare</td><td>Negru</td></tr>
+  <tr><td>Porturi</td><td>USB\nHDMI</td></tr>
+</table>
+<footer class="footer"><div class="page-title-like">noise</div></footer>
+</body></html>
+"""
+
+
+def test_targeted_parse_keeps_only_declared_subtrees(html_parser):
+    soup = EmagScraper.parse_page(PRODUCT_PAGE)
+
+    assert soup.find("nav") is None
+    assert soup.find("script") is None
+    assert soup.find("footer") is None
+    assert soup.find("h1", class_="page-title") is not None
+
+
+def test_targeted_parse_extracts_the_same_data_as_a_full_parse(html_parser):
+    full = EmagScraper("https://www.emag.ro/laptop-x", page_content=BeautifulSoup(PRODUCT_PAGE, html_parser))
+    targeted = EmagScraper("https://www.emag.ro/laptop-x", page_content=EmagScraper.parse_page(PRODUCT_PAGE))
+
+    assert targeted.scrape_product_data() == full.scrape_product_data() == {
+        "in_stock": True,
+        "description": "Fast. Light Quiet",
+        "specifications": {"Culoare": "Negru", "Porturi": "USB, HDMI"},
+        "image_urls": ["https://img.example.com/1.jpg", "https://img.example.com/2.jpg"],
+        "full_name": 'Laptop X 15"',
+    }
+
+
+def test_sections_are_collected_once(html_parser, monkeypatch):
+    scraper = EmagScraper("https://www.emag.ro/laptop-x", page_content=EmagScraper.parse_page(PRODUCT_PAGE))
+    traversals = []
+    find_all = scraper.page_content.find_all
+
+    def counting_find_all(*args, **kwargs):
+        traversals.append(1)
+        return find_all(*args, **kwargs)
+
+    monkeypatch.setattr(scraper.page_content, "find_all", counting_find_all)
+    scraper.scrape_product_data()
+
+    assert traversals == [1]
+
+
+def test_stock_only_parse_keeps_only_the_stock_block(html_parser):
+    soup = EmagScraper.parse_page(PRODUCT_PAGE, fields={"in_stock"})
+
+    assert soup.find("div", class_="stock-and-genius") is not None
+    assert soup.find("h1") is None
+    assert soup.find("table") is None
+
+
+def test_scrape_product_data_returns_the_requested_fields():
+    page = EmagScraper.parse_page(PRODUCT_PAGE, fields={"in_stock"})
+    scraper = EmagScraper("https://www.emag.ro/laptop-x", page_content=page, fields={"in_stock"})
+
+    assert scraper.scrape_product_data() == {"in_stock": True}
+    assert scraper.scrape_product_data(fields={"in_stock"}) == {"in_stock": True}
+    with pytest.raises(ValueError, match="were not parsed"):
+        scraper.scrape_product_data(fields={"in_stock", "full_name"})
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(ValueError, match="Unknown product fields"):
+        EmagScraper.parse_page(PRODUCT_PAGE, fields={"price"})
+
+
+def test_async_factory_passes_fields_to_the_parser(transport):
+    async def handler(request):
+        return httpx.Response(200, content=PRODUCT_PAGE)
+    transport["handler"] = handler
+
+    scraper = asyncio.run(async_scraper_factory("https://www.emag.ro/laptop-x", fields={"in_stock"}))
+
+    assert scraper.page_content.find("h1") is None
+    assert scraper.scrape_product_data() == {"in_stock": True}
@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import or_
+from sqlalchemy.dialects import postgresql
+
+from app.models.article import Article
+from app.models.product import Product
+from app.models.prompt import Prompt
+from app.crud.crud_article import get_articles
+from app.crud.crud_product import get_products
+from app.crud.crud_prompt import get_prompts
+from app.crud.search import search_conditions
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+@pytest.fixture(scope="module")
+def db(module_tables, session_factory, seed_blog):
+    """
+    Seeds one blog with a few products, articles and prompts to search through.
+    """
+    session = session_factory()
+    blog = seed_blog(session)
+
+    session.add_all([
+        Product(blog_id=blog.id, name="Gaming Mouse", seo_keyword="best mouse", rating=4.0),
+        Product(blog_id=blog.id, name="Keyboard", seo_keyword="mechanical keyboard", rating=4.0),
+        Product(blog_id=blog.id, name="Monitor", seo_keyword="gaming monitor", rating=4.0),
+        Prompt(blog_id=blog.id, name="Review", type="Product", subtype="Review", text="Write a detailed review of {name}."),
+        Prompt(blog_id=blog.id, name="Intro", type="Article", subtype="Introduction", text="Introduce the article {title}."),
+        Article(blog_id=blog.id, title="Best mice", slug="best-mice", status="draft"),
+        Article(blog_id=blog.id, title="Drafting tables", slug="drafting-tables", status="publish"),
+    ])
+    session.commit()
+    try:
+        yield session, blog.id
+    finally:
+        session.close()
+
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_product_search_matches_any_searchable_column(db):
+    session, blog_id = db
+
+    result = get_products(session, blog_id=blog_id, filter="GAMING")
+
+    assert result["total_records"] == 2
+    assert {p.name for p in result["products"]} == {"Gaming Mouse", "Monitor"}
+
+
+def test_prompt_search_falls_back_to_text_matching(db):
+    session, blog_id = db
+
+    result = get_prompts(session, blog_id=blog_id, filter="detailed review")
+
+    assert [p.name for p in result["prompts"]] == ["Review"]
+
+
+def test_prompt_text_matches_partial_words(db):
+    session, blog_id = db
+
+    result = get_prompts(session, blog_id=blog_id, filter="etailed rev")
+
+    assert [p.name for p in result["prompts"]] == ["Review"]
+
+
+def test_article_status_matches_a_case_insensitive_substring(db):
+    session, blog_id = db
+
+    assert {a.title for a in get_articles(session, blog_id=blog_id, filter="DRAFT")["articles"]} == {"Best mice", "Drafting tables"}
+    assert {a.title for a in get_articles(session, blog_id=blog_id, filter="publ")["articles"]} == {"Drafting tables"}
+
+
+def test_postgresql_prompt_search_adds_full_text_to_substring_matching():
+    conditions, rank_terms = search_conditions(Prompt, "detailed review", "postgresql")
+    sql = str(or_(*conditions).compile(dialect=postgresql.dialect()))
+
+    assert "prompts.text ILIKE" in sql
+    assert "prompts.search_vector @@ websearch_to_tsquery" in sql
+    assert len(rank_terms) == len(conditions)
+    assert "ts_rank" in str(rank_terms[-1].compile(dialect=postgresql.dialect()))
+
+
+def test_other_databases_only_match_substrings():
+    conditions, rank_terms = search_conditions(Prompt, "review", "sqlite")
+
+    assert "tsquery" not in str(or_(*conditions).compile())
+    assert rank_terms == []
@@ -0,0 +1,182 @@
+import time
+import pytest
+
+from app.core.sql_instrumentation import track_queries
+from app.crud.crud_settings import create_setting, get_settings_version, update_setting
+from app.models.settings import Setting
+from app.schemas.settings import SettingCreate, SettingUpdate
+from app.services import settings_service
+from app.services.settings_listener import SettingsListener
+from app.services.settings_service import SettingsService
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+@pytest.fixture
+def db(monkeypatch, tables, session_factory):
+    """
+    Points SettingsService at a database with a few typed settings and an empty cache.
+    """
+    session = session_factory()
+    session.add_all([
+        Setting(key="images.product.width", value="1080", type="integer"),
+        Setting(key="ai.parameters.temperature", value="0.1", type="float"),
+        Setting(key="images.product.alt_text", value="{full_name}", type="string"),
+    ])
+    session.commit()
+
+    monkeypatch.setattr(settings_service, "SessionLocal", session_factory)
+    monkeypatch.setattr(settings_service, "SETTINGS_CACHE_TTL", 60.0)
+    SettingsService.invalidate_cache()
+    yield session
+    session.close()
+    SettingsService.invalidate_cache()
+
+
+def change_in_other_worker(key, value):
+    """
+    Changes a setting the way another worker would: through the crud, without touching this cache.
+    """
+    session = settings_service.SessionLocal()
+    update_setting(session, key, SettingUpdate(value=value))
+    session.close()
+
+# ------------------------------ TEST FUNCTIONS ------------------------------ #
+
+def test_values_are_typed_and_cached(db):
+    with track_queries() as first:
+        assert SettingsService.get_setting_value("images.product.width") == 1080
+    with track_queries() as cached:
+        assert SettingsService.get_setting_value("ai.parameters.temperature") == 0.1
+        assert SettingsService.get_setting_value("images.product.alt_text") == "{full_name}"
+        assert SettingsService.get_setting_value("images.product.width") == 1080
+
+    assert first.statement_count == 2
+    assert cached.statement_count == 0
+
+
+def test_changes_bump_the_settings_version(db):
+    version = get_settings_version(db)
+
+    update_setting(db, "images.product.width", SettingUpdate(value="720"))
+    create_setting(db, SettingCreate(key="images.store.width", value="16", type="integer"))
+
+    assert get_settings_version(db) == version + 2
+
+
+def test_other_workers_changes_are_picked_up_after_the_ttl(db, monkeypatch):
+    assert SettingsService.get_setting_value("images.product.width") == 1080
+
+    change_in_other_worker("images.product.width", "720")
+    assert SettingsService.get_setting_value("images.product.width") == 1080
+
+    monkeypatch.setattr(settings_service, "SETTINGS_CACHE_TTL", 0.000001)
+    assert SettingsService.get_setting_value("images.product.width") == 720
+
+
+def test_unchanged_version_does_not_reload_settings(db, monkeypatch):
+    SettingsService.get_setting_value("images.product.width")
+    monkeypatch.setattr(settings_service, "SETTINGS_CACHE_TTL", 0.000001)
+
+    with track_queries() as stats:
+        SettingsService.get_setting_value("images.product.width")
+
+    assert stats.statement_count == 1
+
+
+def test_invalidate_cache_reloads_immediately(db):
+    assert SettingsService.get_setting_value("images.product.width") == 1080
+
+    change_in_other_worker("images.product.width", "720")
+    SettingsService.invalidate_cache()
+
+    assert SettingsService.get_setting_value("images.product.width") == 720
+
+
+def test_missing_key_forces_a_reload(db):
+    SettingsService.get_setting_value("images.product.width")
+
+    create_setting(db, SettingCreate(key="images.store.width", value="16", type="integer"))
+    assert SettingsService.get_setting_value("images.store.width") == 16
+
+    with pytest.raises(ValueError):
+        SettingsService.get_setting_value("unknown.key")
+
+
+@pytest.mark.parametrize("ttl", [60.0, 0.0])
+def test_get_settings_returns_typed_values_under_a_prefix(db, monkeypatch, ttl):
+    monkeypatch.setattr(settings_service, "SETTINGS_CACHE_TTL", ttl)
+    db.add_all([
+        Setting(key="images.product.height", value="720", type="integer"),
+        Setting(key="images.products_extra.width", value="1", type="integer"),
+        Setting(key="imagesXproduct.width", value="2", type="integer"),
+    ])
+    db.commit()
+    SettingsService.invalidate_cache()
+
+    with track_queries() as stats:
+        settings = SettingsService.get_settings("images.product")
+
+    assert settings == {"width": 1080, "height": 720, "alt_text": "{full_name}"}
+    assert stats.statement_count <= 2
+
+
+@pytest.mark.parametrize("ttl", [60.0, 0.0])
+def test_get_settings_rejects_missing_required_keys(db, monkeypatch, ttl):
+    monkeypatch.setattr(settings_service, "SETTINGS_CACHE_TTL", ttl)
+
+    assert SettingsService.get_settings("images.product", ["width", "alt_text"])["width"] == 1080
+    with pytest.raises(ValueError, match="Setting with key 'images.product.file_name' not found"):
+        SettingsService.get_settings("images.product", ["width", "file_name"])
+
+
+def test_initialize_default_settings_inserts_missing_settings_in_one_statement(db):
+    update_setting(db, "images.product.width", SettingUpdate(value="720"))
+
+    with track_queries() as stats:
+        SettingsService.initialize_default_settings()
+
+    inserts = [shape for shape in stats.fingerprints if shape.startswith("INSERT INTO settings ")]
+    assert len(inserts) == 1
+    assert stats.fingerprints[inserts[0]] == 1
+    assert SettingsService.get_setting_value("images.product.width") == 720
+    assert SettingsService.get_setting_value("images.article_main.width") == 1400
+
+    version = get_settings_version(db)
+    SettingsService.initialize_default_settings()
+    assert get_settings_version(db) == version
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_listener_polls_the_version_and_invalidates_the_cache(db, engine, session_factory):
+    listener = SettingsListener(engine, session_factory, poll_interval=0.02)
+    listener.start()
+    try:
+        assert wait_for(lambda: SettingsService.watched)
+        assert SettingsService.get_setting_value("images.product.width") == 1080
+
+        change_in_other_worker("images.product.width", "720")
+
+        assert wait_for(lambda: SettingsService.get_setting_value("images.product.width") == 720)
+    finally:
+        listener.stop()
+
+    assert not SettingsService.watched
+
+
+def test_watched_cache_skips_ttl_version_checks(db, monkeypatch):
+    SettingsService.get_setting_value("images.product.width")
+    monkeypatch.setattr(settings_service, "SETTINGS_CACHE_TTL", 0.000001)
+    monkeypatch.setattr(SettingsService, "watched", True)
+
+    with track_queries() as stats:
+        SettingsService.get_setting_value("images.product.width")
+
+    assert stats.statement_count == 0
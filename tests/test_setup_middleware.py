@@ -0,0 +1,93 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import setup_middleware
+from app.core.setup_middleware import SetupMiddleware, invalidate_setup_cache
+from app.models.setup_status import SetupStatus
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+test_app = FastAPI()
+test_app.add_middleware(SetupMiddleware)
+
+
+@test_app.get("/ping")
+def ping():
+    return {"detail": "pong"}
+
+
+@test_app.get("/api/v1/setup/status")
+def setup_status():
+    return {"detail": "setup"}
+
+
+@pytest.fixture
+def status_reads(monkeypatch, tables, session_factory):
+    """
+    Starts from an incomplete setup with an empty cache and counts the sessions the
+    middleware opens to read the setup status.
+    """
+    db = session_factory()
+    db.add(SetupStatus(setup_completed=False, current_step=1))
+    db.commit()
+    db.close()
+
+    reads = []
+
+    def counting_session():
+        reads.append(1)
+        return session_factory()
+
+    monkeypatch.setattr(setup_middleware, "SessionLocal", counting_session)
+    monkeypatch.setattr(setup_middleware, "_setup_completed", False)
+    return reads
+
+
+def complete_setup_in_db(session_factory):
+    db = session_factory()
+    db.query(SetupStatus).update({"setup_completed": True})
+    db.commit()
+    db.close()
+
+# ------------------------------ TEST FUNCTIONS ------------------------------ #
+
+def test_blocks_requests_until_setup_is_completed(status_reads):
+    client = TestClient(test_app)
+
+    response = client.get("/ping")
+    assert response.status_code == 403
+    assert response.json() == {"detail": "Setup not completed. Please finish /setup first."}
+
+    assert client.get("/api/v1/setup/status").status_code == 200
+    assert len(status_reads) == 1
+
+
+def test_incomplete_state_is_not_cached(status_reads, session_factory):
+    client = TestClient(test_app)
+
+    assert client.get("/ping").status_code == 403
+    complete_setup_in_db(session_factory)
+    assert client.get("/ping").status_code == 200
+    assert len(status_reads) == 2
+
+
+def test_completed_state_is_cached(status_reads, session_factory):
+    client = TestClient(test_app)
+    complete_setup_in_db(session_factory)
+
+    for _ in range(5):
+        assert client.get("/ping").status_code == 200
+
+    assert len(status_reads) == 1
+
+
+def test_invalidate_setup_cache_reads_the_status_again(status_reads, session_factory):
+    client = TestClient(test_app)
+    complete_setup_in_db(session_factory)
+
+    assert client.get("/ping").status_code == 200
+    invalidate_setup_cache()
+    assert client.get("/ping").status_code == 200
+
+    assert len(status_reads) == 2
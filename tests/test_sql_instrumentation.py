@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.sql_instrumentation import (
+    SQLInstrumentationMiddleware,
+    fingerprint,
+    track_queries,
+)
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+@pytest.fixture
+def select_one_by_one(engine):
+    """
+    Returns a function issuing one statement per row, like a lazy-loaded relationship in a loop.
+    """
+    def select(size):
+        with engine.connect() as connection:
+            for i in range(size):
+                connection.execute(text("SELECT :value"), {"value": i})
+
+    return select
+
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_fingerprint_ignores_literals_and_in_list_length():
+    assert fingerprint("SELECT * FROM products WHERE id IN (?, ?, ?) AND name = 'x'") == \
+        fingerprint("SELECT *  FROM products\nWHERE id IN (?) AND name = 'y'")
+    assert fingerprint("SELECT * FROM products WHERE id = 5") == fingerprint("SELECT * FROM products WHERE id = :id_1")
+
+
+def test_track_queries_counts_statements_and_repeats(select_one_by_one):
+    with track_queries() as outer:
+        select_one_by_one(3)
+        with track_queries() as inner:
+            select_one_by_one(2)
+
+    assert outer.statement_count == 5
+    assert inner.statement_count == 2
+    assert outer.repeated_statements() == [("SELECT ?", 5)]
+    assert outer.db_time > 0
+
+
+def test_constant_query_count_fixture_detects_n_plus_one(engine, select_one_by_one, assert_constant_query_count):
+    with pytest.raises(pytest.fail.Exception, match="Query count grows with result size"):
+        assert_constant_query_count(engine, select_one_by_one)
+
+    assert assert_constant_query_count(engine, lambda size: select_one_by_one(1)) == 1
+
+
+def test_middleware_reports_query_count_headers(select_one_by_one):
+    app = FastAPI()
+    app.add_middleware(SQLInstrumentationMiddleware)
+
+    @app.get("/items")
+    def read_items():
+        select_one_by_one(4)
+        return []
+
+    response = TestClient(app).get("/items")
+
+    assert response.headers["X-DB-Query-Count"] == "4"
+    assert float(response.headers["X-DB-Time-Ms"]) >= 0
+
+
+def test_middleware_forwards_each_response_message_as_sent(select_one_by_one):
+    received = []
+
+    async def streaming_app(scope, receive, send):
+        select_one_by_one(1)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for chunk in (b"0", b"1"):
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            assert received[-1]["body"] == chunk
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        received.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/export", "headers": []}
+    asyncio.run(SQLInstrumentationMiddleware(streaming_app)(scope, None, send))
+
+    assert dict(received[0]["headers"])[b"x-db-query-count"] == b"1"
+    assert [message["type"] for message in received] == ["http.response.start"] + ["http.response.body"] * 3
@@ -0,0 +1,160 @@
+import asyncio
+from collections import Counter
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models.product import Product, ProductAffiliateURL
+from app.models.stock_check_log import StockCheckLog
+from scripts import update_stock
+from scripts.update_stock import StockCheckLimits, check_product_stock, update_blog_stocks, update_product_stocks
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+DOMAINS = ["www.emag.ro", "www.altex.ro"]
+
+
+class FakeScraper:
+    """
+    Stands in for a store scraper. Products whose URL ends in "out" are out of stock,
+    "broken" URLs fail; tracks the checks running at the same time, in total and per domain.
+    """
+    delay = 0.01
+    running = Counter()
+    max_running = Counter()
+
+    def __init__(self, product_url, fields=None):
+        self.product_url = product_url
+        self.fields = fields
+
+    @classmethod
+    async def create(cls, product_url, fields=None, cache_ttl=None):
+        domain = product_url.split("/")[2]
+        for key in ("all", domain):
+            cls.running[key] += 1
+            cls.max_running[key] = max(cls.max_running[key], cls.running[key])
+        try:
+            await asyncio.sleep(cls.delay)
+        finally:
+            for key in ("all", domain):
+                cls.running[key] -= 1
+        if product_url.endswith("broken"):
+            raise RuntimeError("Failed to fetch page content")
+        return cls(product_url, fields)
+
+    def scrape_product_data(self, fields=None):
+        assert self.fields == fields == {"in_stock"}
+        return {"in_stock": not self.product_url.endswith("out")}
+
+
+@pytest.fixture
+def db(monkeypatch, tables, session_factory, seed_blog):
+    """
+    Creates two blogs: the first with 12 products spread over two domains (3 out of stock,
+    1 broken URL that was in stock, 1 without URL that was out of stock), the second with one product.
+    """
+    monkeypatch.setattr(update_stock, "async_scraper_factory", FakeScraper.create)
+    monkeypatch.setattr(update_stock.SettingsService, "get_setting_value", staticmethod(lambda key: 14))
+    FakeScraper.running = Counter()
+    FakeScraper.max_running = Counter()
+    FakeScraper.delay = 0.01
+
+    session = session_factory()
+    first = seed_blog(session, name="First", base_url="https://first.example.com")
+    second = seed_blog(session, name="Second", base_url="https://second.example.com")
+
+    suffixes = ["in"] * 7 + ["out"] * 3 + ["broken"]
+    for i, suffix in enumerate(suffixes):
+        url = f"https://{DOMAINS[i % 2]}/p/{i}/{suffix}"
+        session.add(Product(
+            blog_id=first.id, name=f"Product {i}", seo_keyword=f"p{i}", rating=4.0, in_stock=True,
+            affiliate_urls=[ProductAffiliateURL(url=url)]
+        ))
+    session.add(Product(blog_id=first.id, name="No URL", seo_keyword="none", rating=4.0, in_stock=False))
+    session.add(Product(
+        blog_id=second.id, name="Other", seo_keyword="other", rating=4.0, in_stock=False,
+        affiliate_urls=[ProductAffiliateURL(url="https://www.emag.ro/other/in")]
+    ))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+# ------------------------------ TEST FUNCTIONS ------------------------------- #
+
+def test_update_product_stocks_logs_each_blog(db):
+    update_product_stocks(db, manual_run=True, limits=StockCheckLimits(workers=4, domain_concurrency=2))
+
+    logs = {log.blog_id: log for log in db.query(StockCheckLog)}
+    assert (logs[1].in_stock_count, logs[1].out_of_stock_count) == (8, 4)
+    assert (logs[2].in_stock_count, logs[2].out_of_stock_count) == (1, 0)
+
+    products = {product.name: product for product in db.query(Product)}
+    assert products["Product 7"].in_stock is False
+    assert products["Product 7"].last_checked is not None
+    assert products["Product 10"].in_stock is True
+    assert products["Product 10"].last_checked is None
+    assert products["Other"].in_stock is True
+
+
+def test_update_product_stocks_respects_concurrency_limits(db):
+    update_product_stocks(db, manual_run=True, limits=StockCheckLimits(workers=3, domain_concurrency=2))
+
+    assert 1 < FakeScraper.max_running["all"] <= 3
+    assert all(FakeScraper.max_running[domain] <= 2 for domain in DOMAINS)
+
+
+def test_checks_waiting_for_a_busy_domain_leave_workers_to_other_domains(db, monkeypatch):
+    started = []
+
+    async def create(product_url, fields=None, cache_ttl=None):
+        started.append(product_url.split("/")[2])
+        return await FakeScraper.create(product_url, fields, cache_ttl)
+    monkeypatch.setattr(update_stock, "async_scraper_factory", create)
+    limits = StockCheckLimits(workers=2, domain_concurrency=1)
+    urls = [f"https://www.emag.ro/p/{i}/in" for i in range(3)] + ["https://www.altex.ro/p/3/in"]
+
+    async def check_all():
+        return await asyncio.gather(*[check_product_stock(i, url, limits) for i, url in enumerate(urls)])
+
+    assert asyncio.run(check_all()) == [True] * 4
+    assert started[:2] == ["www.emag.ro", "www.altex.ro"]
+
+
+def test_failed_save_cancels_the_remaining_checks(db, monkeypatch):
+    def failing_save(db, results):
+        raise SQLAlchemyError("database is gone")
+    monkeypatch.setattr(update_stock, "save_stock_results", failing_save)
+    monkeypatch.setattr(update_stock, "STOCK_CHECK_COMMIT_BATCH", 1)
+    blog = db.get(update_stock.Blog, 1)
+
+    async def run():
+        with pytest.raises(SQLAlchemyError):
+            await update_blog_stocks(db, blog, None, StockCheckLimits(workers=1))
+        return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert asyncio.run(run()) == []
+    assert FakeScraper.running["all"] == 0
+
+
+def test_update_product_stocks_skips_products_after_the_deadline(db):
+    FakeScraper.delay = 0.2
+
+    update_product_stocks(db, manual_run=True, limits=StockCheckLimits(workers=2, deadline=0.05))
+
+    assert db.query(Product).filter(Product.last_checked != None).count() == 0
+    logs = {log.blog_id: log for log in db.query(StockCheckLog)}
+    assert (logs[1].in_stock_count, logs[1].out_of_stock_count) == (11, 1)
+    assert (logs[2].in_stock_count, logs[2].out_of_stock_count) == (0, 1)
+
+
+def test_scheduled_run_only_checks_due_products(db):
+    update_product_stocks(db, limits=StockCheckLimits())
+    checked = db.query(Product).filter(Product.last_checked != None).count()
+
+    update_product_stocks(db, limits=StockCheckLimits())
+
+    assert checked == 11
+    assert FakeScraper.max_running["all"] > 0
+    assert db.query(StockCheckLog).count() == 4
@@ -0,0 +1,99 @@
+import time
+import pytest
+from fastapi import HTTPException
+
+from app.core.cache import TTLCache
+from app.core.jwt import create_access_token
+from app.core.sql_instrumentation import track_queries
+from app.crud import crud_user
+from app.dependencies.auth import get_current_user
+from app.models.user import User
+from app.schemas.user import UserBase
+
+# ------------------------------ SETUP & CONFIG ------------------------------ #
+
+@pytest.fixture
+def db(monkeypatch, tables, session_factory):
+    """
+    Seeds one user and gives every test an empty user cache.
+    """
+    monkeypatch.setattr(crud_user, "user_cache", TTLCache(maxsize=16, ttl=60))
+    session = session_factory()
+    session.add(User(email="admin@example.com", hashed_password="hash", name="Admin"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def token_for(email):
+    return create_access_token({"sub": email})
+
+# ------------------------------ TEST FUNCTIONS ------------------------------ #
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(maxsize=4, ttl=0.05)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_ttl_cache_disabled_with_zero_ttl():
+    cache = TTLCache(maxsize=2, ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_get_current_user_is_cached(db):
+    token = token_for("admin@example.com")
+
+    with track_queries() as first:
+        user = get_current_user(db=db, token=token)
+    with track_queries() as second:
+        cached = get_current_user(db=db, token=token)
+
+    assert first.statement_count == 1
+    assert second.statement_count == 0
+    assert cached.email == user.email == "admin@example.com"
+    assert cached.name == "Admin"
+
+
+def test_unknown_users_are_not_cached(db):
+    with pytest.raises(HTTPException):
+        get_current_user(db=db, token=token_for("ghost@example.com"))
+
+    db.add(User(email="ghost@example.com", hashed_password="hash"))
+    db.commit()
+
+    assert get_current_user(db=db, token=token_for("ghost@example.com")).email == "ghost@example.com"
+
+
+def test_updating_a_user_invalidates_the_cache(db):
+    user = get_current_user(db=db, token=token_for("admin@example.com"))
+
+    crud_user.update_user(db, user.id, UserBase(email="root@example.com", name="Root"))
+
+    with pytest.raises(HTTPException):
+        get_current_user(db=db, token=token_for("admin@example.com"))
+    assert get_current_user(db=db, token=token_for("root@example.com")).name == "Root"
+
+
+def test_deleting_a_user_invalidates_the_cache(db):
+    user = get_current_user(db=db, token=token_for("admin@example.com"))
+
+    crud_user.delete_user(db, user.id)
+
+    with pytest.raises(HTTPException):
+        get_current_user(db=db, token=token_for("admin@example.com"))